@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""
+Benchmark the site generators on a deterministic synthetic corpus.
+
+For every size a corpus is written to a temporary folder: that many blog posts,
+archief articles (with images, links and attachments) and project entry points
+spread over a nested projects tree with asset folders. Each generator then runs
+in a fresh child process, once cold (empty metadata cache) and once warm (cache
+filled by the cold run), and reports wall time, CPU time and peak RSS.
+
+Results go to a JSON file per run; --compare prints the ratio against an
+earlier run, e.g. one made on another commit.
+
+--parse picks how the generators read HTML (see html_backends): the default
+streaming extractors, the BeautifulSoup tree path or a full, unrestricted
+parse. The tree path is how the archief ArticleVisitor was measured against
+the separate find()/select() queries it replaced; those modes are plain
+environment variables, so an older commit is benchmarked the same way:
+
+    python3 benchmark_generators.py --generators archief --parse tree --sizes 1000 10000
+    # on the older commit, with the same corpus seed:
+    SITE_HTML_NO_STREAM=1 python3 benchmark_generators.py --generators archief --sizes 1000 10000 \
+        --output old.json
+    # back on this one:
+    python3 benchmark_generators.py --generators archief --parse tree --sizes 1000 10000 --compare old.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+from metadata_cache import CACHE_FILE
+
+REPO_DIR = Path(__file__).resolve().parent
+RESULTS_DIR = REPO_DIR / "bench-results"
+DEFAULT_SIZES = (100, 1000, 10000, 100000)
+GENERATORS = ("blog", "projects", "archief", "sitemap")
+SEED = 20260118
+
+# Environment of the generator processes per --parse mode, see html_backends.
+PARSE_MODES = {
+    "stream": {},
+    "tree": {"SITE_HTML_NO_STREAM": "1"},
+    "full": {"SITE_HTML_FULL_PARSE": "1"},
+}
+
+WORDS = (
+    "de het een en van in op met voor aan robot vlieger soldeer arduino camera motor sensor "
+    "workshop kinderen hackerspace printer software linux ontwerp signaal antenne lora gateway "
+    "foto panorama project bouwen testen meten code server netwerk kabel batterij zonne energie"
+).split()
+
+
+def sentence(rng: random.Random, words: int) -> str:
+    text = " ".join(rng.choice(WORDS) for _ in range(words))
+    return text[0].upper() + text[1:] + "."
+
+
+def paragraph(rng: random.Random) -> str:
+    return " ".join(sentence(rng, rng.randint(6, 18)) for _ in range(rng.randint(2, 6)))
+
+
+def page(title: str, body: str, head: str = "") -> str:
+    return f"""<!DOCTYPE html>
+<html lang="nl">
+<head>
+<meta charset="UTF-8">
+<title>{title}</title>
+{head}<style>body {{ font-family: sans-serif; }} .card {{ padding: 1rem; }}</style>
+</head>
+<body>
+{body}
+</body>
+</html>
+"""
+
+
+def blog_post(rng: random.Random, i: int) -> tuple[str, str]:
+    date = f"{2000 + i % 26}-{1 + i % 12:02d}-{1 + i % 28:02d}"
+    title = sentence(rng, rng.randint(3, 8)).rstrip(".")
+    paragraphs = "\n".join(f"<p>{paragraph(rng)}</p>" for _ in range(rng.randint(4, 12)))
+    body = (
+        f"<header><h1>{title}</h1><p class=\"date\">{date}</p></header>\n"
+        f"<figure><img src=\"images/post-{i}.jpg\" alt=\"\"><figcaption><p>{sentence(rng, 8)}</p></figcaption></figure>\n"
+        f"<article>\n{paragraphs}\n</article>"
+    )
+    return f"{date}-post-{i}.html", page(title, body)
+
+
+def archief_article(rng: random.Random, i: int) -> tuple[str, str]:
+    date = f"{2009 + i % 12}-{1 + i % 12:02d}-{1 + i % 28:02d}"
+    title = sentence(rng, rng.randint(2, 6)).rstrip(".")
+    paragraphs = "\n".join(f"<p>{paragraph(rng)}</p>" for _ in range(rng.randint(2, 8)))
+    images = "\n".join(f"<img src=\"images/IMG_{i}_{n}.jpg\" alt=\"\" loading=\"lazy\">" for n in range(rng.randint(0, 6)))
+    links = "\n".join(f"<li><a href=\"https://example.org/{i}/{n}\">link {n}</a></li>" for n in range(rng.randint(0, 4)))
+    attachments = "\n".join(f"<li><a href=\"images/file_{i}_{n}.pdf\">file {n}</a></li>" for n in range(rng.randint(0, 3)))
+    body = (
+        f"<header><h1>{title}</h1><p class=\"date\">{date} - Theo's Mechanische Aap</p></header>\n"
+        f"<article>\n{paragraphs}\n<div class=\"images\">\n{images}\n</div>\n"
+        f"<div class=\"links\"><ul>\n{links}\n</ul></div>\n"
+        f"<div class=\"attachments\"><ul>\n{attachments}\n</ul></div>\n</article>"
+    )
+    return f"{date}-artikel-{i}.html", page(title, body)
+
+
+def project_page(rng: random.Random, i: int) -> str:
+    title = sentence(rng, rng.randint(2, 5)).rstrip(".")
+    head = f"<meta name=\"description\" content=\"{sentence(rng, 20)}\">\n" if i % 3 == 0 else ""
+    script = "<script>\n" + "\n".join(f"const v{n} = {n} * Math.random();" for n in range(rng.randint(10, 400))) + "\n</script>"
+    body = f"<h1>{title}</h1>\n<p>{paragraph(rng)}</p>\n<p>{paragraph(rng)}</p>\n{script}"
+    return page(title, body, head)
+
+
+def write_corpus(root: Path, size: int) -> None:
+    rng = random.Random(SEED + size)
+
+    blog_dir = root / "blog"
+    blog_dir.mkdir(parents=True)
+    for i in range(size):
+        name, markup = blog_post(rng, i)
+        (blog_dir / name).write_text(markup, encoding="utf-8")
+
+    archief_dir = root / "projects" / "theos-mechanische-aap-archief"
+    (archief_dir / "images").mkdir(parents=True)
+    (archief_dir / "index.html").write_text(page("Archief", "<h1>Archief</h1>"), encoding="utf-8")
+    for i in range(size):
+        name, markup = archief_article(rng, i)
+        (archief_dir / name).write_text(markup, encoding="utf-8")
+        (archief_dir / "images" / f"IMG_{i}_0.jpg").write_bytes(b"\xff\xd8\xff")
+
+    # Groups of nested folders; entry points sit one to three levels down and
+    # some carry an assets/ subtree the walker should never need to enter.
+    for i in range(size):
+        parts = [f"group{i % 10}"] + [f"sub{(i // 10) % 7}"] * (i % 3) + [f"project{i}"]
+        folder = root / "projects" / Path(*parts)
+        folder.mkdir(parents=True, exist_ok=True)
+        (folder / "index.html").write_text(project_page(rng, i), encoding="utf-8")
+        if i % 4 == 0:
+            assets = folder / "assets" / "images"
+            assets.mkdir(parents=True)
+            for n in range(5):
+                (assets / f"sprite{n}.png").write_bytes(b"\x89PNG")
+
+    (root / "cv").mkdir()
+    (root / "cv" / "index.html").write_text(page("CV", "<h1>CV</h1>"), encoding="utf-8")
+
+
+def run_generator(name: str, root: Path) -> dict:
+    """Runs inside the child process."""
+    sys.path.insert(0, str(REPO_DIR))
+    os.chdir(root)
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    with contextlib.redirect_stdout(io.StringIO()):
+        if name == "blog":
+            import generate_blog_index
+            generate_blog_index.generate_index()
+        elif name == "projects":
+            import generate_projects_index
+            generate_projects_index.generate_index()
+        elif name == "archief":
+            import generate_archief_index
+            generate_archief_index.generate_index()
+        else:
+            import generate_sitemap
+            generate_sitemap.generate_sitemap(base_path=root)
+    wall = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_start
+    # ru_maxrss is in KiB on Linux and in bytes on macOS.
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    peak_kib = peak // 1024 if sys.platform == "darwin" else peak
+    return {"wall_s": wall, "cpu_s": cpu, "peak_rss_kib": peak_kib}
+
+
+def measure(name: str, root: Path, size: int, mode: str, env: dict[str, str] | None = None) -> dict:
+    if mode == "cold":
+        (root / CACHE_FILE).unlink(missing_ok=True)
+    child = subprocess.run(
+        [sys.executable, __file__, "--run-one", name, "--root", str(root)],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, **(env or {})},
+    )
+    result = json.loads(child.stdout.strip().splitlines()[-1])
+    result.update({"generator": name, "documents": size, "mode": mode})
+    result["per_file_ms"] = result["wall_s"] * 1000 / size
+    return result
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=REPO_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def print_header() -> None:
+    print(f"{'generator':<10} {'docs':>7} {'mode':<5} {'wall s':>9} {'cpu s':>9} {'ms/file':>9} {'peak MiB':>9}")
+
+
+def print_rows(results: list[dict]) -> None:
+    for r in results:
+        print(
+            f"{r['generator']:<10} {r['documents']:>7} {r['mode']:<5} {r['wall_s']:>9.3f} {r['cpu_s']:>9.3f} "
+            f"{r['per_file_ms']:>9.3f} {r['peak_rss_kib'] / 1024:>9.1f}"
+        )
+
+
+def print_comparison(results: list[dict], baseline_path: Path) -> None:
+    baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+    old = {(r["generator"], r["documents"], r["mode"]): r for r in baseline["results"]}
+    print(f"\nCompared with {baseline_path} (commit {baseline.get('commit', '?')}); >1.00x is faster now")
+    for r in results:
+        before = old.get((r["generator"], r["documents"], r["mode"]))
+        if before:
+            print(
+                f"{r['generator']:<10} {r['documents']:>7} {r['mode']:<5} "
+                f"wall {before['wall_s'] / r['wall_s']:>6.2f}x  rss {before['peak_rss_kib'] / r['peak_rss_kib']:>6.2f}x"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the site generators on a synthetic corpus.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES), help="documents per generator")
+    parser.add_argument("--generators", nargs="+", choices=GENERATORS, default=list(GENERATORS))
+    parser.add_argument("--output", type=Path, help="results file (default: bench-results/<timestamp>-<commit>.json)")
+    parser.add_argument("--compare", type=Path, help="earlier results file to compare against")
+    parser.add_argument("--parse", choices=PARSE_MODES, default="stream", help="how the generators read HTML")
+    parser.add_argument("--backend", help="HTML parser backend for the tree and full modes (default: fastest available)")
+    parser.add_argument("--keep", action="store_true", help="keep the generated corpora")
+    parser.add_argument("--run-one", choices=GENERATORS, help=argparse.SUPPRESS)
+    parser.add_argument("--root", type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_one:
+        print(json.dumps(run_generator(args.run_one, args.root)))
+        return
+
+    env = dict(PARSE_MODES[args.parse])
+    if args.backend:
+        env["SITE_HTML_BACKEND"] = args.backend
+    results = []
+    for size in args.sizes:
+        root = Path(tempfile.mkdtemp(prefix=f"velt-bench-{size}-"))
+        try:
+            started = time.perf_counter()
+            write_corpus(root, size)
+            print(f"Corpus of {size} documents per collection written in {time.perf_counter() - started:.1f}s")
+            print_header()
+            for name in args.generators:
+                for mode in ("cold", "warm"):
+                    results.append(measure(name, root, size, mode, env))
+                    print_rows(results[-1:])
+        finally:
+            if args.keep:
+                print(f"  kept {root}")
+            else:
+                shutil.rmtree(root)
+
+    commit = git_commit()
+    output = args.output or RESULTS_DIR / f"{datetime.now():%Y%m%d-%H%M%S}-{commit}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps({
+        "commit": commit,
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+        "seed": SEED,
+        "parse": args.parse,
+        "backend": args.backend,
+        "results": results,
+    }, indent=2), encoding="utf-8")
+
+    print(f"\nSaved {output}")
+    if args.compare:
+        print_comparison(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Benchmark serve.py under parallel load.
+
+serve.py is started in a child process for every engine (its command-line
+flags, see ENGINES) and hit for a fixed time by two kinds of clients at once:
+page clients fetching the small HTML pages over and over on one connection
+each, and download clients fetching a multi-megabyte asset at a throttled
+rate, like a browser on a slow line. The page clients report requests per
+second and latency percentiles; the server's CPU time comes from /proc where
+available, also per MB downloaded.
+
+To compare sendfile() with copying through Python on large files, run only
+download clients at full speed:
+
+    python3 benchmark_serve.py --engines copy pooled --clients 0 --downloads 8 --rate 0
+
+Results go to a JSON file per run in bench-results/, like benchmark_generators.py.
+"""
+
+from __future__ import annotations
+
+import argparse
+import http.client
+import json
+import os
+import platform
+import socket
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+from benchmark_generators import RESULTS_DIR, git_commit
+
+REPO_DIR = Path(__file__).resolve().parent
+PORT = 8099
+
+ENGINES = {
+    "sequential": ["--sequential"],
+    "uncached": ["--cache-mb", "0"],
+    "copy": ["--no-sendfile"],
+    "pooled": [],
+}
+
+PAGES = (
+    "/index.html",
+    "/blog/index.html",
+    "/projects/index.html",
+    "/sitemap.html",
+    "/cv/index.html",
+)
+DOWNLOAD = "/projects/CyberQuest/assets/images/scenes/wsrt_photo.jpg"
+DOWNLOAD_CHUNK = 64 * 1024
+
+
+def start_server(engine: str, port: int) -> subprocess.Popen:
+    server = subprocess.Popen(
+        [sys.executable, "serve.py", "--no-search", "--port", str(port), *ENGINES[engine]],
+        cwd=REPO_DIR,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=1).close()
+            return server
+        except OSError:
+            time.sleep(0.05)
+    server.kill()
+    raise RuntimeError(f"serve.py did not start on port {port}")
+
+
+def cpu_seconds(pid: int) -> float | None:
+    """User plus system CPU time of a process, from /proc (Linux only)."""
+    try:
+        fields = Path(f"/proc/{pid}/stat").read_text().rsplit(")", 1)[1].split()
+    except OSError:
+        return None
+    return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+
+
+def page_client(port: int, stop: threading.Event, latencies: list[float], errors: list[str]) -> None:
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+    i = 0
+    while not stop.is_set():
+        started = time.perf_counter()
+        try:
+            conn.request("GET", PAGES[i % len(PAGES)])
+            response = conn.getresponse()
+            response.read()
+            if response.status != 200:
+                errors.append(f"{PAGES[i % len(PAGES)]}: {response.status}")
+        except (OSError, http.client.HTTPException) as e:
+            errors.append(repr(e))
+            conn.close()
+            continue
+        latencies.append(time.perf_counter() - started)
+        i += 1
+    conn.close()
+
+
+def download_client(port: int, stop: threading.Event, rate: float, downloaded: list[int], errors: list[str]) -> None:
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=60)
+    while not stop.is_set():
+        try:
+            conn.request("GET", DOWNLOAD)
+            response = conn.getresponse()
+            while chunk := response.read(DOWNLOAD_CHUNK):
+                downloaded.append(len(chunk))
+                if rate:
+                    time.sleep(len(chunk) / rate)
+                if stop.is_set():
+                    conn.close()
+                    return
+        except (OSError, http.client.HTTPException) as e:
+            errors.append(repr(e))
+            conn.close()
+    conn.close()
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    if not values:
+        return float("nan")
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def measure(engine: str, clients: int, downloads: int, rate: float, duration: float, port: int) -> dict:
+    server = start_server(engine, port)
+    try:
+        stop = threading.Event()
+        latencies: list[float] = []
+        downloaded: list[int] = []
+        errors: list[str] = []
+        threads = [
+            threading.Thread(target=download_client, args=(port, stop, rate, downloaded, errors))
+            for _ in range(downloads)
+        ] + [
+            threading.Thread(target=page_client, args=(port, stop, latencies, errors))
+            for _ in range(clients)
+        ]
+        cpu_before = cpu_seconds(server.pid)
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        time.sleep(duration)
+        stop.set()
+        for thread in threads:
+            thread.join(timeout=60)
+        elapsed = time.perf_counter() - started
+        cpu_after = cpu_seconds(server.pid)
+    finally:
+        server.kill()
+        server.wait()
+
+    cpu = cpu_after - cpu_before if cpu_before is not None and cpu_after is not None else None
+    return {
+        "engine": engine,
+        "clients": clients,
+        "downloads": downloads,
+        "seconds": elapsed,
+        "requests": len(latencies),
+        "rps": len(latencies) / elapsed,
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+        "max_ms": max(latencies, default=float("nan")) * 1000,
+        "download_mb_s": sum(downloaded) / elapsed / 1e6,
+        "server_cpu_s": cpu,
+        "server_cpu_ms_per_mb": cpu * 1000 / (sum(downloaded) / 1e6) if cpu is not None and downloaded else None,
+        "errors": len(errors),
+    }
+
+
+def print_header() -> None:
+    print(
+        f"{'engine':<12} {'req/s':>8} {'p50 ms':>8} {'p99 ms':>9} {'max ms':>9} {'dl MB/s':>8} {'cpu s':>7} "
+        f"{'cpu ms/MB':>9} {'errors':>6}"
+    )
+
+
+def print_row(r: dict) -> None:
+    cpu = f"{r['server_cpu_s']:>7.2f}" if r["server_cpu_s"] is not None else f"{'-':>7}"
+    per_mb = f"{r['server_cpu_ms_per_mb']:>9.2f}" if r["server_cpu_ms_per_mb"] is not None else f"{'-':>9}"
+    print(
+        f"{r['engine']:<12} {r['rps']:>8.1f} {r['p50_ms']:>8.2f} {r['p99_ms']:>9.2f} {r['max_ms']:>9.2f} "
+        f"{r['download_mb_s']:>8.1f} {cpu} {per_mb} {r['errors']:>6}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark serve.py under parallel load.")
+    parser.add_argument("--engines", nargs="+", choices=ENGINES, default=list(ENGINES))
+    parser.add_argument("--clients", type=int, default=16, help="page clients")
+    parser.add_argument("--downloads", type=int, default=2, help="download clients")
+    parser.add_argument("--rate", type=float, default=4.0, help="MB/s per download client, 0 for unthrottled")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds per engine")
+    parser.add_argument("--port", type=int, default=PORT)
+    parser.add_argument("--output", type=Path, help="results file (default: bench-results/serve-<timestamp>-<commit>.json)")
+    args = parser.parse_args()
+
+    print(f"{args.clients} page clients, {args.downloads} download clients at "
+          f"{f'{args.rate:g} MB/s' if args.rate else 'full speed'}, {args.duration:g}s per engine")
+    print_header()
+    results = []
+    for engine in args.engines:
+        results.append(measure(engine, args.clients, args.downloads, args.rate * 1e6, args.duration, args.port))
+        print_row(results[-1])
+
+    commit = git_commit()
+    output = args.output or RESULTS_DIR / f"serve-{datetime.now():%Y%m%d-%H%M%S}-{commit}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps({
+        "commit": commit,
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+        "download": DOWNLOAD,
+        "results": results,
+    }, indent=2), encoding="utf-8")
+    print(f"\nSaved {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Per-phase timing for the generate_*.py scripts (--profile).
+
+A generator wraps its phases (scan, parse, render, write, ...) in
+current().phase(name). While no profile is active that is a no-op, so the
+calls stay in place for normal runs. With --profile the phases' wall and CPU
+time, the files parsed, bytes read and written and the slowest inputs are
+printed as a table and written to JSON; --pstats additionally dumps a cProfile
+of the whole run.
+
+Files parsed on --jobs workers are timed in the worker and reported back, but
+phases opened inside an extractor (such as teaser scoring) are only seen when
+extraction runs in-process.
+"""
+
+from __future__ import annotations
+
+import argparse
+import cProfile
+import json
+import pstats
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Iterator
+
+PROFILE_DIR = Path("bench-results")
+
+
+class BuildProfile:
+    def __init__(self, name: str, enabled: bool = True):
+        self.name = name
+        self.enabled = enabled
+        self.phases: dict[str, dict[str, float]] = {}
+        self.files_parsed = 0
+        self.files_cached = 0
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.file_times: list[tuple[float, str]] = []
+        self.wall_start = time.perf_counter()
+        self.cpu_start = time.process_time()
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        if not self.enabled:
+            yield
+            return
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        try:
+            yield
+        finally:
+            totals = self.phases.setdefault(name, {"wall_s": 0.0, "cpu_s": 0.0, "calls": 0})
+            totals["wall_s"] += time.perf_counter() - wall
+            totals["cpu_s"] += time.process_time() - cpu
+            totals["calls"] += 1
+
+    def parsed(self, path: Path, data: dict | None, seconds: float) -> dict | None:
+        if self.enabled:
+            self.files_parsed += 1
+            self.bytes_read += path.stat().st_size
+            self.file_times.append((seconds, path.as_posix()))
+        return data
+
+    def cached(self, count: int = 1) -> None:
+        self.files_cached += count
+
+    def wrote(self, path: Path | str) -> None:
+        if self.enabled:
+            self.bytes_written += Path(path).stat().st_size
+
+    def summary(self, top: int = 10) -> dict:
+        return {
+            "generator": self.name,
+            "wall_s": time.perf_counter() - self.wall_start,
+            "cpu_s": time.process_time() - self.cpu_start,
+            "phases": self.phases,
+            "files_parsed": self.files_parsed,
+            "files_cached": self.files_cached,
+            "bytes_read": self.bytes_read,
+            "bytes_written": self.bytes_written,
+            "slowest_files": [
+                {"path": path, "seconds": seconds} for seconds, path in sorted(self.file_times, reverse=True)[:top]
+            ],
+        }
+
+    def print_report(self, top: int = 10) -> None:
+        summary = self.summary(top)
+        print(f"\nProfile: {self.name}")
+        print(f"  {'phase':<16} {'calls':>6} {'wall s':>9} {'cpu s':>9}")
+        for name, totals in self.phases.items():
+            print(f"  {name:<16} {totals['calls']:>6} {totals['wall_s']:>9.4f} {totals['cpu_s']:>9.4f}")
+        print(f"  {'total':<16} {'':>6} {summary['wall_s']:>9.4f} {summary['cpu_s']:>9.4f}")
+        print(
+            f"  files parsed {self.files_parsed}, from cache {self.files_cached}, "
+            f"read {self.bytes_read / 1024:.1f} KB, written {self.bytes_written / 1024:.1f} KB"
+        )
+        if summary["slowest_files"]:
+            print(f"  slowest {len(summary['slowest_files'])} files:")
+            for item in summary["slowest_files"]:
+                print(f"    {item['seconds'] * 1000:>8.2f} ms  {item['path']}")
+
+
+class TimedExtract:
+    """Picklable wrapper that returns (result, seconds) so pool workers can report timings."""
+
+    def __init__(self, extract: Callable[[Path], dict | None]):
+        self.extract = extract
+
+    def __call__(self, path: Path) -> tuple[dict | None, float]:
+        started = time.perf_counter()
+        data = self.extract(path)
+        return data, time.perf_counter() - started
+
+
+_active = BuildProfile("inactive", enabled=False)
+
+
+def current() -> BuildProfile:
+    return _active
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    group = parser.add_argument_group("profiling")
+    group.add_argument("--profile", nargs="?", const=True, default=None, metavar="JSON",
+                       help=f"print per-phase timings and save them as JSON (default: {PROFILE_DIR}/profile-<name>.json)")
+    group.add_argument("--profile-top", type=int, default=10, metavar="N", help="number of slowest files to report")
+    group.add_argument("--pstats", type=Path, metavar="FILE", help="also dump a cProfile of the run to FILE")
+
+
+def run(args: argparse.Namespace, name: str, func: Callable, *func_args, **func_kwargs):
+    """Call func, profiled if --profile or --pstats was given."""
+    global _active
+    if not args.profile and not args.pstats:
+        return func(*func_args, **func_kwargs)
+
+    _active = BuildProfile(name)
+    profiler = cProfile.Profile() if args.pstats else None
+    try:
+        if profiler:
+            profiler.enable()
+        return func(*func_args, **func_kwargs)
+    finally:
+        if profiler:
+            profiler.disable()
+            profiler.dump_stats(args.pstats)
+        _active.print_report(args.profile_top)
+        json_path = PROFILE_DIR / f"profile-{name}.json" if args.profile in (True, None) else Path(args.profile)
+        json_path.parent.mkdir(parents=True, exist_ok=True)
+        json_path.write_text(json.dumps(_active.summary(args.profile_top), indent=2), encoding="utf-8")
+        print(f"  saved {json_path}")
+        if profiler:
+            print(f"  cProfile written to {args.pstats}; top functions by cumulative time:")
+            pstats.Stats(str(args.pstats)).sort_stats("cumulative").print_stats(15)
+        _active = BuildProfile("inactive", enabled=False)
@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+Incremental site build: run the generate_*.py scripts whose inputs changed.
+
+Every target knows which files it is built from. A manifest with the size, mtime
+and content hash of those inputs is kept between builds; a target is only
+regenerated when its input set or one of the hashes differs. Inputs whose size
+and mtime are unchanged are not re-read, so a no-change build only stats files.
+The shared CSS/JS files a target published are recorded too, so deleting one
+rebuilds the pages that link to it.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import importlib
+import json
+import os
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable
+
+import project_tree
+import sitemap_xml
+from metadata_cache import MetadataCache
+
+REPO_DIR = Path(__file__).resolve().parent
+# Kept across fresh_import(): the build and watch loops themselves.
+PERSISTENT_MODULES = {"__main__", "build_site", "watch_site"}
+
+MANIFEST_FILE = Path(".build-manifest.json")
+MANIFEST_VERSION = 1
+
+BLOG_DIR = Path("blog")
+PROJECTS_DIR = Path("projects")
+ARCHIEF_DIR = PROJECTS_DIR / "theos-mechanische-aap-archief"
+SITEMAP_HTML = Path("sitemap.html")
+SITEMAP_SECTIONS = ("blog", "projects", "cv")
+
+
+@dataclass(frozen=True)
+class Target:
+    name: str
+    module: str
+    entry: str
+    output: Path
+    inputs: Callable[[], list[Path]]
+    watch: tuple[Path, ...]
+    presence: tuple[Path, ...] = field(default_factory=tuple)
+    cached: bool = True
+
+    def run(self, cache: MetadataCache | None = None) -> list[Path]:
+        """Run the generator with the current code of its modules; returns the assets it published."""
+        entry = getattr(fresh_import(self.module), self.entry)
+        # The generator publishes through the site_assets fresh_import() loaded.
+        assets = importlib.import_module("site_assets")
+        assets.reset()
+        if self.cached and cache is not None:
+            entry(cache=cache)
+        else:
+            entry()
+        return list(assets.published)
+
+    def affected_by(self, path: Path, inputs: set[Path]) -> bool:
+        """Whether a change to path concerns this target, given its current inputs()."""
+        if path == self.output:
+            return False
+        if path in inputs or path in self.presence:
+            return True
+        return any(path.is_relative_to(root) for root in self.watch)
+
+
+def fresh_import(name: str):
+    """Import module name, and every module of this folder it uses, from their current source.
+
+    A long-running watch_site would otherwise keep building with the code it
+    first imported, and record the hashes of the edited files as built.
+    """
+    for module_name, module in list(sys.modules.items()):
+        path = getattr(module, "__file__", None)
+        if module_name not in PERSISTENT_MODULES and path and Path(path).resolve().parent == REPO_DIR:
+            del sys.modules[module_name]
+    return importlib.import_module(name)
+
+
+def html_files(folder: Path, exclude: set[str]) -> list[Path]:
+    with os.scandir(folder) as entries:
+        return [
+            folder / entry.name
+            for entry in entries
+            if entry.name.endswith(".html") and entry.name not in exclude and entry.is_file()
+        ]
+
+
+def blog_inputs() -> list[Path]:
+    return [
+        Path("generate_blog_index.py"),
+        Path("site_assets.py"),
+        Path("collection.py"),
+        Path("html_backends.py"),
+        Path("metadata_cache.py"),
+        Path("search_index.py"),
+        Path("streaming_extract.py"),
+        *html_files(BLOG_DIR, {"index.html"}),
+    ]
+
+
+def projects_inputs() -> list[Path]:
+    return [
+        Path("generate_projects_index.py"),
+        Path("site_assets.py"),
+        Path("collection.py"),
+        Path("html_backends.py"),
+        Path("metadata_cache.py"),
+        Path("project_tree.py"),
+        *project_tree.entry_points(PROJECTS_DIR),
+    ]
+
+
+def archief_inputs() -> list[Path]:
+    return [
+        Path("generate_archief_index.py"),
+        Path("site_assets.py"),
+        Path("collection.py"),
+        Path("html_backends.py"),
+        Path("metadata_cache.py"),
+        Path("search_index.py"),
+        Path("streaming_extract.py"),
+        Path("related_articles.py"),
+        *html_files(ARCHIEF_DIR, {"index.html", "0-index.html"}),
+    ]
+
+
+def sitemap_inputs() -> list[Path]:
+    # Every page, for sitemap.xml; sitemap.html itself is the output.
+    return [
+        Path("generate_sitemap.py"),
+        Path("site_assets.py"),
+        Path("sitemap_xml.py"),
+        Path("project_tree.py"),
+        *(path for path in map(Path, sitemap_xml.public_pages()) if path != SITEMAP_HTML),
+    ]
+
+
+TARGETS = [
+    Target("blog", "generate_blog_index", "generate_index", BLOG_DIR / "index.html", blog_inputs, (BLOG_DIR,)),
+    Target("projects", "generate_projects_index", "generate_index", PROJECTS_DIR / "index.html", projects_inputs,
+           (PROJECTS_DIR,)),
+    Target("archief", "generate_archief_index", "generate_index", ARCHIEF_DIR / "0-index.html", archief_inputs,
+           (ARCHIEF_DIR,)),
+    Target(
+        "sitemap",
+        "generate_sitemap",
+        "generate_sitemap",
+        SITEMAP_HTML,
+        sitemap_inputs,
+        tuple(Path(section) for section in SITEMAP_SECTIONS),
+        presence=tuple(Path(section) / "index.html" for section in SITEMAP_SECTIONS),
+        cached=False,
+    ),
+]
+
+
+def hash_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def fingerprint(paths: list[Path], previous: dict[str, dict]) -> dict[str, dict]:
+    prints = {}
+    for path in paths:
+        key = path.as_posix()
+        st = path.stat()
+        old = previous.get(key)
+        if old and old["size"] == st.st_size and old["mtime_ns"] == st.st_mtime_ns:
+            digest = old["sha256"]
+        else:
+            digest = hash_file(path)
+        prints[key] = {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "sha256": digest}
+    return prints
+
+
+def changed_inputs(current: dict[str, dict], previous: dict[str, dict]) -> list[str]:
+    changed = [key for key in current if previous.get(key, {}).get("sha256") != current[key]["sha256"]]
+    changed.extend(key for key in previous if key not in current)
+    return sorted(changed)
+
+
+def load_manifest(path: Path) -> dict:
+    try:
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {"version": MANIFEST_VERSION, "targets": {}}
+    if manifest.get("version") != MANIFEST_VERSION:
+        return {"version": MANIFEST_VERSION, "targets": {}}
+    return manifest
+
+
+def save_manifest(path: Path, manifest: dict) -> None:
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(json.dumps(manifest, indent=1, sort_keys=True), encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def build(
+    names: list[str] | None = None,
+    force: bool = False,
+    manifest_path: Path = MANIFEST_FILE,
+    cache: MetadataCache | None = None,
+    quiet: bool = False,
+) -> list[str]:
+    manifest = load_manifest(manifest_path)
+    rebuilt = []
+    dirty = False
+
+    for target in TARGETS:
+        if names and target.name not in names:
+            continue
+
+        state = manifest["targets"].get(target.name, {})
+        previous = state.get("inputs", {})
+        current = fingerprint(target.inputs(), previous)
+        presence = {path.as_posix(): path.exists() for path in target.presence}
+
+        changed = changed_inputs(current, previous)
+        stale = (
+            force
+            or bool(changed)
+            or presence != state.get("presence", {})
+            or not target.output.exists()
+            or not all(Path(asset).exists() for asset in state.get("assets", []))
+        )
+
+        if stale:
+            reason = "forced" if force else f"{len(changed)} input(s) changed" if changed else "output, markers or assets changed"
+            print(f"→ {target.name}: rebuilding ({reason})")
+            assets = sorted({path.as_posix() for path in target.run(cache)})
+            rebuilt.append(target.name)
+        else:
+            assets = state.get("assets", [])
+            if not quiet:
+                print(f"✓ {target.name}: up to date")
+
+        new_state = {"inputs": current, "presence": presence, "assets": assets}
+        if new_state != state:
+            manifest["targets"][target.name] = new_state
+            dirty = True
+
+    if dirty:
+        save_manifest(manifest_path, manifest)
+    return rebuilt
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Regenerate the site indexes whose inputs changed.")
+    parser.add_argument("targets", nargs="*", metavar="target",
+                        help=f"targets to consider (default: all of {', '.join(t.name for t in TARGETS)})")
+    parser.add_argument("--force", action="store_true", help="rebuild even if nothing changed")
+    parser.add_argument("--manifest", type=Path, default=MANIFEST_FILE, help="manifest location")
+    args = parser.parse_args()
+    unknown = set(args.targets) - {target.name for target in TARGETS}
+    if unknown:
+        parser.error(f"unknown target(s): {', '.join(sorted(unknown))}")
+
+    started = time.perf_counter()
+    rebuilt = build(args.targets, force=args.force, manifest_path=args.manifest)
+    elapsed = time.perf_counter() - started
+    print(f"Done in {elapsed:.3f}s, {len(rebuilt)} target(s) rebuilt")
+
+
+if __name__ == "__main__":
+    main()
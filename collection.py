@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Shared collection pipeline for the index generators: scan, parse once, extract.
+
+A Collection is a set of source files (its scan function) and the extractors
+that read them: the generator's own card metadata, the search index's body
+terms, and whatever else the generator lists. collect() looks every (file,
+extractor) pair up in the metadata cache and parses each file with a miss
+once, running all of its missing extractors over that single read: the
+extractors' StreamExtractors share one streaming pass through StreamGroup.
+Extractors without a streaming variant, and every extractor when streaming is
+off (--no-stream, --full-parse), run their own extract() on the file instead.
+Parsing goes through extract_paths(), so a collection gets --jobs for free.
+
+The text helpers the generators' tree extractors have in common live here
+too, so a fix to one of them reaches every index.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from functools import partial
+from pathlib import Path
+from typing import Callable, Iterator
+
+from bs4 import BeautifulSoup
+
+import build_profile
+from html_backends import streaming_enabled
+from metadata_cache import MetadataCache, extract_paths
+from streaming_extract import StreamExtractor, StreamGroup
+
+
+def clean_text(text: str) -> str:
+    return " ".join(text.split())
+
+
+def trim_teaser(text: str, limit: int = 200) -> str:
+    if len(text) <= limit:
+        return text
+    truncated = text[:limit].rsplit(" ", 1)[0]
+    return f"{truncated}..."
+
+
+def extract_title(soup: BeautifulSoup, title_classes: str, fallback: str) -> str:
+    """First non-empty h1, then element matching title_classes, then <title>."""
+    title_tag = soup.find("h1")
+    if title_tag and title_tag.get_text(strip=True):
+        return clean_text(title_tag.get_text(strip=True))
+
+    intro_title = soup.select_one(title_classes)
+    if intro_title and intro_title.get_text(strip=True):
+        return clean_text(intro_title.get_text(strip=True))
+
+    doc_title = soup.find("title")
+    if doc_title and doc_title.get_text(strip=True):
+        return clean_text(doc_title.get_text(strip=True))
+
+    return fallback
+
+
+def teaser_paragraphs(soup: BeautifulSoup, min_length: int) -> Iterator[str]:
+    """Text of the paragraphs that can serve as a teaser, in document order."""
+    for paragraph in soup.find_all("p"):
+        if paragraph.get("class") in (["date"], ["image-caption"]):
+            continue
+        if paragraph.find_parent("figcaption"):
+            continue
+        text = clean_text(paragraph.get_text(" ", strip=True))
+        if len(text) >= min_length:
+            yield text
+
+
+def extract_image(soup: BeautifulSoup) -> str:
+    first_img = soup.find("img")
+    if first_img and first_img.get("src"):
+        return first_img["src"]
+    return ""
+
+
+@dataclass(frozen=True)
+class Extractor:
+    """One kind of metadata cached per file.
+
+    extract(path) reads the file on its own. An extractor that can share a
+    streaming pass also names its StreamExtractor class and from_stream(stream,
+    path), which turns the finished stream into the same result as extract().
+    All of them must be module-level so --jobs workers can unpickle them.
+    """
+
+    namespace: str
+    version: str
+    extract: Callable[[Path], dict | None]
+    stream: type[StreamExtractor] | None = None
+    from_stream: Callable[[StreamExtractor, Path], dict | None] | None = None
+
+
+def extract_group(path: Path, extractors: tuple[Extractor, ...]) -> dict[str, dict | None]:
+    """Results of every extractor for path, keyed by namespace, reading the file once where possible."""
+    results: dict[str, dict | None] = {}
+    shared = [extractor for extractor in extractors if extractor.stream is not None] if streaming_enabled() else []
+    if len(shared) > 1:
+        try:
+            group = StreamGroup([extractor.stream() for extractor in shared]).run(path)
+            for extractor, part in zip(shared, group.parts):
+                results[extractor.namespace] = extractor.from_stream(part, path)
+        except Exception:
+            # Let each extractor fail (or report the error) as it would alone.
+            results.clear()
+    for extractor in extractors:
+        if extractor.namespace not in results:
+            results[extractor.namespace] = extractor.extract(path)
+    return results
+
+
+@dataclass
+class Collection:
+    name: str
+    scan: Callable[[], list[Path]]
+    extractors: list[Extractor] = field(default_factory=list)
+
+    def collect(self, cache: MetadataCache, jobs: int = 1) -> list[dict[str, dict | None]]:
+        """Scan, then return every extractor's result per file, keyed by namespace."""
+        return [record for _path, record in self.collect_with_paths(cache, jobs)]
+
+    def collect_with_paths(self, cache: MetadataCache, jobs: int = 1) -> list[tuple[Path, dict[str, dict | None]]]:
+        """Like collect(), with each record paired with the file it came from."""
+        with build_profile.current().phase("scan"):
+            paths = self.scan()
+        return list(zip(paths, collect(paths, self.extractors, cache, jobs)))
+
+
+def collect(
+    paths: list[Path],
+    extractors: list[Extractor],
+    cache: MetadataCache,
+    jobs: int = 1,
+) -> list[dict[str, dict | None]]:
+    profile = build_profile.current()
+    with profile.phase("parse"):
+        records: list[dict[str, dict | None]] = [{} for _ in paths]
+        # Files grouped by the extractors they still need, usually all or none.
+        missing: dict[tuple[Extractor, ...], list[int]] = {}
+        for i, path in enumerate(paths):
+            needed = []
+            for extractor in extractors:
+                data = cache.get(extractor.namespace, path, extractor.version)
+                if data is None:
+                    needed.append(extractor)
+                else:
+                    records[i][extractor.namespace] = data
+            if needed:
+                missing.setdefault(tuple(needed), []).append(i)
+            cache.hits += len(extractors) - len(needed)
+            cache.misses += len(needed)
+        profile.cached(len(paths) - sum(len(indices) for indices in missing.values()))
+
+        for needed, indices in missing.items():
+            extracted = extract_paths(partial(extract_group, extractors=needed), [paths[i] for i in indices], jobs)
+            for i, results in zip(indices, extracted):
+                for extractor in needed:
+                    data = results[extractor.namespace]
+                    records[i][extractor.namespace] = data
+                    # Failed extractions are not stored so their errors show up on every run.
+                    if data is not None:
+                        cache.put(extractor.namespace, paths[i], extractor.version, data)
+    return records
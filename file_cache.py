@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Bounded in-memory cache of hot files for serve.py.
+
+Entries are whatever the server keeps per file (body plus precomputed
+headers), stored under the file's path with the size and mtime they were read
+at. get() stats the file and only returns an entry whose size and mtime still
+match, so an edited file is picked up on its next request. That one stat
+replaces the open, fstat and read of an uncached request.
+
+The cache holds at most max_bytes of entry cost and evicts the least
+recently used entries to stay under it. An entry costs its body size plus
+ENTRY_OVERHEAD, so entries without a body (for files over max_file_bytes,
+which are read from disk on every request) are bounded too. Hits, misses,
+stale entries and evictions are counted so the cap can be tuned (serve.py
+shows them at /cache-stats).
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Any
+
+MAX_BYTES = 64 * 1024 * 1024
+MAX_FILE_BYTES = 1024 * 1024
+ENTRY_OVERHEAD = 512
+
+
+class FileCache:
+    def __init__(self, max_bytes: int = MAX_BYTES, max_file_bytes: int = MAX_FILE_BYTES):
+        self.max_bytes = max_bytes
+        self.max_file_bytes = min(max_file_bytes, max_bytes)
+        # path -> (size, mtime_ns, cost, entry), least recently used first
+        self.entries: OrderedDict[str, tuple[int, int, int, Any]] = OrderedDict()
+        self.bytes = 0
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        self.evictions = 0
+
+    def admits(self, size: int) -> bool:
+        return size <= self.max_file_bytes
+
+    def get(self, path: str) -> Any | None:
+        """The entry for path if the file is unchanged since it was stored, else None."""
+        try:
+            st = os.stat(path)
+        except OSError:
+            st = None
+        with self.lock:
+            known = self.entries.get(path)
+            if known is not None and st is not None and known[:2] == (st.st_size, st.st_mtime_ns):
+                self.entries.move_to_end(path)
+                self.hits += 1
+                return known[3]
+            if known is not None:
+                self.stale += 1
+                self.remove(path)
+            self.misses += 1
+            return None
+
+    def put(self, path: str, size: int, mtime_ns: int, entry: Any, body_bytes: int) -> None:
+        if body_bytes > self.max_file_bytes:
+            return
+        cost = body_bytes + ENTRY_OVERHEAD
+        with self.lock:
+            self.remove(path)
+            self.entries[path] = (size, mtime_ns, cost, entry)
+            self.bytes += cost
+            while self.bytes > self.max_bytes:
+                _path, (_size, _mtime_ns, evicted, _entry) = self.entries.popitem(last=False)
+                self.bytes -= evicted
+                self.evictions += 1
+
+    def remove(self, path: str) -> None:
+        # Caller holds the lock.
+        known = self.entries.pop(path, None)
+        if known is not None:
+            self.bytes -= known[2]
+
+    def stats(self) -> dict:
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self.entries),
+                "bytes": self.bytes,
+                "max_bytes": self.max_bytes,
+                "max_file_bytes": self.max_file_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "stale": self.stale,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else None,
+            }
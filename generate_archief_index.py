@@ -1,242 +1,644 @@
 #!/usr/bin/env python3
 """
 Generate index.html with embedded article metadata for the archief folder
+
+The first page of cards is prerendered as static HTML. The remaining articles
+go into per-year JSON shards (split further if a year is large) that the page
+fetches while the reader scrolls, so the page itself stays the same size
+however many articles the archive holds. Each article also gets a
+related/<article>.json sidecar listing its most similar articles.
 """
 
 import os
+import gzip
 import json
+import argparse
+from html import escape
 from pathlib import Path
-from bs4 import BeautifulSoup
+
+from bs4 import Tag
+
+import build_profile
+import html_backends
+import related_articles
+import search_index
+import site_assets
+import streaming_extract
+from html_backends import (
+    available_backends, parse_html, restricted, streaming_enabled,
+    use_backend, use_full_parse, use_streaming,
+)
+from collection import Collection, Extractor
+from metadata_cache import extractor_version, shared_cache
+from streaming_extract import StreamExtractor
 
 ARCHIEF_DIR = "projects/theos-mechanische-aap-archief"
 
+# related_articles writes <article>.json here for every article
+RELATED_DIR = Path(ARCHIEF_DIR) / "related"
+
+# Only these elements (and their subtrees) are built into the tree
+PARSE_TAGS = ('h1', 'article')
+PARSE_CLASSES = ('date', 'links', 'attachments')
+PARSE_ONLY = restricted(PARSE_TAGS, PARSE_CLASSES)
+
+# Cards rendered into the page; the rest is fetched from JSON shards
+ARTICLES_PER_PAGE = 12
+SHARD_SIZE = 200
+CARD_FIELDS = ('href', 'title', 'date', 'excerpt', 'image', 'images', 'links', 'attachments')
+
+# Columnar shards (--columnar): these columns are split into a part looked up
+# in a per-shard dictionary and the rest of the value
+DICTIONARY_PREFIX = {'image': '/'}      # 'images/' + 'IMG_1.jpg'
+DICTIONARY_SUFFIX = {'date': ' - '}     # '2015-01-19' + " - Theo's Mechanische Aap"
+
+class ArticleStream(StreamExtractor):
+    """Collect the article fields and media counts in a single streaming pass"""
+    
+    def __init__(self):
+        super().__init__()
+        self.h1 = None
+        self.date = None
+        self.first_p = None
+        self.first_img = None
+        self.images = 0
+        self.links = 0
+        self.attachments = 0
+    
+    def open_element(self, element):
+        if element.name == 'h1' and self.h1 is None:
+            self.h1 = element.capture()
+        if 'date' in element.classes and self.date is None:
+            self.date = element.capture()
+        if element.name == 'p' and self.first_p is None and self.inside('article'):
+            self.first_p = element.capture()
+        if element.name == 'img' and self.inside('article'):
+            self.images += 1
+            if self.first_img is None:
+                self.first_img = element
+        if element.name == 'a':
+            if self.inside_class('links'):
+                self.links += 1
+            if self.inside_class('attachments'):
+                self.attachments += 1
+
+def read_article_stream(filepath):
+    """Title, date, excerpt, image and media counts via ArticleStream"""
+    return stream_fields(ArticleStream().run(filepath))
+
+def stream_fields(stream):
+    """The read_article_stream fields of a finished ArticleStream"""
+    return (
+        stream.h1.text() if stream.h1 else 'Untitled',
+        stream.date.text() if stream.date else '',
+        stream.first_p.text()[:200] if stream.first_p else '',
+        stream.first_img.attrs.get('src', '') if stream.first_img else '',
+        stream.images,
+        stream.links,
+        stream.attachments,
+    )
+
+class ArticleVisitor:
+    """Collect the article fields and media counts in a single walk over a parsed tree
+    
+    Finds what soup.find('h1'), find(class_='date'), select_one('article p'),
+    select_one('article img') and the img, '.links a' and '.attachments a'
+    selects would, in document order, without a separate pass for each.
+    """
+    
+    def __init__(self):
+        self.h1 = None
+        self.date = None
+        self.first_p = None
+        self.first_img = None
+        self.images = 0
+        self.links = 0
+        self.attachments = 0
+    
+    def visit(self, root):
+        # (tag, inside article, inside .links, inside .attachments), children
+        # pushed in reverse so they are visited in document order
+        stack = [(root, False, False, False)]
+        while stack:
+            tag, in_article, in_links, in_attachments = stack.pop()
+            name = tag.name
+            classes = tag.get('class') or ()
+            if name == 'h1' and self.h1 is None:
+                self.h1 = tag
+            if 'date' in classes and self.date is None:
+                self.date = tag
+            if in_article:
+                if name == 'p' and self.first_p is None:
+                    self.first_p = tag
+                elif name == 'img':
+                    self.images += 1
+                    if self.first_img is None:
+                        self.first_img = tag
+            if name == 'a':
+                self.links += in_links
+                self.attachments += in_attachments
+            context = (
+                in_article or name == 'article',
+                in_links or 'links' in classes,
+                in_attachments or 'attachments' in classes,
+            )
+            stack.extend((child, *context) for child in reversed(tag.contents) if isinstance(child, Tag))
+        return self
+
+def read_article_tree(filepath):
+    """Title, date, excerpt, image and media counts from a parsed tree, via ArticleVisitor"""
+    with open(filepath, 'r', encoding='utf-8') as f:
+        soup = parse_html(f.read(), only=PARSE_ONLY)
+    
+    visitor = ArticleVisitor().visit(soup)
+    return (
+        visitor.h1.get_text(strip=True) if visitor.h1 else 'Untitled',
+        visitor.date.get_text(strip=True) if visitor.date else '',
+        visitor.first_p.get_text(strip=True)[:200] if visitor.first_p else '',
+        (visitor.first_img.get('src') or '') if visitor.first_img else '',
+        visitor.images,
+        visitor.links,
+        visitor.attachments,
+    )
+
+def article_metadata(filepath, fields):
+    """The cached article dict from the read_article_* fields"""
+    title, date, excerpt, image, images, links, attachments = fields
+    
+    # Extract date for sorting
+    filename = os.path.basename(filepath)
+    sort_date = filename[:10] if filename[:4].isdigit() else '1900-01-01'
+    
+    return {
+        'href': filename,
+        'title': title,
+        'date': date,
+        'excerpt': excerpt,
+        'image': image,
+        'images': images,
+        'links': links,
+        'attachments': attachments,
+        'sortDate': sort_date
+    }
+
+def article_from_stream(stream, filepath):
+    """extract_article_metadata for an ArticleStream run as part of a collection's shared pass"""
+    return article_metadata(filepath, stream_fields(stream))
+
 def extract_article_metadata(filepath):
     """Extract metadata from an article HTML file"""
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            soup = BeautifulSoup(f.read(), 'html.parser')
-        
-        title = soup.find('h1')
-        title = title.get_text(strip=True) if title else 'Untitled'
-        
-        date = soup.find(class_='date')
-        date = date.get_text(strip=True) if date else ''
-        
-        # Get first paragraph
-        first_p = soup.select_one('article p')
-        excerpt = first_p.get_text(strip=True)[:200] if first_p else ''
-        
-        # Get first image
-        first_img = soup.select_one('article img')
-        image = first_img['src'] if first_img and first_img.get('src') else ''
-        
-        # Count media
-        images = len(soup.select('article img'))
-        links = len(soup.select('.links a'))
-        attachments = len(soup.select('.attachments a'))
-        
-        # Extract date for sorting
-        filename = os.path.basename(filepath)
-        sort_date = filename[:10] if filename[:4].isdigit() else '1900-01-01'
-        
-        return {
-            'href': filename,
-            'title': title,
-            'date': date,
-            'excerpt': excerpt,
-            'image': image,
-            'images': images,
-            'links': links,
-            'attachments': attachments,
-            'sortDate': sort_date
-        }
+        if streaming_enabled():
+            fields = read_article_stream(filepath)
+        else:
+            fields = read_article_tree(filepath)
+        return article_metadata(filepath, fields)
     except Exception as e:
         print(f"Error processing {filepath}: {e}")
         return None
 
-def generate_index():
-    """Generate index.html with embedded article data"""
+EXTRACTOR_VERSION = extractor_version(
+    PARSE_TAGS, PARSE_CLASSES, html_backends, streaming_extract, ArticleStream, read_article_stream, stream_fields, ArticleVisitor,
+    read_article_tree, article_metadata, article_from_stream, extract_article_metadata,
+)
+
+ARTICLE = Extractor('archief', EXTRACTOR_VERSION, extract_article_metadata, ArticleStream, article_from_stream)
+
+def scan_articles():
+    return [
+        Path(ARCHIEF_DIR) / filename
+        for filename in os.listdir(ARCHIEF_DIR)
+        if filename.endswith('.html') and filename not in ['index.html', '0-index.html']
+    ]
+
+# Articles feed the cards, the search index and the related articles
+ARTICLES = Collection('archief', scan_articles, [ARTICLE, search_index.BODY_TERMS])
+
+STYLESHEET = """\
+* {
+    margin: 0;
+    padding: 0;
+    box-sizing: border-box;
+}
+
+body {
+    font-family: Georgia, 'Times New Roman', serif;
+    background: #f5f5f5;
+    color: #1a1a1a;
+}
+
+header {
+    background: #000;
+    color: #fff;
+    padding: 40px 20px;
+    text-align: center;
+    position: sticky;
+    top: 0;
+    z-index: 100;
+    box-shadow: 0 2px 10px rgba(0,0,0,0.3);
+}
+
+header h1 {
+    font-size: 2.5em;
+    font-weight: 700;
+    margin-bottom: 10px;
+}
+
+header p {
+    font-size: 1.1em;
+    opacity: 0.8;
+    letter-spacing: 2px;
+    text-transform: uppercase;
+}
+
+.container {
+    max-width: 1200px;
+    margin: 0 auto;
+    padding: 40px 20px;
+}
+
+.articles-grid {
+    display: grid;
+    grid-template-columns: repeat(auto-fill, minmax(350px, 1fr));
+    gap: 30px;
+    margin-bottom: 40px;
+}
+
+.article-card {
+    display: block;
+    color: inherit;
+    text-decoration: none;
+    background: white;
+    border-radius: 8px;
+    overflow: hidden;
+    box-shadow: 0 2px 8px rgba(0,0,0,0.1);
+    transition: transform 0.3s, box-shadow 0.3s;
+    cursor: pointer;
+    animation: fadeIn 0.5s ease-in;
+}
+
+@keyframes fadeIn {
+    from {
+        opacity: 0;
+        transform: translateY(20px);
+    }
+    to {
+        opacity: 1;
+        transform: translateY(0);
+    }
+}
+
+.article-card:hover {
+    transform: translateY(-5px);
+    box-shadow: 0 8px 16px rgba(0,0,0,0.2);
+}
+
+.article-image {
+    width: 100%;
+    height: 250px;
+    object-fit: cover;
+    background: #e0e0e0;
+    display: block;
+}
+
+.article-content {
+    padding: 25px;
+}
+
+.article-date {
+    font-size: 0.85em;
+    color: #666;
+    text-transform: uppercase;
+    letter-spacing: 1px;
+    margin-bottom: 10px;
+}
+
+.article-title {
+    font-size: 1.5em;
+    font-weight: 700;
+    margin-bottom: 15px;
+    line-height: 1.3;
+    color: #000;
+}
+
+.article-excerpt {
+    font-size: 1em;
+    line-height: 1.6;
+    color: #444;
+    display: -webkit-box;
+    -webkit-line-clamp: 3;
+    -webkit-box-orient: vertical;
+    overflow: hidden;
+}
+
+.article-meta {
+    margin-top: 15px;
+    padding-top: 15px;
+    border-top: 1px solid #eee;
+    font-size: 0.85em;
+    color: #999;
+}
+
+.loading {
+    text-align: center;
+    padding: 40px;
+    font-size: 1.2em;
+    color: #666;
+}
+
+footer {
+    text-align: center;
+    padding: 40px 20px;
+    background: #000;
+    color: #fff;
+    margin-top: 60px;
+}
+
+footer a {
+    color: #fff;
+    text-decoration: none;
+    border-bottom: 1px solid #fff;
+    padding-bottom: 2px;
+}
+
+footer a:hover {
+    border-bottom: 2px solid #fff;
+}
+
+@media (max-width: 768px) {
+    .articles-grid {
+        grid-template-columns: 1fr;
+    }
+
+    header h1 {
+        font-size: 1.8em;
+    }
+}
+"""
+
+SCRIPT = """\
+const grid = document.getElementById('articlesGrid');
+const loading = document.getElementById('loading');
+const totalArticles = Number(grid.dataset.total);
+const prerendered = grid.children.length;
+const articlesPerLoad = 12;
+
+let displayedArticles = prerendered;
+// Shards are either a list of cards or columns (see encode_columns())
+let shards = null;
+let nextShard = 0;
+let busy = false;
+const loadedArticles = [];
+
+function escapeHtml(text) {
+    return String(text).replace(/[&<>"']/g, c => ({
+        '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#x27;'
+    })[c]);
+}
+
+// Same markup as card_html() in generate_archief_index.py
+function createArticleCard(article) {
+    const card = document.createElement('a');
+    card.className = 'article-card';
+    card.href = article.href;
+
+    const imageHtml = article.image
+        ? `<img src="${escapeHtml(article.image)}" alt="${escapeHtml(article.title)}" class="article-image" loading="lazy">`
+        : `<div class="article-image" style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);"></div>`;
+
+    const metaParts = [];
+    if (article.images > 0) metaParts.push(`${article.images} foto's`);
+    if (article.links > 0) metaParts.push(`${article.links} links`);
+    if (article.attachments > 0) metaParts.push(`${article.attachments} bestanden`);
+
+    card.innerHTML = `
+        ${imageHtml}
+        <div class="article-content">
+            <div class="article-date">${escapeHtml(article.date)}</div>
+            <h2 class="article-title">${escapeHtml(article.title)}</h2>
+            <p class="article-excerpt">${escapeHtml(article.excerpt)}</p>
+            ${metaParts.length > 0 ? `<div class="article-meta">${metaParts.join(' • ')}</div>` : ''}
+        </div>
+    `;
+
+    return card;
+}
+
+function decodeShard(shard) {
+    if (Array.isArray(shard)) return shard;
+    const columns = {};
+    for (const [name, column] of Object.entries(shard.c)) {
+        columns[name] = Array.isArray(column) ? column : column.v.map((value, k) =>
+            column.p ? column.p[column.i[k]] + value : value + column.s[column.i[k]]);
+    }
+    return Array.from({length: shard.n}, (_, k) => {
+        const article = {};
+        for (const name in columns) article[name] = columns[name][k];
+        return article;
+    });
+}
+
+async function fetchJson(href) {
+    const response = await fetch(href);
+    if (!response.ok) throw new Error(`${href}: ${response.status}`);
+    return response.json();
+}
+
+// Fetch shards (in order) until the next batch of cards is available
+async function loadArticles(count) {
+    if (shards === null) shards = await fetchJson(grid.dataset.shards);
+    while (loadedArticles.length < count && nextShard < shards.length) {
+        loadedArticles.push(...decodeShard(await fetchJson(shards[nextShard][0])));
+        nextShard++;
+    }
+}
+
+async function displayMoreArticles() {
+    busy = true;
+    try {
+        const start = displayedArticles - prerendered;
+        await loadArticles(start + articlesPerLoad);
+        const toDisplay = loadedArticles.slice(start, start + articlesPerLoad);
+        toDisplay.forEach(article => {
+            grid.appendChild(createArticleCard(article));
+        });
+        displayedArticles += toDisplay.length;
+        if (toDisplay.length === 0) displayedArticles = totalArticles;
+    } catch (error) {
+        console.error(error);
+        loading.textContent = 'Laden mislukt.';
+        window.removeEventListener('scroll', checkScroll);
+        window.removeEventListener('resize', checkScroll);
+        return;
+    } finally {
+        busy = false;
+    }
+
+    // Hide loading indicator if all articles are displayed
+    if (displayedArticles >= totalArticles) {
+        loading.style.display = 'none';
+    } else {
+        checkScroll();
+    }
+}
+
+// Infinite scroll
+function checkScroll() {
+    if (busy || displayedArticles >= totalArticles) return;
+
+    const rect = loading.getBoundingClientRect();
+
+    if (rect.top < window.innerHeight + 200) {
+        displayMoreArticles();
+    }
+}
+
+// Initialize
+function init() {
+    if (displayedArticles >= totalArticles) return;
+    loading.style.display = 'block';
+
+    window.addEventListener('scroll', checkScroll);
+    window.addEventListener('resize', checkScroll);
+    checkScroll();
+}
+
+init();
+"""
+
+def card_html(article):
+    """Static version of the card createArticleCard() builds in the page"""
+    if article['image']:
+        image_html = f'<img src="{escape(article["image"])}" alt="{escape(article["title"])}" class="article-image" loading="lazy">'
+    else:
+        image_html = '<div class="article-image" style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);"></div>'
     
-    # Find all article HTML files
-    articles = []
-    for filename in os.listdir(ARCHIEF_DIR):
-        if filename.endswith('.html') and filename not in ['index.html', '0-index.html']:
-            filepath = os.path.join(ARCHIEF_DIR, filename)
-            metadata = extract_article_metadata(filepath)
-            if metadata:
-                articles.append(metadata)
+    meta_parts = []
+    if article['images'] > 0:
+        meta_parts.append(f"{article['images']} foto's")
+    if article['links'] > 0:
+        meta_parts.append(f"{article['links']} links")
+    if article['attachments'] > 0:
+        meta_parts.append(f"{article['attachments']} bestanden")
+    meta_html = f'<div class="article-meta">{" • ".join(meta_parts)}</div>' if meta_parts else ''
+    
+    return f"""            <a class="article-card" href="{escape(article['href'])}">
+                {image_html}
+                <div class="article-content">
+                    <div class="article-date">{escape(article['date'])}</div>
+                    <h2 class="article-title">{escape(article['title'])}</h2>
+                    <p class="article-excerpt">{escape(article['excerpt'])}</p>
+                    {meta_html}
+                </div>
+            </a>"""
+
+def shard_articles(articles):
+    """Split articles (newest first) into (year, part, cards) shards of at most SHARD_SIZE"""
+    shards = []
+    for article in articles:
+        year = article['sortDate'][:4]
+        if not shards or shards[-1][0] != year or len(shards[-1][2]) == SHARD_SIZE:
+            part = shards[-1][1] + 1 if shards and shards[-1][0] == year else 1
+            shards.append((year, part, []))
+        shards[-1][2].append({field: article[field] for field in CARD_FIELDS})
+    return shards
+
+
+def dictionary_column(values, split, key):
+    """Encode values as dictionary part (under key) + index + remaining part"""
+    dictionary = {}
+    indices, rest = [], []
+    for value in values:
+        part, remainder = split(value)
+        indices.append(dictionary.setdefault(part, len(dictionary)))
+        rest.append(remainder)
+    return {key: list(dictionary), 'i': indices, 'v': rest}
+
+def encode_columns(cards):
+    """Column arrays instead of one object per card; decoded by decodeShard() in the page"""
+    columns = {}
+    for field in CARD_FIELDS:
+        values = [card[field] for card in cards]
+        if field in DICTIONARY_PREFIX:
+            sep = DICTIONARY_PREFIX[field]
+            columns[field] = dictionary_column(values, lambda v: (v[:v.rfind(sep) + 1], v[v.rfind(sep) + 1:]), 'p')
+        elif field in DICTIONARY_SUFFIX:
+            sep = DICTIONARY_SUFFIX[field]
+            columns[field] = dictionary_column(values, lambda v: (v[v.find(sep):], v[:v.find(sep)]) if sep in v else ('', v), 's')
+        else:
+            columns[field] = values
+    return {'n': len(cards), 'c': columns}
+
+def compact_json(data):
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+
+def report_sizes(shards):
+    """Print raw and gzipped payload sizes of the sharded cards in each format"""
+    # The same cards in every format: the prerendered ones are in no shard
+    cards = [card for _, _, shard in shards for card in shard]
+    formats = [
+        ('inline JSON (indent=2)', [json.dumps(cards, ensure_ascii=False, indent=2)]),
+        ('compact rows', [compact_json(cards) for _, _, cards in shards]),
+        ('columnar', [compact_json(encode_columns(cards)) for _, _, cards in shards]),
+    ]
+    print('  Article data size:')
+    for label, payloads in formats:
+        data = [payload.encode('utf-8') for payload in payloads]
+        raw = sum(len(d) for d in data)
+        gz = sum(len(gzip.compress(d, 9)) for d in data)
+        print(f'    {label:<24} {raw / 1024:>8.1f} KB raw {gz / 1024:>8.1f} KB gzip')
+
+def generate_index(use_cache=True, jobs=1, cache=None, columnar=False):
+    """Generate index.html with the first cards, JSON shards for the rest and a search index"""
+    
+    profile = build_profile.current()
+    
+    # Parse each article once for its card and its search terms, reusing
+    # cached results for unchanged files
+    with shared_cache(cache, use_cache) as cache:
+        records = [record for record in ARTICLES.collect(cache, jobs=jobs) if record['archief']]
     
     # Sort by date (newest first)
-    articles.sort(key=lambda x: x['sortDate'], reverse=True)
+    with profile.phase('sort'):
+        records.sort(key=lambda record: record['archief']['sortDate'], reverse=True)
+    articles = [record['archief'] for record in records]
     
-    # Convert to JSON
-    articles_json = json.dumps(articles, ensure_ascii=False, indent=2)
+    # Full-text search over titles, excerpts and article bodies, and the
+    # related articles of each article from the same terms
+    terms = search_index.document_terms(articles, [record['search'] for record in records])
+    search_manifest = search_index.build('archief', articles, terms)
+    related_articles.build(RELATED_DIR, articles, terms)
     
-    # Create HTML
-    html = f"""<!DOCTYPE html>
+    # Everything after the first page goes into content-hashed JSON shards,
+    # listed in a shard index the page fetches on the first scroll
+    index_path = os.path.join(ARCHIEF_DIR, '0-index.html')
+    with profile.phase('serialize'):
+        shards = shard_articles(articles[ARTICLES_PER_PAGE:])
+        shard_files = []
+        for year, part, cards in shards:
+            payload = compact_json(encode_columns(cards) if columnar else cards)
+            shard = site_assets.publish(f'archief-{year}-{part}', '.json', payload)
+            shard_files.append((shard, len(cards)))
+        shard_index = site_assets.publish('archief-shards', '.json', compact_json(
+            [[site_assets.href(Path(index_path), shard), count] for shard, count in shard_files]
+        ))
+        site_assets.prune('archief-', '.json', [shard for shard, _ in shard_files] + [shard_index])
+        shards_href = escape(site_assets.href(Path(index_path), shard_index))
+    
+    # Create HTML; styles and the card script are shared asset files
+    with profile.phase('render'):
+        cards_html = '\n'.join(card_html(article) for article in articles[:ARTICLES_PER_PAGE])
+        stylesheet = site_assets.stylesheet(Path(index_path), 'archief', STYLESHEET)
+        script = site_assets.script(Path(index_path), 'archief', SCRIPT)
+        search_form = search_index.search_form(Path(index_path), search_manifest, '#articlesGrid, #loading')
+        html = f"""<!DOCTYPE html>
 <html lang="nl">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Theo's Mechanische Aap - Archief</title>
-    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-        
-        body {{
-            font-family: Georgia, 'Times New Roman', serif;
-            background: #f5f5f5;
-            color: #1a1a1a;
-        }}
-        
-        header {{
-            background: #000;
-            color: #fff;
-            padding: 40px 20px;
-            text-align: center;
-            position: sticky;
-            top: 0;
-            z-index: 100;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.3);
-        }}
-        
-        header h1 {{
-            font-size: 2.5em;
-            font-weight: 700;
-            margin-bottom: 10px;
-        }}
-        
-        header p {{
-            font-size: 1.1em;
-            opacity: 0.8;
-            letter-spacing: 2px;
-            text-transform: uppercase;
-        }}
-        
-        .container {{
-            max-width: 1200px;
-            margin: 0 auto;
-            padding: 40px 20px;
-        }}
-        
-        .articles-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fill, minmax(350px, 1fr));
-            gap: 30px;
-            margin-bottom: 40px;
-        }}
-        
-        .article-card {{
-            background: white;
-            border-radius: 8px;
-            overflow: hidden;
-            box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-            transition: transform 0.3s, box-shadow 0.3s;
-            cursor: pointer;
-            animation: fadeIn 0.5s ease-in;
-        }}
-        
-        @keyframes fadeIn {{
-            from {{
-                opacity: 0;
-                transform: translateY(20px);
-            }}
-            to {{
-                opacity: 1;
-                transform: translateY(0);
-            }}
-        }}
-        
-        .article-card:hover {{
-            transform: translateY(-5px);
-            box-shadow: 0 8px 16px rgba(0,0,0,0.2);
-        }}
-        
-        .article-image {{
-            width: 100%;
-            height: 250px;
-            object-fit: cover;
-            background: #e0e0e0;
-            display: block;
-        }}
-        
-        .article-content {{
-            padding: 25px;
-        }}
-        
-        .article-date {{
-            font-size: 0.85em;
-            color: #666;
-            text-transform: uppercase;
-            letter-spacing: 1px;
-            margin-bottom: 10px;
-        }}
-        
-        .article-title {{
-            font-size: 1.5em;
-            font-weight: 700;
-            margin-bottom: 15px;
-            line-height: 1.3;
-            color: #000;
-        }}
-        
-        .article-excerpt {{
-            font-size: 1em;
-            line-height: 1.6;
-            color: #444;
-            display: -webkit-box;
-            -webkit-line-clamp: 3;
-            -webkit-box-orient: vertical;
-            overflow: hidden;
-        }}
-        
-        .article-meta {{
-            margin-top: 15px;
-            padding-top: 15px;
-            border-top: 1px solid #eee;
-            font-size: 0.85em;
-            color: #999;
-        }}
-        
-        .loading {{
-            text-align: center;
-            padding: 40px;
-            font-size: 1.2em;
-            color: #666;
-        }}
-        
-        footer {{
-            text-align: center;
-            padding: 40px 20px;
-            background: #000;
-            color: #fff;
-            margin-top: 60px;
-        }}
-        
-        footer a {{
-            color: #fff;
-            text-decoration: none;
-            border-bottom: 1px solid #fff;
-            padding-bottom: 2px;
-        }}
-        
-        footer a:hover {{
-            border-bottom: 2px solid #fff;
-        }}
-        
-        @media (max-width: 768px) {{
-            .articles-grid {{
-                grid-template-columns: 1fr;
-            }}
-            
-            header h1 {{
-                font-size: 1.8em;
-            }}
-        }}
-    </style>
+    {stylesheet}
+    <link rel="prefetch" href="{shards_href}">
 </head>
 <body>
     <header>
@@ -245,7 +647,10 @@ def generate_index():
     </header>
     
     <div class="container">
-        <div class="articles-grid" id="articlesGrid"></div>
+        {search_form}
+        <div class="articles-grid" id="articlesGrid" data-total="{len(articles)}" data-shards="{shards_href}">
+{cards_html}
+        </div>
         <div class="loading" id="loading" style="display: none;">Meer artikelen laden...</div>
     </div>
     
@@ -253,90 +658,35 @@ def generate_index():
         <p><a href="../../sitemap.html">← Terug naar sitemap</a></p>
     </footer>
     
-    <script>
-        // Article data embedded directly
-        const allArticles = {articles_json};
-        
-        let displayedArticles = 0;
-        const articlesPerLoad = 12;
-        
-        function createArticleCard(article) {{
-            const card = document.createElement('div');
-            card.className = 'article-card';
-            card.onclick = () => window.location.href = article.href;
-            
-            const imageHtml = article.image 
-                ? `<img src="${{article.image}}" alt="${{article.title}}" class="article-image" loading="lazy">`
-                : `<div class="article-image" style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);"></div>`;
-            
-            const metaParts = [];
-            if (article.images > 0) metaParts.push(`${{article.images}} foto's`);
-            if (article.links > 0) metaParts.push(`${{article.links}} links`);
-            if (article.attachments > 0) metaParts.push(`${{article.attachments}} bestanden`);
-            
-            card.innerHTML = `
-                ${{imageHtml}}
-                <div class="article-content">
-                    <div class="article-date">${{article.date}}</div>
-                    <h2 class="article-title">${{article.title}}</h2>
-                    <p class="article-excerpt">${{article.excerpt}}</p>
-                    ${{metaParts.length > 0 ? `<div class="article-meta">${{metaParts.join(' • ')}}</div>` : ''}}
-                </div>
-            `;
-            
-            return card;
-        }}
-        
-        function displayMoreArticles() {{
-            const grid = document.getElementById('articlesGrid');
-            const toDisplay = allArticles.slice(displayedArticles, displayedArticles + articlesPerLoad);
-            
-            toDisplay.forEach(article => {{
-                grid.appendChild(createArticleCard(article));
-            }});
-            
-            displayedArticles += toDisplay.length;
-            
-            // Hide loading indicator if all articles are displayed
-            if (displayedArticles >= allArticles.length) {{
-                document.getElementById('loading').style.display = 'none';
-            }}
-        }}
-        
-        // Infinite scroll
-        function checkScroll() {{
-            if (displayedArticles >= allArticles.length) return;
-            
-            const loading = document.getElementById('loading');
-            const rect = loading.getBoundingClientRect();
-            
-            if (rect.top < window.innerHeight + 200) {{
-                displayMoreArticles();
-            }}
-        }}
-        
-        // Initialize
-        function init() {{
-            document.getElementById('loading').style.display = 'block';
-            displayMoreArticles();
-            
-            window.addEventListener('scroll', checkScroll);
-            window.addEventListener('resize', checkScroll);
-        }}
-        
-        init();
-    </script>
+    {script}
 </body>
 </html>
 """
     
     # Write 0-index.html (prefixed with 0 to show first in file listings)
-    index_path = os.path.join(ARCHIEF_DIR, '0-index.html')
-    with open(index_path, 'w', encoding='utf-8') as f:
+    with profile.phase('write'), open(index_path, 'w', encoding='utf-8') as f:
         f.write(html)
+    profile.wrote(index_path)
     
     print(f"✓ Generated 0-index.html with {len(articles)} articles")
     print(f"  Location: {index_path}")
+    if columnar:
+        report_sizes(shards)
 
 if __name__ == '__main__':
-    generate_index()
+    parser = argparse.ArgumentParser(description='Generate 0-index.html for the archief folder')
+    parser.add_argument('--no-cache', action='store_true', help='re-parse every article, ignoring the metadata cache')
+    parser.add_argument('--jobs', '-j', type=int, default=1, help='parse articles on N processes (0 = all cores)')
+    parser.add_argument('--backend', choices=available_backends(), help='HTML parser backend (default: fastest available)')
+    parser.add_argument('--full-parse', action='store_true', help='build the whole tree for every article')
+    parser.add_argument('--no-stream', action='store_true', help='parse articles into a tree instead of streaming them')
+    parser.add_argument('--columnar', action='store_true', help='write the article shards as dictionary-encoded columns')
+    build_profile.add_arguments(parser)
+    args = parser.parse_args()
+    if args.no_stream:
+        use_streaming(False)
+    if args.full_parse:
+        use_full_parse()
+    if args.backend:
+        use_backend(args.backend)
+    build_profile.run(args, 'archief', generate_index, use_cache=not args.no_cache, jobs=args.jobs, columnar=args.columnar)
@@ -5,6 +5,7 @@ Generate blog/index.html by scanning blog/*.html posts.
 
 from __future__ import annotations
 
+import argparse
 import html
 import re
 from datetime import datetime
@@ -12,10 +13,34 @@ from pathlib import Path
 
 from bs4 import BeautifulSoup
 
+import build_profile
+import collection
+import html_backends
+import search_index
+import site_assets
+import streaming_extract
+from collection import Collection, Extractor, clean_text, extract_image, teaser_paragraphs, trim_teaser
+from html_backends import (
+    available_backends,
+    parse_html,
+    restricted,
+    streaming_enabled,
+    use_backend,
+    use_full_parse,
+    use_streaming,
+)
+from metadata_cache import MetadataCache, extractor_version, shared_cache
+from streaming_extract import Element, StreamExtractor
+
 BLOG_DIR = Path("blog")
 OUTPUT_FILE = BLOG_DIR / "index.html"
 EXCLUDE_FILES = {"index.html"}
 
+# Everything the extractors below look at; the rest of a post is never built into the tree.
+PARSE_TAGS = ("h1", "title", "p", "img", "figcaption")
+PARSE_CLASSES = ("intro-title",)
+PARSE_ONLY = restricted(PARSE_TAGS, PARSE_CLASSES)
+
 MONTHS_NL = [
     "jan", "feb", "mrt", "apr", "mei", "jun",
     "jul", "aug", "sep", "okt", "nov", "dec",
@@ -37,51 +62,12 @@ def format_date_nl(date_str: str | None) -> str:
     return f"{dt.day:02d} {MONTHS_NL[dt.month - 1]} {dt.year}"
 
 
-def clean_text(text: str) -> str:
-    return " ".join(text.split())
-
-
 def extract_title(soup: BeautifulSoup) -> str:
-    title_tag = soup.find("h1")
-    if title_tag and title_tag.get_text(strip=True):
-        return clean_text(title_tag.get_text(strip=True))
-
-    intro_title = soup.select_one(".intro-title")
-    if intro_title and intro_title.get_text(strip=True):
-        return clean_text(intro_title.get_text(strip=True))
-
-    doc_title = soup.find("title")
-    if doc_title and doc_title.get_text(strip=True):
-        return clean_text(doc_title.get_text(strip=True))
-
-    return "Untitled"
+    return collection.extract_title(soup, ".intro-title", "Untitled")
 
 
 def extract_teaser(soup: BeautifulSoup) -> str:
-    for paragraph in soup.find_all("p"):
-        if paragraph.get("class") in (["date"], ["image-caption"]):
-            continue
-        if paragraph.find_parent("figcaption"):
-            continue
-        text = clean_text(paragraph.get_text(" ", strip=True))
-        if len(text) < 80:
-            continue
-        return text
-    return ""
-
-
-def trim_teaser(text: str, limit: int = 200) -> str:
-    if len(text) <= limit:
-        return text
-    truncated = text[:limit].rsplit(" ", 1)[0]
-    return f"{truncated}..."
-
-
-def extract_image(soup: BeautifulSoup) -> str:
-    first_img = soup.find("img")
-    if first_img and first_img.get("src"):
-        return first_img["src"]
-    return ""
+    return next(teaser_paragraphs(soup, 80), "")
 
 
 def infer_badge(title: str) -> str:
@@ -97,11 +83,64 @@ def infer_badge(title: str) -> str:
     return "Log"
 
 
-def extract_post_data(path: Path) -> dict:
-    soup = BeautifulSoup(path.read_text(encoding="utf-8"), "html.parser")
-    title = extract_title(soup)
-    teaser = trim_teaser(extract_teaser(soup))
-    image = extract_image(soup)
+class PostStream(StreamExtractor):
+    """extract_title/extract_teaser/extract_image in one pass, stopping once all three are known."""
+
+    def __init__(self):
+        super().__init__()
+        self.h1: Element | None = None
+        self.intro_title: Element | None = None
+        self.doc_title: Element | None = None
+        self.paragraphs: list[Element] = []
+        self.teaser: str | None = None
+        self.image: str | None = None
+
+    def open_element(self, element: Element) -> None:
+        if element.name == "h1" and self.h1 is None:
+            self.h1 = element.capture()
+        if "intro-title" in element.classes and self.intro_title is None:
+            self.intro_title = element.capture()
+        if element.name == "title" and self.doc_title is None:
+            self.doc_title = element.capture()
+        if element.name == "img" and self.image is None:
+            self.image = element.attrs.get("src", "")
+        if element.name == "p" and self.teaser is None:
+            if element.classes in (["date"], ["image-caption"]) or self.inside("figcaption"):
+                return
+            self.paragraphs.append(element.capture())
+
+    def close_element(self, element: Element) -> None:
+        # Paragraphs can nest, so decide in start order: the first candidate
+        # that is long enough wins, and only closed ones can be judged.
+        while self.teaser is None and self.paragraphs and self.paragraphs[0].closed:
+            text = clean_text(self.paragraphs.pop(0).text(" "))
+            if len(text) >= 80:
+                self.teaser = text
+                self.paragraphs.clear()
+
+    def finish(self) -> None:
+        if self.teaser is None:
+            self.teaser = ""
+        if self.image is None:
+            self.image = ""
+
+    def resolved(self) -> bool:
+        return (
+            self.teaser is not None
+            and self.image is not None
+            and self.h1 is not None
+            and self.h1.closed
+            and bool(self.h1.text())
+        )
+
+    def title(self) -> str:
+        for element in (self.h1, self.intro_title, self.doc_title):
+            if element and element.text():
+                return clean_text(element.text())
+        return "Untitled"
+
+
+def post_data(path: Path, title: str, teaser: str, image: str) -> dict:
     date_str = parse_date_from_filename(path.name)
     return {
         "href": path.name,
@@ -114,6 +153,49 @@ def extract_post_data(path: Path) -> dict:
     }
 
 
+def post_from_stream(stream: PostStream, path: Path) -> dict:
+    return post_data(path, stream.title(), trim_teaser(stream.teaser), stream.image)
+
+
+def extract_post_data(path: Path) -> dict:
+    if streaming_enabled():
+        return post_from_stream(PostStream().run(path), path)
+    soup = parse_html(path.read_text(encoding="utf-8"), only=PARSE_ONLY)
+    return post_data(path, extract_title(soup), trim_teaser(extract_teaser(soup)), extract_image(soup))
+
+
+EXTRACTOR_VERSION = extractor_version(
+    PARSE_TAGS,
+    PARSE_CLASSES,
+    parse_date_from_filename,
+    format_date_nl,
+    clean_text,
+    collection.extract_title,
+    extract_title,
+    teaser_paragraphs,
+    extract_teaser,
+    trim_teaser,
+    extract_image,
+    infer_badge,
+    html_backends,
+    streaming_extract,
+    PostStream,
+    post_data,
+    post_from_stream,
+    extract_post_data,
+)
+
+POST = Extractor("blog", EXTRACTOR_VERSION, extract_post_data, PostStream, post_from_stream)
+
+
+def scan_posts() -> list[Path]:
+    return [path for path in BLOG_DIR.glob("*.html") if path.name not in EXCLUDE_FILES]
+
+
+# Blog posts feed the cards and the search index
+POSTS = Collection("blog", scan_posts, [POST, search_index.BODY_TERMS])
+
+
 def build_cards(posts: list[dict]) -> str:
     cards = []
     for post in posts:
@@ -147,8 +229,243 @@ def build_cards(posts: list[dict]) -> str:
     return "\n\n".join(cards)
 
 
-def build_html(posts: list[dict]) -> str:
+STYLESHEET = """\
+:root {
+    --ink: #0b0f16;
+    --night: #0e1b1f;
+    --fog: #f3f2ec;
+    --glow: #22d3ee;
+    --ember: #ffb000;
+    --acid: #a3e635;
+    --steel: #94a3b8;
+    --card: rgba(15, 23, 42, 0.78);
+    --card-border: rgba(148, 163, 184, 0.35);
+    --shadow: 0 24px 60px rgba(2, 6, 23, 0.55);
+    --grid-gap: clamp(1rem, 3vw, 1.75rem);
+}
+
+* {
+    box-sizing: border-box;
+    margin: 0;
+    padding: 0;
+}
+
+body {
+    font-family: "Space Grotesk", "IBM Plex Mono", "Courier New", monospace;
+    color: var(--fog);
+    background:
+        radial-gradient(1200px 800px at 15% 10%, rgba(34, 211, 238, 0.25), transparent 60%),
+        radial-gradient(1200px 800px at 90% 0%, rgba(255, 176, 0, 0.22), transparent 60%),
+        linear-gradient(120deg, #0a0f14 0%, #0c1820 45%, #111827 100%);
+    min-height: 100vh;
+    padding: clamp(1.2rem, 3vw, 2.5rem);
+    overflow-x: hidden;
+}
+
+body::before {
+    content: "";
+    position: fixed;
+    inset: 0;
+    background-image:
+        linear-gradient(rgba(255, 255, 255, 0.04) 1px, transparent 1px),
+        linear-gradient(90deg, rgba(255, 255, 255, 0.04) 1px, transparent 1px);
+    background-size: 28px 28px;
+    mix-blend-mode: screen;
+    opacity: 0.35;
+    pointer-events: none;
+    z-index: 0;
+}
+
+body::after {
+    content: "";
+    position: fixed;
+    inset: -20% -20% auto -20%;
+    height: 60%;
+    background: radial-gradient(circle at 50% 50%, rgba(163, 230, 53, 0.25), transparent 70%);
+    opacity: 0.2;
+    pointer-events: none;
+    z-index: 0;
+}
+
+.shell {
+    position: relative;
+    z-index: 1;
+    max-width: 1100px;
+    margin: 0 auto;
+}
+
+.hero {
+    border: 1px solid rgba(255, 255, 255, 0.12);
+    padding: clamp(1.5rem, 4vw, 2.8rem);
+    background: linear-gradient(140deg, rgba(10, 20, 28, 0.9), rgba(15, 23, 42, 0.7));
+    box-shadow: var(--shadow);
+    border-radius: 18px;
+    display: grid;
+    gap: 1rem;
+    margin-bottom: clamp(2rem, 4vw, 3rem);
+    animation: rise 0.8s ease-out both;
+}
+
+.hero .kicker {
+    font-family: "IBM Plex Mono", "Courier New", monospace;
+    text-transform: uppercase;
+    letter-spacing: 0.2em;
+    font-size: 0.75rem;
+    color: var(--acid);
+}
+
+.hero h1 {
+    font-size: clamp(2rem, 5vw, 3.4rem);
+    line-height: 1.05;
+    color: var(--fog);
+}
+
+.hero p {
+    color: var(--steel);
+    font-size: clamp(1rem, 2vw, 1.15rem);
+    max-width: 65ch;
+}
+
+.grid {
+    display: grid;
+    grid-template-columns: repeat(auto-fit, minmax(260px, 1fr));
+    gap: var(--grid-gap);
+}
+
+.card {
+    position: relative;
+    display: grid;
+    gap: 1rem;
+    padding: 1.1rem;
+    border-radius: 16px;
+    background: var(--card);
+    border: 1px solid var(--card-border);
+    box-shadow: 0 14px 40px rgba(2, 8, 23, 0.4);
+    text-decoration: none;
+    color: inherit;
+    overflow: hidden;
+    transform: translateY(10px);
+    opacity: 0;
+    animation: float-in 0.7s ease forwards;
+}
+
+.card:nth-child(2) { animation-delay: 0.08s; }
+.card:nth-child(3) { animation-delay: 0.16s; }
+.card:nth-child(4) { animation-delay: 0.24s; }
+
+.thumb {
+    position: relative;
+    width: 100%;
+    aspect-ratio: 16 / 10;
+    border-radius: 12px;
+    overflow: hidden;
+    border: 1px solid rgba(148, 163, 184, 0.35);
+    background: #0f172a;
+}
+
+.thumb img {
+    width: 100%;
+    height: 100%;
+    object-fit: cover;
+    display: block;
+    filter: saturate(1.05);
+    transition: transform 0.4s ease;
+}
+
+.thumb.placeholder {
+    background:
+        linear-gradient(135deg, rgba(34, 211, 238, 0.3), transparent 60%),
+        linear-gradient(180deg, rgba(255, 176, 0, 0.22), transparent 55%),
+        repeating-linear-gradient(90deg, rgba(255, 255, 255, 0.08) 0 1px, transparent 1px 10px);
+    display: grid;
+    place-items: center;
+    color: rgba(243, 242, 236, 0.7);
+    font-family: "IBM Plex Mono", "Courier New", monospace;
+    font-size: 0.85rem;
+    text-transform: uppercase;
+    letter-spacing: 0.12em;
+}
+
+.card:hover .thumb img {
+    transform: scale(1.03);
+}
+
+.meta {
+    display: flex;
+    align-items: center;
+    justify-content: space-between;
+    font-family: "IBM Plex Mono", "Courier New", monospace;
+    font-size: 0.75rem;
+    color: var(--acid);
+    text-transform: uppercase;
+    letter-spacing: 0.18em;
+}
+
+.title {
+    font-size: 1.1rem;
+    font-weight: 700;
+    line-height: 1.25;
+}
+
+.teaser {
+    color: var(--steel);
+    font-size: 0.95rem;
+    line-height: 1.5;
+}
+
+.badge {
+    font-family: "IBM Plex Mono", "Courier New", monospace;
+    font-size: 0.7rem;
+    letter-spacing: 0.1em;
+    text-transform: uppercase;
+    color: var(--ember);
+    border: 1px solid rgba(255, 176, 0, 0.4);
+    padding: 0.25rem 0.5rem;
+    border-radius: 999px;
+    background: rgba(255, 176, 0, 0.12);
+}
+
+.footer {
+    margin-top: clamp(2rem, 4vw, 3rem);
+    color: rgba(148, 163, 184, 0.8);
+    font-size: 0.9rem;
+    font-family: "IBM Plex Mono", "Courier New", monospace;
+    display: flex;
+    justify-content: space-between;
+    flex-wrap: wrap;
+    gap: 0.5rem;
+}
+
+.footer a {
+    color: var(--glow);
+    text-decoration: none;
+}
+
+@keyframes rise {
+    from { transform: translateY(12px); opacity: 0; }
+    to { transform: translateY(0); opacity: 1; }
+}
+
+@keyframes float-in {
+    to { transform: translateY(0); opacity: 1; }
+}
+
+@media (max-width: 720px) {
+    .hero {
+        padding: 1.5rem;
+    }
+
+    .footer {
+        flex-direction: column;
+    }
+}
+"""
+
+
+def build_html(posts: list[dict], search_manifest: Path) -> str:
     cards_html = build_cards(posts)
+    search_form = search_index.search_form(OUTPUT_FILE, search_manifest, "main.grid")
+    stylesheet = site_assets.stylesheet(OUTPUT_FILE, "blog", STYLESHEET)
 
     return f"""<!DOCTYPE html>
 <html lang=\"nl\">
@@ -159,237 +476,7 @@ def build_html(posts: list[dict]) -> str:
 <link rel=\"preconnect\" href=\"https://fonts.googleapis.com\">
 <link rel=\"preconnect\" href=\"https://fonts.gstatic.com\" crossorigin>
 <link href=\"https://fonts.googleapis.com/css2?family=Space+Grotesk:wght@400;600;700&family=IBM+Plex+Mono:wght@400;600&display=swap\" rel=\"stylesheet\">
-<style>
-    :root {{
-        --ink: #0b0f16;
-        --night: #0e1b1f;
-        --fog: #f3f2ec;
-        --glow: #22d3ee;
-        --ember: #ffb000;
-        --acid: #a3e635;
-        --steel: #94a3b8;
-        --card: rgba(15, 23, 42, 0.78);
-        --card-border: rgba(148, 163, 184, 0.35);
-        --shadow: 0 24px 60px rgba(2, 6, 23, 0.55);
-        --grid-gap: clamp(1rem, 3vw, 1.75rem);
-    }}
-
-    * {{
-        box-sizing: border-box;
-        margin: 0;
-        padding: 0;
-    }}
-
-    body {{
-        font-family: "Space Grotesk", "IBM Plex Mono", "Courier New", monospace;
-        color: var(--fog);
-        background:
-            radial-gradient(1200px 800px at 15% 10%, rgba(34, 211, 238, 0.25), transparent 60%),
-            radial-gradient(1200px 800px at 90% 0%, rgba(255, 176, 0, 0.22), transparent 60%),
-            linear-gradient(120deg, #0a0f14 0%, #0c1820 45%, #111827 100%);
-        min-height: 100vh;
-        padding: clamp(1.2rem, 3vw, 2.5rem);
-        overflow-x: hidden;
-    }}
-
-    body::before {{
-        content: "";
-        position: fixed;
-        inset: 0;
-        background-image:
-            linear-gradient(rgba(255, 255, 255, 0.04) 1px, transparent 1px),
-            linear-gradient(90deg, rgba(255, 255, 255, 0.04) 1px, transparent 1px);
-        background-size: 28px 28px;
-        mix-blend-mode: screen;
-        opacity: 0.35;
-        pointer-events: none;
-        z-index: 0;
-    }}
-
-    body::after {{
-        content: "";
-        position: fixed;
-        inset: -20% -20% auto -20%;
-        height: 60%;
-        background: radial-gradient(circle at 50% 50%, rgba(163, 230, 53, 0.25), transparent 70%);
-        opacity: 0.2;
-        pointer-events: none;
-        z-index: 0;
-    }}
-
-    .shell {{
-        position: relative;
-        z-index: 1;
-        max-width: 1100px;
-        margin: 0 auto;
-    }}
-
-    .hero {{
-        border: 1px solid rgba(255, 255, 255, 0.12);
-        padding: clamp(1.5rem, 4vw, 2.8rem);
-        background: linear-gradient(140deg, rgba(10, 20, 28, 0.9), rgba(15, 23, 42, 0.7));
-        box-shadow: var(--shadow);
-        border-radius: 18px;
-        display: grid;
-        gap: 1rem;
-        margin-bottom: clamp(2rem, 4vw, 3rem);
-        animation: rise 0.8s ease-out both;
-    }}
-
-    .hero .kicker {{
-        font-family: "IBM Plex Mono", "Courier New", monospace;
-        text-transform: uppercase;
-        letter-spacing: 0.2em;
-        font-size: 0.75rem;
-        color: var(--acid);
-    }}
-
-    .hero h1 {{
-        font-size: clamp(2rem, 5vw, 3.4rem);
-        line-height: 1.05;
-        color: var(--fog);
-    }}
-
-    .hero p {{
-        color: var(--steel);
-        font-size: clamp(1rem, 2vw, 1.15rem);
-        max-width: 65ch;
-    }}
-
-    .grid {{
-        display: grid;
-        grid-template-columns: repeat(auto-fit, minmax(260px, 1fr));
-        gap: var(--grid-gap);
-    }}
-
-    .card {{
-        position: relative;
-        display: grid;
-        gap: 1rem;
-        padding: 1.1rem;
-        border-radius: 16px;
-        background: var(--card);
-        border: 1px solid var(--card-border);
-        box-shadow: 0 14px 40px rgba(2, 8, 23, 0.4);
-        text-decoration: none;
-        color: inherit;
-        overflow: hidden;
-        transform: translateY(10px);
-        opacity: 0;
-        animation: float-in 0.7s ease forwards;
-    }}
-
-    .card:nth-child(2) {{ animation-delay: 0.08s; }}
-    .card:nth-child(3) {{ animation-delay: 0.16s; }}
-    .card:nth-child(4) {{ animation-delay: 0.24s; }}
-
-    .thumb {{
-        position: relative;
-        width: 100%;
-        aspect-ratio: 16 / 10;
-        border-radius: 12px;
-        overflow: hidden;
-        border: 1px solid rgba(148, 163, 184, 0.35);
-        background: #0f172a;
-    }}
-
-    .thumb img {{
-        width: 100%;
-        height: 100%;
-        object-fit: cover;
-        display: block;
-        filter: saturate(1.05);
-        transition: transform 0.4s ease;
-    }}
-
-    .thumb.placeholder {{
-        background:
-            linear-gradient(135deg, rgba(34, 211, 238, 0.3), transparent 60%),
-            linear-gradient(180deg, rgba(255, 176, 0, 0.22), transparent 55%),
-            repeating-linear-gradient(90deg, rgba(255, 255, 255, 0.08) 0 1px, transparent 1px 10px);
-        display: grid;
-        place-items: center;
-        color: rgba(243, 242, 236, 0.7);
-        font-family: "IBM Plex Mono", "Courier New", monospace;
-        font-size: 0.85rem;
-        text-transform: uppercase;
-        letter-spacing: 0.12em;
-    }}
-
-    .card:hover .thumb img {{
-        transform: scale(1.03);
-    }}
-
-    .meta {{
-        display: flex;
-        align-items: center;
-        justify-content: space-between;
-        font-family: "IBM Plex Mono", "Courier New", monospace;
-        font-size: 0.75rem;
-        color: var(--acid);
-        text-transform: uppercase;
-        letter-spacing: 0.18em;
-    }}
-
-    .title {{
-        font-size: 1.1rem;
-        font-weight: 700;
-        line-height: 1.25;
-    }}
-
-    .teaser {{
-        color: var(--steel);
-        font-size: 0.95rem;
-        line-height: 1.5;
-    }}
-
-    .badge {{
-        font-family: "IBM Plex Mono", "Courier New", monospace;
-        font-size: 0.7rem;
-        letter-spacing: 0.1em;
-        text-transform: uppercase;
-        color: var(--ember);
-        border: 1px solid rgba(255, 176, 0, 0.4);
-        padding: 0.25rem 0.5rem;
-        border-radius: 999px;
-        background: rgba(255, 176, 0, 0.12);
-    }}
-
-    .footer {{
-        margin-top: clamp(2rem, 4vw, 3rem);
-        color: rgba(148, 163, 184, 0.8);
-        font-size: 0.9rem;
-        font-family: "IBM Plex Mono", "Courier New", monospace;
-        display: flex;
-        justify-content: space-between;
-        flex-wrap: wrap;
-        gap: 0.5rem;
-    }}
-
-    .footer a {{
-        color: var(--glow);
-        text-decoration: none;
-    }}
-
-    @keyframes rise {{
-        from {{ transform: translateY(12px); opacity: 0; }}
-        to {{ transform: translateY(0); opacity: 1; }}
-    }}
-
-    @keyframes float-in {{
-        to {{ transform: translateY(0); opacity: 1; }}
-    }}
-
-    @media (max-width: 720px) {{
-        .hero {{
-            padding: 1.5rem;
-        }}
-
-        .footer {{
-            flex-direction: column;
-        }}
-    }}
-</style>
+{stylesheet}
 </head>
 <body>
 <div class=\"shell\">
@@ -399,6 +486,8 @@ def build_html(posts: list[dict]) -> str:
         <p>Een catalogus van herinneringen, storingen en stille upgrades. Proza dat vonkt, logs die ruiken naar regen en ozon. Creative writer energy met hacker pols.</p>
     </header>
 
+{search_form}
+
     <main class=\"grid\">
 {cards_html}
     </main>
@@ -413,19 +502,37 @@ def build_html(posts: list[dict]) -> str:
 """
 
 
-def generate_index() -> None:
-    posts = []
-    for path in BLOG_DIR.glob("*.html"):
-        if path.name in EXCLUDE_FILES:
-            continue
-        posts.append(extract_post_data(path))
-
-    posts.sort(key=lambda item: item["sort_date"], reverse=True)
+def generate_index(use_cache: bool = True, jobs: int = 1, cache: MetadataCache | None = None) -> None:
+    profile = build_profile.current()
+    with shared_cache(cache, use_cache) as cache:
+        records = POSTS.collect(cache, jobs=jobs)
+    records.sort(key=lambda record: record["blog"]["sort_date"], reverse=True)
+    posts = [record["blog"] for record in records]
+    documents = [dict(post, excerpt=post["teaser"]) for post in posts]
+    terms = search_index.document_terms(documents, [record["search"] for record in records])
+    search_manifest = search_index.build("blog", documents, terms)
 
-    html_output = build_html(posts)
-    OUTPUT_FILE.write_text(html_output, encoding="utf-8")
+    with profile.phase("render"):
+        html_output = build_html(posts, search_manifest)
+    with profile.phase("write"):
+        OUTPUT_FILE.write_text(html_output, encoding="utf-8")
+    profile.wrote(OUTPUT_FILE)
 
 
 if __name__ == "__main__":
-    generate_index()
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument("--no-cache", action="store_true", help="re-parse every post, ignoring the metadata cache")
+    parser.add_argument("--jobs", "-j", type=int, default=1, help="parse posts on N processes (0 = all cores)")
+    parser.add_argument("--backend", choices=available_backends(), help="HTML parser backend (default: fastest available)")
+    parser.add_argument("--full-parse", action="store_true", help="build the whole tree for every post")
+    parser.add_argument("--no-stream", action="store_true", help="parse posts into a tree instead of streaming them")
+    build_profile.add_arguments(parser)
+    args = parser.parse_args()
+    if args.no_stream:
+        use_streaming(False)
+    if args.full_parse:
+        use_full_parse()
+    if args.backend:
+        use_backend(args.backend)
+    build_profile.run(args, "blog", generate_index, use_cache=not args.no_cache, jobs=args.jobs)
     print(f"Wrote {OUTPUT_FILE}")
@@ -6,35 +6,36 @@ If a folder contains index.html, it becomes the entry point and its subtree is n
 
 from __future__ import annotations
 
+import argparse
+import gzip
 import html
 from pathlib import Path
-from urllib.parse import quote
+from functools import lru_cache
 import hashlib
 
 from bs4 import BeautifulSoup
 
+import build_profile
+import collection
+import html_backends
+import project_tree
+import site_assets
+from collection import Collection, Extractor, clean_text, extract_image, teaser_paragraphs, trim_teaser
+from html_backends import available_backends, parse_html, restricted, use_backend, use_full_parse
+from metadata_cache import MetadataCache, extractor_version, shared_cache
+
 PROJECTS_DIR = Path("projects")
 OUTPUT_FILE = PROJECTS_DIR / "index.html"
 
-
-def clean_text(text: str) -> str:
-    return " ".join(text.split())
+# Everything the extractors below look at; game pages are mostly inline script
+# and never need to be built into a tree.
+PARSE_TAGS = ("h1", "title", "meta", "p", "img", "figcaption")
+PARSE_CLASSES = ("intro-title", "site-title")
+PARSE_ONLY = restricted(PARSE_TAGS, PARSE_CLASSES)
 
 
 def extract_title(soup: BeautifulSoup) -> str:
-    title_tag = soup.find("h1")
-    if title_tag and title_tag.get_text(strip=True):
-        return clean_text(title_tag.get_text(strip=True))
-
-    intro_title = soup.select_one(".intro-title, .site-title")
-    if intro_title and intro_title.get_text(strip=True):
-        return clean_text(intro_title.get_text(strip=True))
-
-    doc_title = soup.find("title")
-    if doc_title and doc_title.get_text(strip=True):
-        return clean_text(doc_title.get_text(strip=True))
-
-    return "Untitled Project"
+    return collection.extract_title(soup, ".intro-title, .site-title", "Untitled Project")
 
 
 def extract_teaser(soup: BeautifulSoup) -> str:
@@ -56,14 +57,7 @@ def extract_teaser(soup: BeautifulSoup) -> str:
         "copyright",
     }
 
-    for paragraph in soup.find_all("p"):
-        if paragraph.get("class") in (["date"], ["image-caption"]):
-            continue
-        if paragraph.find_parent("figcaption"):
-            continue
-        text = clean_text(paragraph.get_text(" ", strip=True))
-        if len(text) < 70:
-            continue
+    for text in teaser_paragraphs(soup, 70):
         lowered = text.lower()
         if any(marker in lowered for marker in skip_markers):
             continue
@@ -81,47 +75,31 @@ def extract_teaser(soup: BeautifulSoup) -> str:
     return max(candidates, key=score)
 
 
-def trim_teaser(text: str, limit: int = 200) -> str:
-    if len(text) <= limit:
-        return text
-    truncated = text[:limit].rsplit(" ", 1)[0]
-    return f"{truncated}..."
-
-
-def extract_image(soup: BeautifulSoup) -> str:
-    first_img = soup.find("img")
-    if first_img and first_img.get("src"):
-        return first_img["src"]
-    return ""
-
-
-def placeholder_data_uri(title: str, group: str) -> str:
-        seed = f"{group}-{title}".encode("utf-8")
-        digest = hashlib.md5(seed).hexdigest()
-        hue = int(digest[:2], 16) % 360
-        hue2 = (hue + 40) % 360
-        label = f"{group} / {title}"[:42]
-
-        svg = f"""<svg xmlns='http://www.w3.org/2000/svg' width='600' height='375'>
+# Background of a card without an image. The gradient behind it and the text on
+# it are set per card (placeholder()), so every card shares this one file.
+PLACEHOLDER_SVG = """\
+<svg xmlns='http://www.w3.org/2000/svg' width='600' height='375' viewBox='0 0 600 375'>
 <defs>
-    <linearGradient id='g' x1='0' y1='0' x2='1' y2='1'>
-        <stop offset='0%' stop-color='hsl({hue},70%,20%)'/>
-        <stop offset='100%' stop-color='hsl({hue2},80%,30%)'/>
-    </linearGradient>
     <pattern id='grid' width='40' height='40' patternUnits='userSpaceOnUse'>
         <path d='M40 0H0V40' fill='none' stroke='rgba(255,255,255,0.08)' stroke-width='1'/>
     </pattern>
 </defs>
-<rect width='600' height='375' fill='url(#g)'/>
 <rect width='600' height='375' fill='url(#grid)'/>
 <circle cx='470' cy='90' r='80' fill='rgba(255,255,255,0.08)'/>
 <circle cx='130' cy='280' r='120' fill='rgba(255,255,255,0.06)'/>
-<text x='40' y='80' font-family='IBM Plex Mono, monospace' font-size='28' fill='rgba(255,255,255,0.85)'>PROJECT</text>
-<text x='40' y='140' font-family='Space Grotesk, sans-serif' font-size='40' fill='rgba(255,255,255,0.95)'>{html.escape(group)}</text>
-<text x='40' y='210' font-family='Space Grotesk, sans-serif' font-size='22' fill='rgba(255,255,255,0.8)'>{html.escape(label)}</text>
-</svg>"""
+</svg>
+"""
 
-        return f"data:image/svg+xml;utf8,{quote(svg)}"
+
+@lru_cache(maxsize=None)
+def placeholder(title: str, group: str) -> tuple[int, int, str]:
+    """Gradient hues and label of the placeholder thumbnail for a project without an image."""
+    seed = f"{group}-{title}".encode("utf-8")
+    digest = hashlib.md5(seed).hexdigest()
+    hue = int(digest[:2], 16) % 360
+    hue2 = (hue + 40) % 360
+    label = f"{group} / {title}"[:42]
+    return hue, hue2, label
 
 
 def resolve_image_path(index_path: Path, src: str) -> str:
@@ -150,45 +128,66 @@ def format_group_title(group: str) -> str:
     return " ".join(part.capitalize() for part in group.replace("_", " ").replace("-", " ").split())
 
 
-def collect_index_entries() -> list[dict]:
-    entries = []
+def extract_entry_data(index_path: Path) -> dict:
+    soup = parse_html(index_path.read_text(encoding="utf-8"), only=PARSE_ONLY)
+    with build_profile.current().phase("teaser"):
+        teaser = trim_teaser(extract_teaser(soup))
+    return {
+        "title": extract_title(soup),
+        "teaser": teaser,
+        "image": extract_image(soup),
+    }
+
+
+EXTRACTOR_VERSION = extractor_version(
+    PARSE_TAGS,
+    PARSE_CLASSES,
+    html_backends,
+    clean_text,
+    collection.extract_title,
+    extract_title,
+    teaser_paragraphs,
+    extract_teaser,
+    trim_teaser,
+    extract_image,
+    extract_entry_data,
+)
+
+ENTRY = Extractor("projects", EXTRACTOR_VERSION, extract_entry_data)
 
-    def walk(folder: Path) -> None:
-        if folder == PROJECTS_DIR:
-            for child in sorted(folder.iterdir()):
-                if child.is_dir():
-                    walk(child)
-            return
-
-        index_path = folder / "index.html"
-        if index_path.exists():
-            soup = BeautifulSoup(index_path.read_text(encoding="utf-8"), "html.parser")
-            title = extract_title(soup)
-            teaser = trim_teaser(extract_teaser(soup))
-            image = extract_image(soup)
-            group = index_path.parent.relative_to(PROJECTS_DIR).parts[0]
-            resolved_image = resolve_image_path(index_path, image) if image else ""
-            if not resolved_image:
-                resolved_image = placeholder_data_uri(title, group)
-
-            entries.append(
-                {
-                    "href": index_path.relative_to(PROJECTS_DIR).as_posix(),
-                    "title": title,
-                    "teaser": teaser,
-                    "image": resolved_image,
-                    "badge": infer_badge(index_path, title),
-                    "path": index_path.parent.relative_to(PROJECTS_DIR).as_posix(),
-                    "group": group,
-                }
-            )
-            return
 
-        for child in sorted(folder.iterdir()):
-            if child.is_dir():
-                walk(child)
+def find_entry_points(folder: Path = PROJECTS_DIR) -> list[Path]:
+    return project_tree.entry_points(folder)
+
+
+ENTRY_POINTS = Collection("projects", find_entry_points, [ENTRY])
+
+
+def collect_index_entries(cache: MetadataCache | None = None, jobs: int = 1) -> list[dict]:
+    entries = []
+    cache = cache or MetadataCache(None)
+
+    for index_path, record in ENTRY_POINTS.collect_with_paths(cache, jobs):
+        data = record["projects"]
+        title = data["title"]
+        teaser = data["teaser"]
+        image = data["image"]
+        group = index_path.parent.relative_to(PROJECTS_DIR).parts[0]
+        resolved_image = resolve_image_path(index_path, image) if image else ""
+
+        entries.append(
+            {
+                "href": index_path.relative_to(PROJECTS_DIR).as_posix(),
+                "title": title,
+                "teaser": teaser,
+                "image": resolved_image,
+                "placeholder": None if resolved_image else placeholder(title, group),
+                "badge": infer_badge(index_path, title),
+                "path": index_path.parent.relative_to(PROJECTS_DIR).as_posix(),
+                "group": group,
+            }
+        )
 
-    walk(PROJECTS_DIR)
     return entries
 
 
@@ -201,12 +200,22 @@ def build_cards(entries: list[dict]) -> str:
         badge = html.escape(entry["badge"])
         path = html.escape(entry["path"])
 
-        image = html.escape(entry["image"])
-        thumb_html = (
-            f"<div class=\"thumb\">\n"
-            f"    <img src=\"{image}\" alt=\"{title}\">\n"
-            f"</div>"
-        )
+        if entry["placeholder"]:
+            hue, hue2, label = entry["placeholder"]
+            thumb_html = (
+                f"<div class=\"thumb generated\" style=\"--hue: {hue}; --hue2: {hue2}\" role=\"img\" aria-label=\"{title}\">\n"
+                f"    <span class=\"ph-kicker\">PROJECT</span>\n"
+                f"    <span class=\"ph-group\">{html.escape(entry['group'])}</span>\n"
+                f"    <span class=\"ph-label\">{html.escape(label)}</span>\n"
+                f"</div>"
+            )
+        else:
+            image = html.escape(entry["image"])
+            thumb_html = (
+                f"<div class=\"thumb\">\n"
+                f"    <img src=\"{image}\" alt=\"{title}\">\n"
+                f"</div>"
+            )
 
         cards.append(
             f"""        <a class=\"card\" href=\"{href}\">
@@ -243,8 +252,326 @@ def build_grouped_sections(entries: list[dict]) -> str:
     return "\n\n".join(sections)
 
 
+STYLESHEET = """\
+:root {
+    --ink: #070a0f;
+    --night: #0b111a;
+    --fog: #e7f7f2;
+    --glow: #00f6ff;
+    --ember: #ffb100;
+    --acid: #39ff14;
+    --steel: #8aa2b5;
+    --card: rgba(8, 16, 26, 0.82);
+    --card-border: rgba(57, 255, 20, 0.25);
+    --shadow: 0 26px 70px rgba(0, 6, 12, 0.6);
+    --grid-gap: clamp(1rem, 3vw, 1.75rem);
+}
+
+* {
+    box-sizing: border-box;
+    margin: 0;
+    padding: 0;
+}
+
+body {
+    font-family: "Space Grotesk", "IBM Plex Mono", "Share Tech Mono", "Courier New", monospace;
+    color: var(--fog);
+    background:
+        radial-gradient(900px 700px at 12% 12%, rgba(0, 246, 255, 0.25), transparent 62%),
+        radial-gradient(900px 700px at 90% 5%, rgba(255, 177, 0, 0.18), transparent 60%),
+        linear-gradient(130deg, #04070c 0%, #0a111c 45%, #0c1a22 100%);
+    min-height: 100vh;
+    padding: clamp(1.2rem, 3vw, 2.5rem);
+    overflow-x: hidden;
+}
+
+body::before {
+    content: "";
+    position: fixed;
+    inset: 0;
+    background-image: linear-gradient(
+        rgba(255, 255, 255, 0.05) 1px,
+        transparent 1px
+    );
+    background-size: 100% 3px;
+    mix-blend-mode: screen;
+    opacity: 0.2;
+    pointer-events: none;
+    z-index: 0;
+}
+
+body::after {
+    content: "";
+    position: fixed;
+    inset: 0;
+    background:
+        linear-gradient(90deg, rgba(0, 246, 255, 0.05), transparent 40%),
+        radial-gradient(circle at 70% 20%, rgba(57, 255, 20, 0.18), transparent 55%);
+    opacity: 0.35;
+    pointer-events: none;
+    z-index: 0;
+}
+
+.noise {
+    position: fixed;
+    inset: 0;
+    background-image: url("data:image/svg+xml;utf8,<svg xmlns='http://www.w3.org/2000/svg' width='120' height='120'><filter id='n'><feTurbulence type='fractalNoise' baseFrequency='0.9' numOctaves='2' stitchTiles='stitch'/></filter><rect width='120' height='120' filter='url(%23n)' opacity='0.08'/></svg>");
+    mix-blend-mode: soft-light;
+    opacity: 0.15;
+    pointer-events: none;
+    z-index: 0;
+}
+
+.shell {
+    position: relative;
+    z-index: 1;
+    max-width: 1100px;
+    margin: 0 auto;
+}
+
+.hero {
+    border: 1px solid rgba(255, 255, 255, 0.12);
+    padding: clamp(1.5rem, 4vw, 2.8rem);
+    background: linear-gradient(145deg, rgba(5, 12, 20, 0.95), rgba(10, 20, 32, 0.8));
+    box-shadow: var(--shadow);
+    border-radius: 18px;
+    display: grid;
+    gap: 1rem;
+    margin-bottom: clamp(2rem, 4vw, 3rem);
+    animation: rise 0.8s ease-out both;
+}
+
+.hero .kicker {
+    font-family: "Share Tech Mono", "IBM Plex Mono", "Courier New", monospace;
+    text-transform: uppercase;
+    letter-spacing: 0.2em;
+    font-size: 0.75rem;
+    color: var(--acid);
+    text-shadow: 0 0 10px rgba(57, 255, 20, 0.5);
+}
+
+.hero h1 {
+    font-size: clamp(2rem, 5vw, 3.4rem);
+    line-height: 1.05;
+    color: var(--fog);
+    text-shadow: 0 0 18px rgba(0, 246, 255, 0.35);
+}
+
+.hero p {
+    color: var(--steel);
+    font-size: clamp(1rem, 2vw, 1.15rem);
+    max-width: 65ch;
+}
+
+.grid {
+    display: grid;
+    grid-template-columns: repeat(auto-fit, minmax(260px, 1fr));
+    gap: var(--grid-gap);
+}
+
+.group {
+    display: grid;
+    gap: 1.25rem;
+    margin-bottom: clamp(2rem, 4vw, 3rem);
+}
+
+.group-title {
+    font-size: clamp(1.2rem, 2.5vw, 1.6rem);
+    letter-spacing: 0.14em;
+    text-transform: uppercase;
+    color: var(--acid);
+    font-family: "IBM Plex Mono", "Courier New", monospace;
+    padding-bottom: 0.4rem;
+    border-bottom: 1px solid rgba(148, 163, 184, 0.35);
+}
+
+.card {
+    position: relative;
+    display: grid;
+    gap: 1rem;
+    padding: 1.1rem;
+    border-radius: 16px;
+    background: var(--card);
+    border: 1px solid var(--card-border);
+    box-shadow: 0 18px 45px rgba(0, 12, 20, 0.45);
+    text-decoration: none;
+    color: inherit;
+    overflow: hidden;
+    transform: translateY(10px);
+    opacity: 0;
+    animation: float-in 0.7s ease forwards;
+}
+
+.card:nth-child(2) { animation-delay: 0.08s; }
+.card:nth-child(3) { animation-delay: 0.16s; }
+.card:nth-child(4) { animation-delay: 0.24s; }
+
+.thumb {
+    position: relative;
+    width: 100%;
+    aspect-ratio: 16 / 10;
+    border-radius: 12px;
+    overflow: hidden;
+    border: 1px solid rgba(57, 255, 20, 0.25);
+    background: #070f18;
+}
+
+.thumb img {
+    width: 100%;
+    height: 100%;
+    object-fit: cover;
+    display: block;
+    filter: saturate(1.05);
+    transition: transform 0.4s ease;
+}
+
+.thumb.placeholder {
+    background:
+        linear-gradient(135deg, rgba(34, 211, 238, 0.3), transparent 60%),
+        linear-gradient(180deg, rgba(255, 176, 0, 0.22), transparent 55%),
+        repeating-linear-gradient(90deg, rgba(255, 255, 255, 0.08) 0 1px, transparent 1px 10px);
+    display: grid;
+    place-items: center;
+    color: rgba(243, 242, 236, 0.7);
+    font-family: "IBM Plex Mono", "Courier New", monospace;
+    font-size: 0.85rem;
+    text-transform: uppercase;
+    letter-spacing: 0.12em;
+}
+
+/* Projects without an image; PLACEHOLDER_SVG is replaced by the shared
+   placeholder file, which sits next to this stylesheet */
+.thumb.generated {
+    container-type: inline-size;
+    background:
+        url("PLACEHOLDER_SVG") center / cover,
+        linear-gradient(135deg, hsl(var(--hue), 70%, 20%), hsl(var(--hue2), 80%, 30%));
+}
+
+.thumb.generated span {
+    position: absolute;
+    left: 6.667cqw;
+    white-space: nowrap;
+    line-height: 1;
+}
+
+.thumb.generated .ph-kicker {
+    top: 9.667cqw;
+    font-family: "IBM Plex Mono", monospace;
+    font-size: 4.667cqw;
+    color: rgba(255, 255, 255, 0.85);
+}
+
+.thumb.generated .ph-group {
+    top: 18cqw;
+    font-family: "Space Grotesk", sans-serif;
+    font-size: 6.667cqw;
+    color: rgba(255, 255, 255, 0.95);
+}
+
+.thumb.generated .ph-label {
+    top: 32cqw;
+    font-family: "Space Grotesk", sans-serif;
+    font-size: 3.667cqw;
+    color: rgba(255, 255, 255, 0.8);
+}
+
+.card:hover .thumb img {
+    transform: scale(1.03);
+}
+
+.meta {
+    display: flex;
+    align-items: center;
+    justify-content: space-between;
+    font-family: "Share Tech Mono", "IBM Plex Mono", "Courier New", monospace;
+    font-size: 0.75rem;
+    color: var(--acid);
+    text-transform: uppercase;
+    letter-spacing: 0.18em;
+    gap: 0.75rem;
+}
+
+.meta .path {
+    color: var(--steel);
+    font-size: 0.7rem;
+    text-transform: none;
+    letter-spacing: 0.08em;
+}
+
+.title {
+    font-size: 1.1rem;
+    font-weight: 700;
+    line-height: 1.25;
+}
+
+.teaser {
+    color: var(--steel);
+    font-size: 0.95rem;
+    line-height: 1.5;
+}
+
+.badge {
+    font-family: "Share Tech Mono", "IBM Plex Mono", "Courier New", monospace;
+    font-size: 0.7rem;
+    letter-spacing: 0.1em;
+    text-transform: uppercase;
+    color: var(--ember);
+    border: 1px solid rgba(255, 177, 0, 0.5);
+    padding: 0.25rem 0.5rem;
+    border-radius: 999px;
+    background: rgba(255, 177, 0, 0.12);
+    white-space: nowrap;
+}
+
+.footer {
+    margin-top: clamp(2rem, 4vw, 3rem);
+    color: rgba(148, 163, 184, 0.8);
+    font-size: 0.9rem;
+    font-family: "Share Tech Mono", "IBM Plex Mono", "Courier New", monospace;
+    display: flex;
+    justify-content: space-between;
+    flex-wrap: wrap;
+    gap: 0.5rem;
+}
+
+.footer a {
+    color: var(--glow);
+    text-decoration: none;
+}
+
+@keyframes rise {
+    from { transform: translateY(12px); opacity: 0; }
+    to { transform: translateY(0); opacity: 1; }
+}
+
+@keyframes float-in {
+    to { transform: translateY(0); opacity: 1; }
+}
+
+@media (max-width: 720px) {
+    .hero {
+        padding: 1.5rem;
+    }
+
+    .footer {
+        flex-direction: column;
+    }
+
+    .meta {
+        flex-direction: column;
+        align-items: flex-start;
+    }
+}
+"""
+
+
 def build_html(entries: list[dict]) -> str:
     sections_html = build_grouped_sections(entries)
+    placeholder_svg = site_assets.publish("project-placeholder", ".svg", PLACEHOLDER_SVG)
+    stylesheet = site_assets.stylesheet(
+        OUTPUT_FILE, "projects", STYLESHEET.replace("PLACEHOLDER_SVG", placeholder_svg.name)
+    )
 
     return f"""<!DOCTYPE html>
 <html lang=\"nl\">
@@ -255,281 +582,7 @@ def build_html(entries: list[dict]) -> str:
 <link rel=\"preconnect\" href=\"https://fonts.googleapis.com\">
 <link rel=\"preconnect\" href=\"https://fonts.gstatic.com\" crossorigin>
 <link href="https://fonts.googleapis.com/css2?family=Space+Grotesk:wght@400;600;700&family=IBM+Plex+Mono:wght@400;600&family=Share+Tech+Mono&display=swap" rel="stylesheet">
-<style>
-    :root {{
-        --ink: #070a0f;
-        --night: #0b111a;
-        --fog: #e7f7f2;
-        --glow: #00f6ff;
-        --ember: #ffb100;
-        --acid: #39ff14;
-        --steel: #8aa2b5;
-        --card: rgba(8, 16, 26, 0.82);
-        --card-border: rgba(57, 255, 20, 0.25);
-        --shadow: 0 26px 70px rgba(0, 6, 12, 0.6);
-        --grid-gap: clamp(1rem, 3vw, 1.75rem);
-    }}
-
-    * {{
-        box-sizing: border-box;
-        margin: 0;
-        padding: 0;
-    }}
-
-    body {{
-        font-family: "Space Grotesk", "IBM Plex Mono", "Share Tech Mono", "Courier New", monospace;
-        color: var(--fog);
-        background:
-            radial-gradient(900px 700px at 12% 12%, rgba(0, 246, 255, 0.25), transparent 62%),
-            radial-gradient(900px 700px at 90% 5%, rgba(255, 177, 0, 0.18), transparent 60%),
-            linear-gradient(130deg, #04070c 0%, #0a111c 45%, #0c1a22 100%);
-        min-height: 100vh;
-        padding: clamp(1.2rem, 3vw, 2.5rem);
-        overflow-x: hidden;
-    }}
-
-    body::before {{
-        content: "";
-        position: fixed;
-        inset: 0;
-        background-image: linear-gradient(
-            rgba(255, 255, 255, 0.05) 1px,
-            transparent 1px
-        );
-        background-size: 100% 3px;
-        mix-blend-mode: screen;
-        opacity: 0.2;
-        pointer-events: none;
-        z-index: 0;
-    }}
-
-    body::after {{
-        content: "";
-        position: fixed;
-        inset: 0;
-        background:
-            linear-gradient(90deg, rgba(0, 246, 255, 0.05), transparent 40%),
-            radial-gradient(circle at 70% 20%, rgba(57, 255, 20, 0.18), transparent 55%);
-        opacity: 0.35;
-        pointer-events: none;
-        z-index: 0;
-    }}
-
-    .noise {{
-        position: fixed;
-        inset: 0;
-        background-image: url("data:image/svg+xml;utf8,<svg xmlns='http://www.w3.org/2000/svg' width='120' height='120'><filter id='n'><feTurbulence type='fractalNoise' baseFrequency='0.9' numOctaves='2' stitchTiles='stitch'/></filter><rect width='120' height='120' filter='url(%23n)' opacity='0.08'/></svg>");
-        mix-blend-mode: soft-light;
-        opacity: 0.15;
-        pointer-events: none;
-        z-index: 0;
-    }}
-
-    .shell {{
-        position: relative;
-        z-index: 1;
-        max-width: 1100px;
-        margin: 0 auto;
-    }}
-
-    .hero {{
-        border: 1px solid rgba(255, 255, 255, 0.12);
-        padding: clamp(1.5rem, 4vw, 2.8rem);
-        background: linear-gradient(145deg, rgba(5, 12, 20, 0.95), rgba(10, 20, 32, 0.8));
-        box-shadow: var(--shadow);
-        border-radius: 18px;
-        display: grid;
-        gap: 1rem;
-        margin-bottom: clamp(2rem, 4vw, 3rem);
-        animation: rise 0.8s ease-out both;
-    }}
-
-    .hero .kicker {{
-        font-family: "Share Tech Mono", "IBM Plex Mono", "Courier New", monospace;
-        text-transform: uppercase;
-        letter-spacing: 0.2em;
-        font-size: 0.75rem;
-        color: var(--acid);
-        text-shadow: 0 0 10px rgba(57, 255, 20, 0.5);
-    }}
-
-    .hero h1 {{
-        font-size: clamp(2rem, 5vw, 3.4rem);
-        line-height: 1.05;
-        color: var(--fog);
-        text-shadow: 0 0 18px rgba(0, 246, 255, 0.35);
-    }}
-
-    .hero p {{
-        color: var(--steel);
-        font-size: clamp(1rem, 2vw, 1.15rem);
-        max-width: 65ch;
-    }}
-
-    .grid {{
-        display: grid;
-        grid-template-columns: repeat(auto-fit, minmax(260px, 1fr));
-        gap: var(--grid-gap);
-    }}
-
-    .group {{
-        display: grid;
-        gap: 1.25rem;
-        margin-bottom: clamp(2rem, 4vw, 3rem);
-    }}
-
-    .group-title {{
-        font-size: clamp(1.2rem, 2.5vw, 1.6rem);
-        letter-spacing: 0.14em;
-        text-transform: uppercase;
-        color: var(--acid);
-        font-family: "IBM Plex Mono", "Courier New", monospace;
-        padding-bottom: 0.4rem;
-        border-bottom: 1px solid rgba(148, 163, 184, 0.35);
-    }}
-
-    .card {{
-        position: relative;
-        display: grid;
-        gap: 1rem;
-        padding: 1.1rem;
-        border-radius: 16px;
-        background: var(--card);
-        border: 1px solid var(--card-border);
-        box-shadow: 0 18px 45px rgba(0, 12, 20, 0.45);
-        text-decoration: none;
-        color: inherit;
-        overflow: hidden;
-        transform: translateY(10px);
-        opacity: 0;
-        animation: float-in 0.7s ease forwards;
-    }}
-
-    .card:nth-child(2) {{ animation-delay: 0.08s; }}
-    .card:nth-child(3) {{ animation-delay: 0.16s; }}
-    .card:nth-child(4) {{ animation-delay: 0.24s; }}
-
-    .thumb {{
-        position: relative;
-        width: 100%;
-        aspect-ratio: 16 / 10;
-        border-radius: 12px;
-        overflow: hidden;
-        border: 1px solid rgba(57, 255, 20, 0.25);
-        background: #070f18;
-    }}
-
-    .thumb img {{
-        width: 100%;
-        height: 100%;
-        object-fit: cover;
-        display: block;
-        filter: saturate(1.05);
-        transition: transform 0.4s ease;
-    }}
-
-    .thumb.placeholder {{
-        background:
-            linear-gradient(135deg, rgba(34, 211, 238, 0.3), transparent 60%),
-            linear-gradient(180deg, rgba(255, 176, 0, 0.22), transparent 55%),
-            repeating-linear-gradient(90deg, rgba(255, 255, 255, 0.08) 0 1px, transparent 1px 10px);
-        display: grid;
-        place-items: center;
-        color: rgba(243, 242, 236, 0.7);
-        font-family: "IBM Plex Mono", "Courier New", monospace;
-        font-size: 0.85rem;
-        text-transform: uppercase;
-        letter-spacing: 0.12em;
-    }}
-
-    .card:hover .thumb img {{
-        transform: scale(1.03);
-    }}
-
-    .meta {{
-        display: flex;
-        align-items: center;
-        justify-content: space-between;
-        font-family: "Share Tech Mono", "IBM Plex Mono", "Courier New", monospace;
-        font-size: 0.75rem;
-        color: var(--acid);
-        text-transform: uppercase;
-        letter-spacing: 0.18em;
-        gap: 0.75rem;
-    }}
-
-    .meta .path {{
-        color: var(--steel);
-        font-size: 0.7rem;
-        text-transform: none;
-        letter-spacing: 0.08em;
-    }}
-
-    .title {{
-        font-size: 1.1rem;
-        font-weight: 700;
-        line-height: 1.25;
-    }}
-
-    .teaser {{
-        color: var(--steel);
-        font-size: 0.95rem;
-        line-height: 1.5;
-    }}
-
-    .badge {{
-        font-family: "Share Tech Mono", "IBM Plex Mono", "Courier New", monospace;
-        font-size: 0.7rem;
-        letter-spacing: 0.1em;
-        text-transform: uppercase;
-        color: var(--ember);
-        border: 1px solid rgba(255, 177, 0, 0.5);
-        padding: 0.25rem 0.5rem;
-        border-radius: 999px;
-        background: rgba(255, 177, 0, 0.12);
-        white-space: nowrap;
-    }}
-
-    .footer {{
-        margin-top: clamp(2rem, 4vw, 3rem);
-        color: rgba(148, 163, 184, 0.8);
-        font-size: 0.9rem;
-        font-family: "Share Tech Mono", "IBM Plex Mono", "Courier New", monospace;
-        display: flex;
-        justify-content: space-between;
-        flex-wrap: wrap;
-        gap: 0.5rem;
-    }}
-
-    .footer a {{
-        color: var(--glow);
-        text-decoration: none;
-    }}
-
-    @keyframes rise {{
-        from {{ transform: translateY(12px); opacity: 0; }}
-        to {{ transform: translateY(0); opacity: 1; }}
-    }}
-
-    @keyframes float-in {{
-        to {{ transform: translateY(0); opacity: 1; }}
-    }}
-
-    @media (max-width: 720px) {{
-        .hero {{
-            padding: 1.5rem;
-        }}
-
-        .footer {{
-            flex-direction: column;
-        }}
-
-        .meta {{
-            flex-direction: column;
-            align-items: flex-start;
-        }}
-    }}
-</style>
+{stylesheet}
 </head>
 <body>
 <div class=\"noise\"></div>
@@ -554,12 +607,45 @@ def build_html(entries: list[dict]) -> str:
 """
 
 
-def generate_index() -> None:
-    entries = collect_index_entries()
-    entries.sort(key=lambda item: (item["group"].lower(), item["path"].lower()))
-    OUTPUT_FILE.write_text(build_html(entries), encoding="utf-8")
+def page_size(path: Path) -> tuple[int, int] | None:
+    """Raw and gzipped size of a written page, or None if there is none yet."""
+    try:
+        data = path.read_bytes()
+    except OSError:
+        return None
+    return len(data), len(gzip.compress(data, 9))
+
+
+def generate_index(use_cache: bool = True, jobs: int = 1, cache: MetadataCache | None = None) -> None:
+    profile = build_profile.current()
+    with shared_cache(cache, use_cache) as cache:
+        entries = collect_index_entries(cache, jobs)
+    with profile.phase("render"):
+        entries.sort(key=lambda item: (item["group"].lower(), item["path"].lower()))
+        html_output = build_html(entries)
+    with profile.phase("write"):
+        OUTPUT_FILE.write_text(html_output, encoding="utf-8")
+    profile.wrote(OUTPUT_FILE)
 
 
 if __name__ == "__main__":
-    generate_index()
-    print(f"Wrote {OUTPUT_FILE}")
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--no-cache", action="store_true", help="re-parse every entry point, ignoring the metadata cache")
+    parser.add_argument("--jobs", "-j", type=int, default=1, help="parse entry points on N processes (0 = all cores)")
+    parser.add_argument("--backend", choices=available_backends(), help="HTML parser backend (default: fastest available)")
+    parser.add_argument("--full-parse", action="store_true", help="build the whole tree for every page")
+    build_profile.add_arguments(parser)
+    args = parser.parse_args()
+    if args.full_parse:
+        use_full_parse()
+    if args.backend:
+        use_backend(args.backend)
+    before = page_size(OUTPUT_FILE)
+    build_profile.run(args, "projects", generate_index, use_cache=not args.no_cache, jobs=args.jobs)
+    after = page_size(OUTPUT_FILE)
+    print(f"Wrote {OUTPUT_FILE} ({after[0] / 1024:.1f} KB, {after[1] / 1024:.1f} KB gzip)")
+    if before is not None and before != after:
+        change = after[0] - before[0]
+        share = f" ({abs(change) / before[0]:.1%})" if before[0] else ""
+        print(f"  was {before[0] / 1024:.1f} KB ({before[1] / 1024:.1f} KB gzip): "
+              f"{abs(change) / 1024:.1f} KB{share} {'larger' if change > 0 else 'smaller'}")
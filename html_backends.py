@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+HTML parser backends for the index generators' metadata extraction.
+
+The extractors are written against the BeautifulSoup API, so a backend is a
+BeautifulSoup tree builder: lxml (C, several times faster) when it is installed,
+the pure-Python html.parser otherwise. SITE_HTML_BACKEND overrides the choice;
+it is an environment variable so --jobs worker processes inherit it.
+
+Extractors can also ask for a restricted parse: only the tags and classes they
+read are built into the tree, everything else (including script, style and svg
+bodies) is tokenized and dropped. SITE_HTML_FULL_PARSE=1 turns this off.
+Extractors that have a streaming_extract variant use it unless
+SITE_HTML_NO_STREAM=1 or a full parse is requested.
+
+Run this file to check that every extractor gives the same result on every
+available backend, restricted or not, over all HTML in the repository.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+from pathlib import Path
+
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.builder import builder_registry
+
+BACKENDS = ("lxml", "html.parser")
+BACKEND_ENV = "SITE_HTML_BACKEND"
+FULL_PARSE_ENV = "SITE_HTML_FULL_PARSE"
+NO_STREAM_ENV = "SITE_HTML_NO_STREAM"
+
+
+def available_backends() -> list[str]:
+    return [name for name in BACKENDS if builder_registry.lookup(name) is not None]
+
+
+def default_backend() -> str:
+    requested = os.environ.get(BACKEND_ENV)
+    if requested:
+        return requested
+    return available_backends()[0]
+
+
+def use_backend(name: str) -> None:
+    if name not in available_backends():
+        raise ValueError(f"HTML backend {name!r} is not available (have: {', '.join(available_backends())})")
+    os.environ[BACKEND_ENV] = name
+
+
+def use_full_parse(enabled: bool = True) -> None:
+    if enabled:
+        os.environ[FULL_PARSE_ENV] = "1"
+    else:
+        os.environ.pop(FULL_PARSE_ENV, None)
+
+
+def use_streaming(enabled: bool = True) -> None:
+    if enabled:
+        os.environ.pop(NO_STREAM_ENV, None)
+    else:
+        os.environ[NO_STREAM_ENV] = "1"
+
+
+def streaming_enabled() -> bool:
+    return not (os.environ.get(NO_STREAM_ENV) or os.environ.get(FULL_PARSE_ENV))
+
+
+class RestrictedStrainer(SoupStrainer):
+    """Keep elements named in tags or carrying one of classes, with their subtrees.
+
+    A plain SoupStrainer ANDs name and attribute rules, so the OR is done in a
+    predicate. Older bs4 releases call it as a name rule with (name, attrs);
+    bs4 >= 4.13 asks allow_tag_creation() instead.
+    """
+
+    def __init__(self, tags: tuple[str, ...], classes: tuple[str, ...] = ()):
+        self.wanted_tags = frozenset(tags)
+        self.wanted_classes = frozenset(classes)
+        super().__init__(self.keep)
+
+    def keep(self, name, attrs=None) -> bool:
+        if attrs is None and hasattr(name, "attrs"):
+            name, attrs = name.name, name.attrs
+        if name in self.wanted_tags:
+            return True
+        classes = (attrs or {}).get("class") or ()
+        if isinstance(classes, str):
+            classes = classes.split()
+        return not self.wanted_classes.isdisjoint(classes)
+
+    def allow_tag_creation(self, nsprefix, name, attrs) -> bool:
+        return self.keep(name, attrs)
+
+
+def restricted(tags: tuple[str, ...], classes: tuple[str, ...] = ()) -> SoupStrainer:
+    return RestrictedStrainer(tags, classes)
+
+
+def parse_html(markup: str, backend: str | None = None, only: SoupStrainer | None = None) -> BeautifulSoup:
+    if os.environ.get(FULL_PARSE_ENV):
+        only = None
+    return BeautifulSoup(markup, backend or default_backend(), parse_only=only)
+
+
+def repo_html_files(root: Path = Path(".")) -> list[Path]:
+    found = []
+    for folder, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(name for name in dirnames if not name.startswith("."))
+        found.extend(Path(folder) / name for name in sorted(filenames) if name.endswith(".html"))
+    return found
+
+
+def extract_all(path: Path) -> dict:
+    # Imported here: the generators import this module.
+    import generate_archief_index
+    import generate_blog_index
+    import generate_projects_index
+
+    return {
+        "blog": generate_blog_index.extract_post_data(path),
+        "projects": generate_projects_index.extract_entry_data(path),
+        "archief": generate_archief_index.extract_article_metadata(str(path)),
+    }
+
+
+def check_parity(paths: list[Path]) -> int:
+    # The reference is a full html.parser tree, i.e. what the generators built
+    # before backends, restricted parsing and streaming existed.
+    modes = [(backend, "full") for backend in reversed(available_backends())]
+    modes += [(backend, "restricted") for backend in reversed(available_backends())]
+    modes.append((available_backends()[0], "stream"))
+    labels = [f"{backend}+{mode}" for backend, mode in modes]
+    mismatches = 0
+    for path in paths:
+        results = []
+        for backend, mode in modes:
+            use_backend(backend)
+            use_full_parse(mode == "full")
+            use_streaming(mode == "stream")
+            results.append(extract_all(path))
+        reference = results[0]
+        for label, result in zip(labels[1:], results[1:]):
+            for field, value in result.items():
+                if value != reference[field]:
+                    mismatches += 1
+                    print(f"✗ {path} [{field}] {labels[0]}={reference[field]!r} {label}={value!r}")
+    print(f"Checked {len(paths)} files on {', '.join(labels)}: {mismatches} mismatch(es)")
+    return mismatches
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Check extractor parity across HTML backends.")
+    parser.add_argument("paths", nargs="*", type=Path, help="HTML files to check (default: whole repository)")
+    args = parser.parse_args()
+    raise SystemExit(1 if check_parity(args.paths or repo_html_files()) else 0)
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Persistent cache for metadata extracted from HTML files by the index generators.
+
+Entries live in a SQLite database keyed by namespace and path. A hit needs the
+same size and mtime, or failing that the same content hash, plus the same
+extractor version. The version is a hash of the source of the extraction
+functions, so editing an extractor invalidates its entries automatically.
+
+collection.collect() looks up a whole batch and extracts the misses with
+extract_paths(), on a process pool for --jobs; results come back in input
+order so the generators' output does not depend on --jobs.
+
+An instance also keeps what it has seen in memory, keyed on size and mtime, so a
+long-lived cache (as used by watch_site.py) answers repeat lookups without
+touching SQLite. Generators accept such a cache through shared_cache().
+"""
+
+from __future__ import annotations
+
+import hashlib
+import inspect
+import json
+import os
+import sqlite3
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from types import ModuleType
+from typing import Callable, Iterator
+
+import build_profile
+
+CACHE_FILE = Path(".metadata-cache.sqlite")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    namespace TEXT NOT NULL,
+    path TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    sha256 TEXT NOT NULL,
+    version TEXT NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (namespace, path)
+)
+"""
+
+
+def extractor_version(*parts: Callable | ModuleType | tuple) -> str:
+    """Hash the source of extraction functions and modules, and repr of constant tuples."""
+    digest = hashlib.sha256()
+    for part in parts:
+        source = inspect.getsource(part) if callable(part) or inspect.ismodule(part) else repr(part)
+        digest.update(source.encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+class MetadataCache:
+    """Look up extracted metadata, running the extractor only on a miss.
+
+    Pass db_path=None to disable caching; lookups then always extract.
+    """
+
+    def __init__(self, db_path: Path | None = CACHE_FILE):
+        self.db = sqlite3.connect(db_path) if db_path is not None else None
+        if self.db is not None:
+            self.db.execute(SCHEMA)
+        self.memory: dict[tuple[str, str], tuple[int, int, str, dict]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __enter__(self) -> MetadataCache:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def commit(self) -> None:
+        if self.db is not None:
+            self.db.commit()
+
+    def close(self) -> None:
+        if self.db is not None:
+            self.db.commit()
+            self.db.close()
+            self.db = None
+
+    def get(self, namespace: str, path: Path, version: str) -> dict | None:
+        if self.db is None:
+            return None
+        key = path.as_posix()
+        st = path.stat()
+        remembered = self.memory.get((namespace, key))
+        if remembered and remembered[:3] == (st.st_size, st.st_mtime_ns, version):
+            return remembered[3]
+
+        row = self.db.execute(
+            "SELECT size, mtime_ns, sha256, version, data FROM entries WHERE namespace = ? AND path = ?",
+            (namespace, key),
+        ).fetchone()
+        if row is None or row[3] != version:
+            return None
+
+        if row[0] != st.st_size or row[1] != st.st_mtime_ns:
+            # Touched but possibly unchanged: compare content before giving up.
+            if hashlib.sha256(path.read_bytes()).hexdigest() != row[2]:
+                return None
+            self.db.execute(
+                "UPDATE entries SET size = ?, mtime_ns = ? WHERE namespace = ? AND path = ?",
+                (st.st_size, st.st_mtime_ns, namespace, key),
+            )
+        data = json.loads(row[4])
+        self.memory[(namespace, key)] = (st.st_size, st.st_mtime_ns, version, data)
+        return data
+
+    def put(self, namespace: str, path: Path, version: str, data: dict) -> None:
+        if self.db is None:
+            return
+        st = path.stat()
+        self.memory[(namespace, path.as_posix())] = (st.st_size, st.st_mtime_ns, version, data)
+        self.db.execute(
+            "INSERT OR REPLACE INTO entries (namespace, path, size, mtime_ns, sha256, version, data)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                namespace,
+                path.as_posix(),
+                st.st_size,
+                st.st_mtime_ns,
+                hashlib.sha256(path.read_bytes()).hexdigest(),
+                version,
+                json.dumps(data, ensure_ascii=False),
+            ),
+        )
+
+    def lookup(self, namespace: str, path: Path, version: str, extract: Callable[[Path], dict | None]) -> dict | None:
+        profile = build_profile.current()
+        data = self.get(namespace, path, version)
+        if data is not None:
+            self.hits += 1
+            profile.cached()
+            return data
+
+        self.misses += 1
+        if profile.enabled:
+            data = profile.parsed(path, *build_profile.TimedExtract(extract)(path))
+        else:
+            data = extract(path)
+        # Failed extractions are not stored so their errors show up on every run.
+        if data is not None:
+            self.put(namespace, path, version, data)
+        return data
+
+
+@contextmanager
+def shared_cache(cache: MetadataCache | None, use_cache: bool = True) -> Iterator[MetadataCache]:
+    """Use the caller's cache if there is one, otherwise open (and close) our own."""
+    if cache is not None:
+        yield cache
+        cache.commit()
+        return
+    with MetadataCache(CACHE_FILE if use_cache else None) as own:
+        yield own
+
+
+def extract_paths(extract: Callable[[Path], dict | None], paths: list[Path], jobs: int = 1) -> list[dict | None]:
+    """extract(path) for every path, in order, on a process pool if jobs > 1; reported to the build profile."""
+    profile = build_profile.current()
+    task = build_profile.TimedExtract(extract) if profile.enabled else extract
+    jobs = resolve_jobs(jobs)
+    if jobs > 1 and len(paths) > 1:
+        # A few chunks per worker keeps IPC overhead low while still
+        # balancing uneven file sizes across the pool.
+        chunksize = max(1, len(paths) // (jobs * 4))
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            extracted = list(pool.map(task, paths, chunksize=chunksize))
+    else:
+        extracted = [task(path) for path in paths]
+    if profile.enabled:
+        extracted = [profile.parsed(path, *outcome) for path, outcome in zip(paths, extracted)]
+    return extracted
+
+
+def resolve_jobs(jobs: int) -> int:
+    """0 means one worker per CPU."""
+    if jobs <= 0:
+        return os.cpu_count() or 1
+    return jobs
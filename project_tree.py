@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Find the project entry points under projects/ with as few system calls as possible.
+
+An entry point is the first index.html on a branch of the tree (below
+projects/ itself); nothing underneath it is looked at. walk() lists each
+folder with os.scandir, whose entries carry the file type from the directory
+read, so telling folders from files costs no stat calls, and checks a
+subfolder for index.html with a single stat. Folders named in IGNORE_DIRS
+(media and asset trees such as CyberQuest/assets or the archief's images) and
+hidden folders are never entered.
+
+A listing snapshot from the previous walk (SNAPSHOT_FILE) is reused for every
+folder whose mtime has not changed: adding, removing or renaming an entry
+changes its folder's mtime, so an unchanged folder has the same subfolders and
+index.html as before and only needs one stat instead of a listing.
+
+Run this file to time a walk of projects/ with and without the snapshot.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+PROJECTS_DIR = Path("projects")
+SNAPSHOT_FILE = Path(".project-tree.json")
+SNAPSHOT_VERSION = 1
+
+IGNORE_DIRS = frozenset({
+    "assets", "images", "img", "media", "audio", "video", "fonts", "node_modules", "__pycache__",
+})
+
+
+@dataclass
+class Walk:
+    entry_points: list[Path] = field(default_factory=list)
+    # Every folder walked through, entry point folders included
+    folders: list[Path] = field(default_factory=list)
+    listed: int = 0
+    reused: int = 0
+
+
+def ignored(name: str, ignore: frozenset[str] = IGNORE_DIRS) -> bool:
+    return name.startswith(".") or name in ignore
+
+
+def list_folder(folder: str, ignore: frozenset[str]) -> list[str]:
+    """Names of the subfolders of folder that may hold entry points, sorted."""
+    with os.scandir(folder) as entries:
+        return sorted(
+            entry.name for entry in entries
+            if not ignored(entry.name, ignore) and entry.is_dir(follow_symlinks=False)
+        )
+
+
+def walk(
+    root: Path = PROJECTS_DIR,
+    ignore: frozenset[str] = IGNORE_DIRS,
+    snapshot: dict[str, list] | None = None,
+) -> Walk:
+    """Entry points under root, in sorted order.
+
+    snapshot maps a folder to [mtime_ns, has index.html, subfolders]; entries
+    still valid are reused and the rest are replaced, so the same dict can be
+    saved for the next walk.
+    """
+    result = Walk()
+    previous = dict(snapshot) if snapshot is not None else {}
+    if snapshot is not None:
+        snapshot.clear()
+
+    def visit(folder: str, is_root: bool) -> None:
+        try:
+            mtime_ns = os.stat(folder).st_mtime_ns
+        except OSError:
+            return
+        known = previous.get(folder)
+        if known and known[0] == mtime_ns:
+            _mtime, has_index, subfolders = known
+            result.reused += 1
+        else:
+            has_index = not is_root and os.path.isfile(os.path.join(folder, "index.html"))
+            subfolders = [] if has_index else list_folder(folder, ignore)
+            result.listed += 1
+        if snapshot is not None:
+            snapshot[folder] = [mtime_ns, has_index, subfolders]
+        result.folders.append(Path(folder))
+        if has_index:
+            result.entry_points.append(Path(folder) / "index.html")
+            return
+        for name in subfolders:
+            visit(os.path.join(folder, name), False)
+
+    if root.is_dir():
+        visit(os.fspath(root), True)
+    return result
+
+
+def load_snapshot(path: Path = SNAPSHOT_FILE, ignore: frozenset[str] = IGNORE_DIRS) -> dict[str, list]:
+    """The saved listings, or nothing if they were made with other ignore rules."""
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if data.get("version") != SNAPSHOT_VERSION or data.get("ignore") != sorted(ignore):
+        return {}
+    return data.get("folders", {})
+
+
+def save_snapshot(snapshot: dict[str, list], path: Path = SNAPSHOT_FILE, ignore: frozenset[str] = IGNORE_DIRS) -> None:
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(json.dumps({
+        "version": SNAPSHOT_VERSION,
+        "ignore": sorted(ignore),
+        "folders": snapshot,
+    }), encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def entry_points(root: Path = PROJECTS_DIR, use_snapshot: bool = True) -> list[Path]:
+    """walk(root).entry_points, reusing and updating SNAPSHOT_FILE unless use_snapshot is False."""
+    if not use_snapshot:
+        return walk(root).entry_points
+    snapshot = load_snapshot()
+    before = dict(snapshot)
+    found = walk(root, snapshot=snapshot).entry_points
+    if snapshot != before:
+        save_snapshot(snapshot)
+    return found
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Time a walk of the projects tree.")
+    parser.add_argument("root", nargs="?", type=Path, default=PROJECTS_DIR)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    cold = walk(args.root)
+    cold_s = time.perf_counter() - started
+    snapshot: dict[str, list] = {}
+    walk(args.root, snapshot=snapshot)
+    started = time.perf_counter()
+    warm = walk(args.root, snapshot=snapshot)
+    warm_s = time.perf_counter() - started
+    print(f"{len(cold.entry_points)} entry points in {len(cold.folders)} folders")
+    print(f"  without snapshot {cold_s * 1000:8.2f} ms ({cold.listed} listed)")
+    print(f"  with snapshot    {warm_s * 1000:8.2f} ms ({warm.listed} listed, {warm.reused} reused)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+"Related articles" for the archief, precomputed at build time.
+
+Every article becomes a TF-IDF vector over the weighted terms the search index
+already extracts (search_index.document_terms, so nothing is parsed twice):
+sublinear term frequency times inverse document frequency, L2-normalised.
+Terms in only one article cannot link two articles and terms in more than
+a tenth of them (MAX_DF) say little about either, so both are left out. The top
+TOP_K neighbours by cosine similarity are written as a small JSON sidecar
+per article, related/<article>.json, which an article page can fetch.
+
+With NumPy and SciPy installed the similarities are sparse matrix products,
+done BLOCK_CELLS at a time: a block of rows is multiplied with the whole
+matrix, its neighbours are picked and the block is dropped, so memory grows
+with the number of articles rather than with its square. Without them the
+scores are accumulated per article over an inverted index.
+
+Run this file to print the neighbours of the current archief articles.
+"""
+
+from __future__ import annotations
+
+import argparse
+import heapq
+import json
+import math
+import os
+from collections import Counter
+from pathlib import Path
+
+import build_profile
+
+try:
+    import numpy as np
+    from scipy import sparse
+except ImportError:
+    np = None
+    sparse = None
+
+TOP_K = 5
+MIN_SIMILARITY = 0.05
+MAX_DF = 0.1
+
+# The pure-Python scoring only follows the MAX_POSTINGS highest-weighted
+# articles of each term. Below MAX_POSTINGS / MAX_DF articles no term has
+# more, so the result is exact; above that it is a close approximation.
+MAX_POSTINGS = 256
+
+# Upper bound on the cells of one block of the similarity matrix
+# (block rows x articles), about 32 MB of float32 scores and int32 indices.
+BLOCK_CELLS = 1 << 22
+
+
+def tfidf_vectors(terms: list[Counter]) -> list[dict[int, float]]:
+    """Sparse unit vectors, term id -> weight, for each document's term counts."""
+    count = len(terms)
+    df = Counter(term for weights in terms for term in weights)
+    vocabulary = {}
+    for term, n in sorted(df.items()):
+        if 2 <= n <= max(2, MAX_DF * count):
+            vocabulary[term] = (len(vocabulary), math.log(count / n) + 1.0)
+
+    vectors = []
+    for weights in terms:
+        vector = {}
+        for term, tf in weights.items():
+            if term in vocabulary:
+                term_id, idf = vocabulary[term]
+                vector[term_id] = (1.0 + math.log(tf)) * idf
+        norm = math.sqrt(sum(w * w for w in vector.values())) or 1.0
+        vectors.append({term_id: w / norm for term_id, w in vector.items()})
+    return vectors
+
+
+def top_k(scores, k: int) -> list[tuple[int, float]]:
+    """The k best (document, score) pairs above MIN_SIMILARITY, ties broken by document order."""
+    return heapq.nsmallest(
+        k,
+        ((doc_id, score) for doc_id, score in scores if score >= MIN_SIMILARITY),
+        key=lambda item: (-item[1], item[0]),
+    )
+
+
+def neighbours_numpy(vectors: list[dict[int, float]], k: int) -> list[list[tuple[int, float]]]:
+    count = len(vectors)
+    indptr = np.zeros(count + 1, dtype=np.int64)
+    indptr[1:] = np.cumsum([len(vector) for vector in vectors])
+    indices = np.fromiter((t for vector in vectors for t in vector), dtype=np.int32, count=indptr[-1])
+    data = np.fromiter((w for vector in vectors for w in vector.values()), dtype=np.float32, count=indptr[-1])
+    width = int(indices.max()) + 1 if len(indices) else 0
+    matrix = sparse.csr_matrix((data, indices, indptr), shape=(count, width))
+    transposed = matrix.T.tocsc()
+
+    result = []
+    rows = max(1, BLOCK_CELLS // max(count, 1))
+    for start in range(0, count, rows):
+        block = (matrix[start:start + rows] @ transposed).tocsr()
+        for r in range(block.shape[0]):
+            cols = block.indices[block.indptr[r]:block.indptr[r + 1]]
+            vals = block.data[block.indptr[r]:block.indptr[r + 1]]
+            keep = (cols != start + r) & (vals >= MIN_SIMILARITY)
+            cols, vals = cols[keep], vals[keep]
+            if len(vals) > 4 * k:
+                # Narrow down before the exact (score, order) sort below.
+                best = np.argpartition(-vals, 4 * k)[:4 * k]
+                cols, vals = cols[best], vals[best]
+            result.append(top_k(zip(cols.tolist(), vals.tolist()), k))
+    return result
+
+
+def neighbours_python(vectors: list[dict[int, float]], k: int) -> list[list[tuple[int, float]]]:
+    postings: dict[int, list[tuple[int, float]]] = {}
+    for doc_id, vector in enumerate(vectors):
+        for term_id, weight in vector.items():
+            postings.setdefault(term_id, []).append((doc_id, weight))
+    for term_id, posting in postings.items():
+        if len(posting) > MAX_POSTINGS:
+            posting.sort(key=lambda item: -item[1])
+            del posting[MAX_POSTINGS:]
+
+    result = []
+    for doc_id, vector in enumerate(vectors):
+        scores: dict[int, float] = {}
+        for term_id, weight in vector.items():
+            for other, other_weight in postings[term_id]:
+                scores[other] = scores.get(other, 0.0) + weight * other_weight
+        scores.pop(doc_id, None)
+        result.append(top_k(scores.items(), k))
+    return result
+
+
+def neighbours(terms: list[Counter], k: int = TOP_K, use_numpy: bool = True) -> list[list[tuple[int, float]]]:
+    """For each document, its k most similar others as (index, cosine similarity), best first."""
+    vectors = tfidf_vectors(terms)
+    if use_numpy and np is not None:
+        return neighbours_numpy(vectors, k)
+    return neighbours_python(vectors, k)
+
+
+def write_sidecars(folder: Path, documents: list[dict], related: list[list[tuple[int, float]]]) -> int:
+    """Write folder/<article>.json for every document (href, title, date); returns the number changed.
+
+    Unchanged sidecars are not rewritten, and sidecars of documents that are
+    gone are removed.
+    """
+    folder.mkdir(parents=True, exist_ok=True)
+    profile = build_profile.current()
+    written = set()
+    changed = 0
+    for document, hits in zip(documents, related):
+        path = folder / f"{Path(document['href']).stem}.json"
+        written.add(path.name)
+        content = json.dumps([
+            {
+                "href": documents[doc_id]["href"],
+                "title": documents[doc_id]["title"],
+                "date": documents[doc_id]["date"],
+                "score": round(score, 3),
+            }
+            for doc_id, score in hits
+        ], ensure_ascii=False, indent=1) + "\n"
+        try:
+            if path.read_text(encoding="utf-8") == content:
+                continue
+        except FileNotFoundError:
+            pass
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_text(content, encoding="utf-8")
+        os.replace(tmp_path, path)
+        profile.wrote(path)
+        changed += 1
+    for path in folder.glob("*.json"):
+        if path.name not in written:
+            path.unlink()
+    return changed
+
+
+def build(folder: Path, documents: list[dict], terms: list[Counter], k: int = TOP_K) -> int:
+    """Compute the neighbours of documents from their search terms and write the sidecars."""
+    with build_profile.current().phase("related"):
+        return write_sidecars(folder, documents, neighbours(terms, k))
+
+
+def main() -> None:
+    import generate_archief_index
+    import search_index
+    from metadata_cache import MetadataCache
+
+    parser = argparse.ArgumentParser(description="Print the related articles of the archief.")
+    parser.add_argument("-k", type=int, default=TOP_K, help="neighbours per article")
+    parser.add_argument("--python", action="store_true", help="use the pure-Python scoring even if NumPy is installed")
+    args = parser.parse_args()
+
+    with MetadataCache() as cache:
+        records = [record for record in generate_archief_index.ARTICLES.collect(cache) if record["archief"]]
+    records.sort(key=lambda record: record["archief"]["href"])
+    documents = [record["archief"] for record in records]
+    terms = search_index.document_terms(documents, [record["search"] for record in records])
+    for document, hits in zip(documents, neighbours(terms, args.k, use_numpy=not args.python)):
+        print(document["href"])
+        for doc_id, score in hits:
+            print(f"  {score:.3f}  {documents[doc_id]['href']}")
+
+
+if __name__ == "__main__":
+    main()
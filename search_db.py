@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+SQLite FTS5 full-text index behind serve.py's /search endpoint.
+
+Covers the blog posts and the archief articles. Title, date and teaser come
+from the generators' own extractors, through the metadata cache, so the hits
+read the same as the index pages. The body text comes from
+search_index.BodyText. A documents table remembers size, mtime and extractor
+version per file; refresh() only re-reads files whose entry differs and drops
+files that are gone, so keeping the index current costs a directory scan.
+
+Queries are AND queries with the last word as a prefix, ranked by bm25 with
+title and teaser weighted above the body, and return snippets with the matches
+wrapped in <mark>. The database runs in WAL mode so a refresh on one
+connection does not block searches on another; connections are per thread.
+
+Run this file to build or refresh the index, or to try a query.
+"""
+
+from __future__ import annotations
+
+import argparse
+import html
+import os
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+import generate_archief_index
+import generate_blog_index
+import search_index
+from metadata_cache import MetadataCache, extractor_version, shared_cache
+
+SEARCH_DB = Path(".search.sqlite")
+BLOG_DIR = Path("blog")
+ARCHIEF_DIR = Path(generate_archief_index.ARCHIEF_DIR)
+COLLECTIONS = {
+    "blog": (BLOG_DIR, {"index.html"}),
+    "archief": (ARCHIEF_DIR, {"index.html", "0-index.html"}),
+}
+MAX_RESULTS = 50
+SNIPPET_TOKENS = 16
+
+# bm25 has to score every match before it can sort, about 1.5 us a document.
+# Queries matching more documents than this (counted with a LIMITed probe,
+# which is cheap) return the newest-indexed hits instead, which stops after
+# `limit` rows.
+RANK_MAX_MATCHES = 5000
+
+# Column weights for bm25(): title, teaser, body
+RANK = "bm25(10.0, 4.0, 1.0)"
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS documents (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    collection TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    version TEXT NOT NULL,
+    href TEXT NOT NULL,
+    title TEXT NOT NULL,
+    date TEXT NOT NULL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS documents_fts USING fts5(
+    title, teaser, body,
+    tokenize = 'unicode61 remove_diacritics 2',
+    prefix = '2 3'
+);
+INSERT INTO documents_fts(documents_fts, rank) VALUES ('rank', '{RANK}');
+"""
+
+WORD = re.compile(r"\w+")
+MARK_START = "\x02"
+MARK_END = "\x03"
+
+
+def read_blog(path: Path, cache: MetadataCache) -> dict | None:
+    data = cache.lookup("blog", path, generate_blog_index.EXTRACTOR_VERSION, generate_blog_index.extract_post_data)
+    return data and {"title": data["title"], "date": data["date"], "teaser": data["teaser"]}
+
+
+def read_archief(path: Path, cache: MetadataCache) -> dict | None:
+    data = cache.lookup(
+        "archief", path, generate_archief_index.EXTRACTOR_VERSION, generate_archief_index.extract_article_metadata
+    )
+    return data and {"title": data["title"], "date": data["date"], "teaser": data["excerpt"]}
+
+
+READERS = {"blog": read_blog, "archief": read_archief}
+
+VERSION = extractor_version(
+    generate_blog_index.EXTRACTOR_VERSION,
+    generate_archief_index.EXTRACTOR_VERSION,
+    search_index.BodyText,
+    read_blog,
+    read_archief,
+)
+
+
+def source_files() -> dict[str, tuple[str, os.stat_result]]:
+    """path -> (collection, stat) for every document that belongs in the index."""
+    found = {}
+    for collection, (folder, exclude) in COLLECTIONS.items():
+        if not folder.is_dir():
+            continue
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                if entry.name.endswith(".html") and entry.name not in exclude and entry.is_file():
+                    found[(folder / entry.name).as_posix()] = (collection, entry.stat())
+    return found
+
+
+def query_words(query: str) -> list[str]:
+    """Words of query, lower-cased without accents as FTS5 stores them, stopwords dropped unless that leaves none."""
+    words = WORD.findall(search_index.fold(query))
+    return [word for word in words if word not in search_index.STOPWORDS] or words
+
+
+def match_expression(words: list[str]) -> str:
+    """All words must match; the last one may be the start of a word (if it is not a single letter)."""
+    terms = [f'"{word}"' for word in words]
+    if len(words[-1]) > 1:
+        terms[-1] += "*"
+    return " ".join(terms)
+
+
+def highlight(snippet: str) -> str:
+    return html.escape(snippet).replace(MARK_START, "<mark>").replace(MARK_END, "</mark>")
+
+
+class SearchDB:
+    def __init__(self, db_path: Path = SEARCH_DB):
+        self.db_path = db_path
+        self.local = threading.local()
+        self.refresh_lock = threading.Lock()
+        db = self.connection()
+        if db.execute("SELECT name FROM sqlite_master WHERE name = 'documents'").fetchone() is None:
+            db.executescript(SCHEMA)
+
+    def connection(self) -> sqlite3.Connection:
+        db = getattr(self.local, "db", None)
+        if db is None:
+            db = sqlite3.connect(self.db_path)
+            db.execute("PRAGMA journal_mode = WAL")
+            db.execute("PRAGMA synchronous = NORMAL")
+            self.local.db = db
+        return db
+
+    def refresh(self, cache: MetadataCache | None = None) -> tuple[int, int]:
+        """Bring the index in line with the source files; returns (changed, removed)."""
+        with self.refresh_lock, shared_cache(cache) as cache:
+            db = self.connection()
+            files = source_files()
+            known = {
+                path: (size, mtime_ns, version, doc_id)
+                for doc_id, path, size, mtime_ns, version in db.execute(
+                    "SELECT id, path, size, mtime_ns, version FROM documents"
+                )
+            }
+            changed = [
+                path for path, (_collection, st) in files.items()
+                if known.get(path, ())[:3] != (st.st_size, st.st_mtime_ns, VERSION)
+            ]
+            removed = [known[path][3] for path in known if path not in files]
+            if not changed and not removed:
+                return 0, 0
+
+            with db:
+                for doc_id in removed:
+                    self.delete(db, doc_id)
+                for path in changed:
+                    if path in known:
+                        self.delete(db, known[path][3])
+                    collection, st = files[path]
+                    self.insert(db, collection, Path(path), st, cache)
+            return len(changed), len(removed)
+
+    @staticmethod
+    def delete(db: sqlite3.Connection, doc_id: int) -> None:
+        db.execute("DELETE FROM documents WHERE id = ?", (doc_id,))
+        db.execute("DELETE FROM documents_fts WHERE rowid = ?", (doc_id,))
+
+    @staticmethod
+    def insert(db: sqlite3.Connection, collection: str, path: Path, st: os.stat_result, cache: MetadataCache) -> None:
+        # A file the extractor fails on still gets a row (and no text), so it
+        # is not retried on every refresh until it changes.
+        try:
+            data = READERS[collection](path, cache)
+            body = search_index.BodyText().run(path).text() if data is not None else ""
+        except Exception as e:
+            print(f"  search index: skipped {path}: {e}")
+            data = None
+        cursor = db.execute(
+            "INSERT INTO documents (path, collection, size, mtime_ns, version, href, title, date)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (path.as_posix(), collection, st.st_size, st.st_mtime_ns, VERSION, "/" + path.as_posix(),
+             data["title"] if data else "", data["date"] if data else ""),
+        )
+        if data is None:
+            return
+        db.execute(
+            "INSERT INTO documents_fts (rowid, title, teaser, body) VALUES (?, ?, ?, ?)",
+            (cursor.lastrowid, data["title"], data["teaser"], body),
+        )
+
+    def search(self, query: str, limit: int = 20) -> dict:
+        started = time.perf_counter()
+        words = query_words(query)
+        hits = []
+        ranked = True
+        if words:
+            db = self.connection()
+            expression = match_expression(words)
+            matches = db.execute(
+                "SELECT count(*) FROM (SELECT 1 FROM documents_fts WHERE documents_fts MATCH ? LIMIT ?)",
+                (expression, RANK_MAX_MATCHES + 1),
+            ).fetchone()[0]
+            ranked = matches <= RANK_MAX_MATCHES
+            # rank is only selected when ranking: bm25 needs each term's
+            # document count, which means reading the whole posting list.
+            order = "rank" if ranked else "rowid DESC"
+            rows = db.execute(
+                f"SELECT rowid, snippet(documents_fts, -1, ?, ?, '…', {SNIPPET_TOKENS}), {'rank' if ranked else 'NULL'}"
+                f" FROM documents_fts WHERE documents_fts MATCH ? ORDER BY {order} LIMIT ?",
+                (MARK_START, MARK_END, expression, min(limit, MAX_RESULTS)),
+            ).fetchall()
+            for doc_id, snippet, rank in rows:
+                collection, href, title, date = db.execute(
+                    "SELECT collection, href, title, date FROM documents WHERE id = ?", (doc_id,)
+                ).fetchone()
+                hits.append({
+                    "collection": collection,
+                    "href": href,
+                    "title": title,
+                    "date": date,
+                    "snippet": highlight(snippet),
+                    "score": round(-rank, 3) if rank is not None else None,
+                })
+        return {
+            "query": query,
+            "ranked": ranked,
+            "hits": hits,
+            "ms": round((time.perf_counter() - started) * 1000, 2),
+        }
+
+    def keep_fresh(self, interval: float) -> threading.Thread:
+        """Refresh every interval seconds on a daemon thread."""
+        def loop() -> None:
+            with MetadataCache() as cache:
+                while True:
+                    time.sleep(interval)
+                    try:
+                        changed, removed = self.refresh(cache)
+                    except Exception as e:
+                        # Keep refreshing; the thread is the only one that does.
+                        print(f"  search index refresh failed: {e}")
+                        continue
+                    if changed or removed:
+                        print(f"  search index: {changed} updated, {removed} removed")
+
+        thread = threading.Thread(target=loop, name="search-refresh", daemon=True)
+        thread.start()
+        return thread
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Build or query the /search full-text index.")
+    parser.add_argument("query", nargs="*", help="search for this instead of only refreshing")
+    parser.add_argument("--db", type=Path, default=SEARCH_DB, help="index location")
+    args = parser.parse_args()
+
+    index = SearchDB(args.db)
+    started = time.perf_counter()
+    changed, removed = index.refresh()
+    print(f"Index {args.db}: {changed} updated, {removed} removed in {time.perf_counter() - started:.3f}s")
+    if args.query:
+        result = index.search(" ".join(args.query))
+        print(f"{len(result['hits'])} hit(s) in {result['ms']} ms")
+        for hit in result["hits"]:
+            score = f"{hit['score']:>7.3f}" if hit["score"] is not None else f"{'-':>7}"
+            print(f"  {score}  {hit['href']}\n           {hit['snippet']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,464 @@
+#!/usr/bin/env python3
+"""
+Build-time full-text search for the archief and blog index pages.
+
+build() turns a collection's documents (title, excerpt and the body terms
+BODY_TERMS extracts from the page itself) into an inverted index and publishes it as site_assets files:
+
+  search-<name>.<hash>.json          manifest: document count, shard hashes
+  search-<name>-<xy>.<hash>.json     terms starting with "xy" and their postings
+  search-<name>-docs-<k>.<hash>.json href/title/date of documents k*256...
+
+Terms in a shard are front coded (length of the prefix shared with the
+previous term, then the rest) and a posting list is flat (document id delta,
+weight) pairs. The page loads the manifest on first use and then only the
+shards for the prefixes of the query terms, plus the document shards of the
+hits it shows, so a search downloads a few KB whatever the size of the archive.
+
+Tokenization folds accents, drops common Dutch (and English) words and applies
+a light Dutch suffix stemmer. SCRIPT implements the same rules in the browser;
+tokenize() and its JavaScript version must stay in step.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import unicodedata
+from collections import Counter
+from functools import lru_cache
+from pathlib import Path
+
+import build_profile
+import site_assets
+import streaming_extract
+from collection import Extractor
+from metadata_cache import extractor_version
+from streaming_extract import StreamExtractor
+
+DOC_SHARD_SIZE = 256
+PREFIX_LENGTH = 2
+BODY_WEIGHT_CAP = 10
+TITLE_WEIGHT = 3
+EXCERPT_WEIGHT = 2
+
+STOPWORDS = frozenset("""
+aan al als bij dan dat de deze die dit door een en er geen had heb hebben heeft het hier hij hoe hun ik
+in is je kan kon maar me meer met mijn na naar niet nog nu of om ons onze ook op over te tot u uit van
+veel voor was wat we wel werd wie wij wordt worden zal ze zich zijn zo zonder
+the and for are was with this that from have not you your
+""".split())
+
+# Longest first; (suffix, replacement). A suffix is only removed when at least
+# three characters remain and, for the inflection endings, the stem does not
+# end in a vowel (so huis, radio and idee stay whole).
+SUFFIXES = (
+    ("heden", "heid"),
+    ("tjes", ""),
+    ("tje", ""),
+    ("jes", ""),
+    ("je", ""),
+    ("en", ""),
+    ("es", ""),
+    ("s", ""),
+    ("e", ""),
+)
+VOWELS = "aeiouy"
+INFLECTIONS = ("en", "es", "s", "e")
+
+WORD = re.compile(r"[a-z0-9]+")
+# Only the combining diacritics block, as the page's /[\u0300-\u036f]/
+COMBINING = re.compile("[\u0300-\u036f]")
+
+
+@lru_cache(maxsize=65536)
+def stem(word: str) -> str:
+    if len(word) <= 3 or word.isdigit():
+        return word
+    for suffix, replacement in SUFFIXES:
+        if not word.endswith(suffix) or len(word) - len(suffix) < 3:
+            continue
+        base = word[:-len(suffix)]
+        if suffix in INFLECTIONS and base[-1] in VOWELS:
+            continue
+        base += replacement
+        # robotten -> robott -> robot
+        if len(base) > 3 and base[-1] == base[-2] and base[-1] not in VOWELS:
+            base = base[:-1]
+        return base
+    return word
+
+
+def fold(text: str) -> str:
+    if text.isascii():
+        return text.lower()
+    return COMBINING.sub("", unicodedata.normalize("NFKD", text)).lower()
+
+
+def tokenize(text: str) -> list[str]:
+    return [stem(word) for word in WORD.findall(fold(text)) if len(word) > 1 and word not in STOPWORDS]
+
+
+class BodyText(StreamExtractor):
+    """All text of <article> when the page has one, of <body> otherwise"""
+
+    def __init__(self):
+        super().__init__()
+        self.body = None
+        self.articles = []
+
+    def open_element(self, element) -> None:
+        if element.name == "body" and self.body is None:
+            self.body = element.capture()
+        elif element.name == "article" and not self.inside("article"):
+            self.articles.append(element.capture())
+
+    def text(self) -> str:
+        if self.articles:
+            return " ".join(article.text(" ") for article in self.articles)
+        return self.body.text(" ") if self.body else ""
+
+
+def body_terms_from_stream(stream: BodyText, path: Path) -> dict:
+    return {"terms": Counter(tokenize(stream.text()))}
+
+
+def extract_body_terms(path: Path) -> dict:
+    return body_terms_from_stream(BodyText().run(path), path)
+
+
+EXTRACTOR_VERSION = extractor_version(
+    tuple(sorted(STOPWORDS)), SUFFIXES, stem.__wrapped__, fold, tokenize, streaming_extract, BodyText,
+    body_terms_from_stream, extract_body_terms,
+)
+
+# One of the extractors of the blog and archief collections, so the body terms come out
+# of the same pass over each file as its card metadata
+BODY_TERMS = Extractor("search", EXTRACTOR_VERSION, extract_body_terms, BodyText, body_terms_from_stream)
+
+
+def weigh(document: dict, body_terms: dict) -> Counter:
+    weights = Counter({term: min(count, BODY_WEIGHT_CAP) for term, count in body_terms.items()})
+    for term in tokenize(document["title"]):
+        weights[term] += TITLE_WEIGHT
+    for term in tokenize(document["excerpt"]):
+        weights[term] += EXCERPT_WEIGHT
+    return weights
+
+
+def front_code(terms: list[str]) -> list:
+    coded = []
+    previous = ""
+    for term in terms:
+        shared = 0
+        while shared < min(len(term), len(previous)) and term[shared] == previous[shared]:
+            shared += 1
+        coded += [shared, term[shared:]]
+        previous = term
+    return coded
+
+
+def delta_postings(postings: list[tuple[int, int]]) -> list[int]:
+    flat = []
+    previous = 0
+    for doc_id, weight in postings:
+        flat += [doc_id - previous, weight]
+        previous = doc_id
+    return flat
+
+
+def compact_json(data) -> str:
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
+def document_terms(documents: list[dict], bodies: list[dict | None]) -> list[Counter]:
+    """Weighted terms of each document (title, excerpt) and its BODY_TERMS result."""
+    return [weigh(document, (body or {}).get("terms", {})) for document, body in zip(documents, bodies)]
+
+
+def build(name: str, documents: list[dict], terms: list[Counter], root: Path = Path(".")) -> Path:
+    """Publish the index for documents (href, title, date) with their document_terms() and return its manifest.
+
+    Document ids are positions in documents, so pass them in display order.
+    """
+    with build_profile.current().phase("search"):
+        postings: dict[str, list[tuple[int, int]]] = {}
+        for doc_id, weights in enumerate(terms):
+            for term, weight in weights.items():
+                postings.setdefault(term, []).append((doc_id, weight))
+
+        by_prefix: dict[str, list[str]] = {}
+        for term in sorted(postings):
+            by_prefix.setdefault(term[:PREFIX_LENGTH], []).append(term)
+
+        published = []
+        term_shards = {}
+        for prefix, terms in by_prefix.items():
+            shard = site_assets.publish(f"search-{name}-{prefix}", ".json", compact_json({
+                "t": front_code(terms),
+                "p": [delta_postings(postings[term]) for term in terms],
+            }), root)
+            term_shards[prefix] = shard.name.split(".")[-2]
+            published.append(shard)
+
+        doc_shards = []
+        for k in range(0, len(documents), DOC_SHARD_SIZE):
+            shard = site_assets.publish(f"search-{name}-docs-{k // DOC_SHARD_SIZE}", ".json", compact_json([
+                [document["href"], document["title"], document["date"]]
+                for document in documents[k:k + DOC_SHARD_SIZE]
+            ]), root)
+            doc_shards.append(shard.name.split(".")[-2])
+            published.append(shard)
+
+        manifest = site_assets.publish(f"search-{name}", ".json", compact_json({
+            "name": f"search-{name}",
+            "n": len(documents),
+            "docSize": DOC_SHARD_SIZE,
+            "prefixLength": PREFIX_LENGTH,
+            "docs": doc_shards,
+            "terms": term_shards,
+        }), root)
+        site_assets.prune(f"search-{name}-", ".json", published, root)
+    return manifest
+
+
+def search_form(page: Path, manifest: Path, hide: str, root: Path = Path(".")) -> str:
+    """Search box for page; hide is a CSS selector for what the results replace."""
+    stylesheet = site_assets.stylesheet(page, "search", STYLESHEET, root)
+    script = site_assets.script(page, "search", SCRIPT, root)
+    index_href = site_assets.href(page, manifest)
+    return f"""{stylesheet}
+<form class="site-search" role="search" data-index="{index_href}" data-hide="{hide}" onsubmit="return false">
+    <input type="search" placeholder="Zoeken..." aria-label="Zoeken" autocomplete="off">
+    <p class="search-status" aria-live="polite"></p>
+    <ol class="search-results"></ol>
+</form>
+{script}"""
+
+
+STYLESHEET = """\
+.site-search {
+    max-width: 1400px;
+    margin: 0 auto 30px;
+}
+
+.site-search input {
+    width: 100%;
+    padding: 12px 16px;
+    font: inherit;
+    font-size: 1.1em;
+    border: 1px solid rgba(128, 128, 128, 0.5);
+    border-radius: 8px;
+    background: rgba(255, 255, 255, 0.9);
+    color: #1a1a1a;
+}
+
+.search-status {
+    margin: 8px 4px;
+    font-size: 0.9em;
+    opacity: 0.7;
+}
+
+.search-status:empty,
+.search-results:empty {
+    display: none;
+}
+
+.search-results {
+    list-style: none;
+    margin: 0;
+    padding: 0;
+}
+
+.search-results li {
+    padding: 10px 4px;
+    border-bottom: 1px solid rgba(128, 128, 128, 0.3);
+}
+
+.search-results a {
+    color: inherit;
+    font-weight: 600;
+}
+
+.search-results .search-date {
+    display: block;
+    font-size: 0.85em;
+    opacity: 0.7;
+}
+"""
+
+SCRIPT = """\
+(function () {
+    const form = document.querySelector('.site-search');
+    if (!form) return;
+    const input = form.querySelector('input');
+    const status = form.querySelector('.search-status');
+    const results = form.querySelector('.search-results');
+    const hidden = Array.from(document.querySelectorAll(form.dataset.hide));
+    const manifestUrl = new URL(form.dataset.index, document.baseURI);
+    const MAX_RESULTS = 20;
+
+    // Keep in step with search_index.py
+    const STOPWORDS = new Set(`STOPWORDS_PLACEHOLDER`.split(' '));
+    const SUFFIXES = SUFFIXES_PLACEHOLDER;
+    const INFLECTIONS = new Set(['en', 'es', 's', 'e']);
+    const VOWELS = 'aeiouy';
+
+    function stem(word) {
+        if (word.length <= 3 || /^[0-9]+$/.test(word)) return word;
+        for (const [suffix, replacement] of SUFFIXES) {
+            if (!word.endsWith(suffix) || word.length - suffix.length < 3) continue;
+            let base = word.slice(0, -suffix.length);
+            if (INFLECTIONS.has(suffix) && VOWELS.includes(base[base.length - 1])) continue;
+            base += replacement;
+            const last = base[base.length - 1];
+            if (base.length > 3 && last === base[base.length - 2] && !VOWELS.includes(last)) base = base.slice(0, -1);
+            return base;
+        }
+        return word;
+    }
+
+    function tokenize(text) {
+        const folded = text.normalize('NFKD').replace(/[\\u0300-\\u036f]/g, '').toLowerCase();
+        return (folded.match(/[a-z0-9]+/g) || [])
+            .filter(word => word.length > 1 && !STOPWORDS.has(word))
+            .map(stem);
+    }
+
+    const fetched = new Map();
+    function load(name) {
+        if (!fetched.has(name)) {
+            fetched.set(name, fetch(new URL(name, manifestUrl)).then(response => {
+                if (!response.ok) throw new Error(`${name}: ${response.status}`);
+                return response.json();
+            }));
+        }
+        return fetched.get(name);
+    }
+
+    let manifest = null;
+    const shards = new Map();
+
+    async function termShard(prefix) {
+        const hash = manifest.terms[prefix];
+        if (!hash) return null;
+        if (!shards.has(prefix)) {
+            const shard = await load(`${manifest.name}-${prefix}.${hash}.json`);
+            const terms = [];
+            let previous = '';
+            for (let k = 0; k < shard.t.length; k += 2) {
+                previous = previous.slice(0, shard.t[k]) + shard.t[k + 1];
+                terms.push(previous);
+            }
+            shards.set(prefix, {terms, postings: shard.p});
+        }
+        return shards.get(prefix);
+    }
+
+    // Document id -> score for one query token; the last token also matches as a prefix
+    async function match(token, asPrefix) {
+        const scores = new Map();
+        const shard = await termShard(token.slice(0, manifest.prefixLength));
+        if (!shard) return scores;
+        shard.terms.forEach((term, k) => {
+            if (term !== token && !(asPrefix && term.startsWith(token))) return;
+            const postings = shard.postings[k];
+            const idf = Math.log(1 + manifest.n / (postings.length / 2));
+            let doc = 0;
+            for (let p = 0; p < postings.length; p += 2) {
+                doc += postings[p];
+                scores.set(doc, Math.max(scores.get(doc) || 0, postings[p + 1] * idf));
+            }
+        });
+        return scores;
+    }
+
+    async function documents(ids) {
+        const found = [];
+        for (const id of ids) {
+            const k = Math.floor(id / manifest.docSize);
+            const shard = await load(`${manifest.name}-docs-${k}.${manifest.docs[k]}.json`);
+            found.push(shard[id % manifest.docSize]);
+        }
+        return found;
+    }
+
+    async function search(query) {
+        const started = performance.now();
+        manifest = manifest || await load(manifestUrl.href);
+        const tokens = tokenize(query).filter(token => token.length >= manifest.prefixLength);
+        if (tokens.length === 0) return null;
+
+        let total = null;
+        for (const [k, token] of tokens.entries()) {
+            const scores = await match(token, k === tokens.length - 1);
+            if (total === null) {
+                total = scores;
+            } else {
+                for (const [doc, score] of total) {
+                    if (scores.has(doc)) total.set(doc, score + scores.get(doc));
+                    else total.delete(doc);
+                }
+            }
+        }
+        const ranked = Array.from(total).sort((a, b) => b[1] - a[1] || a[0] - b[0]);
+        const hits = await documents(ranked.slice(0, MAX_RESULTS).map(([doc]) => doc));
+        return {count: ranked.length, hits, ms: performance.now() - started};
+    }
+
+    function escapeHtml(text) {
+        return String(text).replace(/[&<>"']/g, c => ({
+            '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#x27;'
+        })[c]);
+    }
+
+    function show(searching) {
+        hidden.forEach(element => {
+            if (searching && element.dataset.searchDisplay === undefined) {
+                element.dataset.searchDisplay = element.style.display;
+                element.style.display = 'none';
+            } else if (!searching && element.dataset.searchDisplay !== undefined) {
+                element.style.display = element.dataset.searchDisplay;
+                delete element.dataset.searchDisplay;
+            }
+        });
+    }
+
+    let latest = 0;
+    let timer = null;
+    async function update() {
+        const query = input.value.trim();
+        const ticket = ++latest;
+        if (!query) {
+            status.textContent = '';
+            results.innerHTML = '';
+            show(false);
+            return;
+        }
+        try {
+            const found = await search(query);
+            if (ticket !== latest) return;
+            show(true);
+            if (found === null) {
+                status.textContent = 'Typ minstens twee letters.';
+                results.innerHTML = '';
+                return;
+            }
+            status.textContent = `${found.count} resultaten (${found.ms.toFixed(0)} ms)`;
+            results.innerHTML = found.hits.map(([href, title, date]) =>
+                `<li><a href="${escapeHtml(href)}">${escapeHtml(title)}</a>` +
+                `<span class="search-date">${escapeHtml(date)}</span></li>`).join('');
+        } catch (error) {
+            console.error(error);
+            status.textContent = 'Zoeken mislukt.';
+        }
+    }
+
+    input.addEventListener('input', () => {
+        clearTimeout(timer);
+        timer = setTimeout(update, 120);
+    });
+})();
+""".replace("STOPWORDS_PLACEHOLDER", " ".join(sorted(STOPWORDS))).replace(
+    "SUFFIXES_PLACEHOLDER", json.dumps([list(pair) for pair in SUFFIXES])
+)
@@ -1,27 +1,577 @@
 #!/usr/bin/env python3
 """
 Simple HTTP server with proper UTF-8 encoding for markdown files
+
+Also answers /search?q=...&limit=... with JSON hits from the full-text index
+in search_db.py, which is refreshed in the background while the server runs.
+
+Connections are served concurrently by a bounded pool of worker threads and
+kept open between requests (HTTP/1.1), so a slow download no longer holds up
+everyone else. A kept-alive connection that goes quiet hands its worker back
+as soon as other connections are waiting for one. --sequential runs the old
+one-request-at-a-time HTTP/1.0 server instead, for comparison.
+
+Files are sent with a strong ETag (size and mtime) and Last-Modified, and
+If-None-Match / If-Modified-Since revalidations are answered with 304 Not
+Modified. Cache-Control comes from the --cache-policy rules, then from
+CACHE_POLICY, first matching pattern wins; in between, the content-hashed
+files site_assets publishes under assets/ are cached as immutable.
+
+Hot files are kept in memory with their headers (file_cache.FileCache,
+--cache-mb), checked against the file's mtime on every hit; the WARM_UP files
+are loaded at startup and /cache-stats shows the hit and miss counts.
+Larger files are read from disk and, from SENDFILE_THRESHOLD up, go out with
+socket.sendfile(), straight from the page cache to the socket.
+
+Range requests (audio seeking, resumed downloads) get 206 Partial Content:
+one range as is, several as multipart/byteranges, each part sent the same
+way as a whole file. If-Range falls back to the whole file when the client's
+copy is outdated, and a range past the end of the file gets 416.
 """
+import argparse
+import email.utils
+import fnmatch
+import glob
 import http.server
+import io
+import json
+import os
+import re
+import secrets
+import select
 import socketserver
 import mimetypes
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import timezone
+from urllib.parse import parse_qs, urlsplit
 
-class UTF8HTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
-    def end_headers(self):
-        # Set UTF-8 encoding for markdown and text files
-        if self.path.endswith('.md'):
-            self.send_header('Content-Type', 'text/plain; charset=utf-8')
-        elif self.path.endswith('.txt'):
-            self.send_header('Content-Type', 'text/plain; charset=utf-8')
-        http.server.SimpleHTTPRequestHandler.end_headers(self)
+import file_cache
+import site_assets
 
 PORT = 8080
+REFRESH_SECONDS = 5
+WORKERS = 32
+
+# How long an idle kept-alive connection may wait for its next request, and
+# how often it checks whether another connection needs its worker meanwhile.
+KEEP_ALIVE_SECONDS = 15
+IDLE_POLL_SECONDS = 0.05
+
+# A client that stops reading or sending halfway through is dropped after this.
+SOCKET_TIMEOUT_SECONDS = 60
+
+# Files read from disk from this size up are handed to the kernel with
+# sendfile() instead of being copied through Python in 64 KiB chunks.
+SENDFILE_THRESHOLD = 256 * 1024
+COPY_CHUNK = 64 * 1024
+
+# A Range header asking for more ranges than this is ignored (whole file sent).
+MAX_RANGES = 32
+RANGE_SPEC = re.compile(r'(\d*)\s*-\s*(\d*)', re.ASCII)
+
+# (pattern, Cache-Control) for files, matched with fnmatch against the path
+# relative to the served folder, ignoring case; --cache-policy rules and the
+# fingerprinted assets (IMMUTABLE) are checked before these.
+IMMUTABLE = 'public, max-age=31536000, immutable'
+MEDIA = 'public, max-age=86400'
+CACHE_POLICY = [
+    *((pattern, MEDIA) for pattern in (
+        '*.jpg', '*.jpeg', '*.png', '*.gif', '*.webp', '*.svg', '*.ico',
+        '*.mp3', '*.ogg', '*.wav', '*.mid', '*.mp4', '*.webm',
+        '*.woff', '*.woff2', '*.ttf', '*.pdf',
+    )),
+    # Pages, data and unhashed CSS/JS are revalidated on every use, which is
+    # a 304 without a body when they are unchanged.
+    ('*', 'no-cache'),
+]
+
+# Preloaded into the file cache at startup, relative to the served folder
+WARM_UP = (
+    'index.html',
+    'blog/index.html',
+    'projects/CyberQuest/index.html',
+    'projects/CyberQuest/engine/**/*.js',
+    'projects/CyberQuest/engine/*.css',
+)
+
+search = None
+
+
+def load_cache_policy(path):
+    """[[pattern, Cache-Control], ...] from a JSON file."""
+    with open(path, encoding='utf-8') as f:
+        return [(pattern, value) for pattern, value in json.load(f)]
+
+
+def entity_tag(size, mtime_ns):
+    return f'"{size:x}-{mtime_ns:x}"'
+
+
+def byte_ranges(header, size):
+    """(start, end) pairs, end inclusive, asked for by a Range header on a file of size bytes.
+
+    None means the header is to be ignored (not bytes, malformed, too many
+    ranges) and the whole file sent; an empty list means no range overlaps
+    the file (416). Overlapping or adjacent ranges are merged.
+    """
+    unit, _, spec = header.partition('=')
+    if unit.strip().lower() != 'bytes':
+        return None
+    specs = [part.strip() for part in spec.split(',') if part.strip()]
+    if not specs or len(specs) > MAX_RANGES:
+        return None
+    ranges = []
+    for part in specs:
+        match = RANGE_SPEC.fullmatch(part)
+        if match is None or match.group(1) == match.group(2) == '':
+            return None
+        first, last = match.groups()
+        if first:
+            start = int(first)
+            end = int(last) if last else size - 1
+            if last and end < start:
+                return None
+            if start < size:
+                ranges.append((start, min(end, size - 1)))
+        elif int(last) > 0 and size > 0:
+            # A suffix of an empty file is unsatisfiable.
+            ranges.append((max(0, size - int(last)), size - 1))
+
+    ordered = sorted(ranges)
+    if any(start <= previous_end + 1 for (_, previous_end), (start, _) in zip(ordered, ordered[1:])):
+        merged = [ordered[0]]
+        for start, end in ordered[1:]:
+            if start <= merged[-1][1] + 1:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+            else:
+                merged.append((start, end))
+        return merged
+    return ranges
+
+
+@dataclass(frozen=True)
+class StaticFile:
+    """A file's response headers, worked out once per version of the file."""
+
+    size: int
+    mtime: float
+    etag: str
+    content_type: str
+    # Content-type, Content-Length, Accept-Ranges and the validators, for a 200
+    headers: tuple
+    # ETag, Last-Modified and Cache-Control, for a 304
+    validators: tuple
+    # The content if the file cache keeps it in memory, else None
+    body: bytes | None
+
+
+class UTF8HTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # Set UTF-8 encoding for markdown and text files
+    extensions_map = {
+        **http.server.SimpleHTTPRequestHandler.extensions_map,
+        '.md': 'text/plain; charset=utf-8',
+        '.txt': 'text/plain; charset=utf-8',
+    }
+    custom_cache_policy = []
+    cache_policy = CACHE_POLICY
+    sendfile_threshold = SENDFILE_THRESHOLD
+    timeout = SOCKET_TIMEOUT_SECONDS
+    # Headers and body go out in separate writes; with Nagle on, the body of
+    # a small response on a kept-alive connection waits out a delayed ACK.
+    disable_nagle_algorithm = True
+
+    def handle(self):
+        self.close_connection = True
+        self.handle_one_request()
+        while not self.close_connection and self.wait_for_request():
+            self.handle_one_request()
+
+    def wait_for_request(self):
+        """True once the next request arrives; False on keep-alive timeout or when the worker is needed elsewhere."""
+        if self.buffered():
+            return True
+        deadline = time.monotonic() + KEEP_ALIVE_SECONDS
+        while (left := deadline - time.monotonic()) > 0:
+            readable, _, _ = select.select([self.connection], [], [], min(left, IDLE_POLL_SECONDS))
+            if readable:
+                return True
+            if getattr(self.server, 'waiting', 0):
+                return False
+        return False
+
+    def buffered(self):
+        """True if a pipelined request is already read into rfile's buffer."""
+        self.connection.settimeout(0)
+        try:
+            return bool(self.rfile.peek(1))
+        except OSError:
+            return False
+        finally:
+            self.connection.settimeout(self.timeout)
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        if url.path == '/search':
+            self.send_search(parse_qs(url.query))
+        elif url.path == '/cache-stats':
+            files = getattr(self.server, 'files', None)
+            if files is None:
+                self.send_json(404, {'error': 'no file cache'})
+            else:
+                self.send_json(200, files.stats())
+        else:
+            http.server.SimpleHTTPRequestHandler.do_GET(self)
+
+    def copyfile(self, source, outputfile):
+        if self.parts is None:
+            # Directory listings
+            http.server.SimpleHTTPRequestHandler.copyfile(self, source, outputfile)
+            return
+        for prefix, offset, count in self.parts:
+            outputfile.write(prefix)
+            self.send_slice(source, offset, count, outputfile)
+        outputfile.write(self.parts_end)
+
+    def send_slice(self, source, offset, count, outputfile):
+        if (self.sendfile_threshold is not None and count >= self.sendfile_threshold
+                and isinstance(source, io.BufferedReader)):
+            # Headers are already flushed: wfile is unbuffered.
+            self.connection.sendfile(source, offset, count)
+            return
+        source.seek(offset)
+        while count > 0:
+            chunk = source.read(min(count, COPY_CHUNK))
+            if not chunk:
+                break
+            outputfile.write(chunk)
+            count -= len(chunk)
+
+    def file_path(self):
+        """The file a GET or HEAD would send, or None for redirects, listings and bad paths."""
+        path = self.translate_path(self.path)
+        if os.path.isdir(path):
+            if not urlsplit(self.path).path.endswith('/'):
+                return None
+            for index in 'index.html', 'index.htm':
+                index = os.path.join(path, index)
+                if os.path.isfile(index):
+                    return index
+            return None
+        return None if path.endswith('/') else path
+
+    def send_head(self):
+        # What copyfile() sends of the file: (part header, offset, count)
+        # per part, then parts_end; None for anything but a file.
+        self.parts = None
+        self.parts_end = b''
+        path = self.file_path()
+        if path is None:
+            return http.server.SimpleHTTPRequestHandler.send_head(self)
+        try:
+            static, f = self.open_file(path)
+        except OSError:
+            self.send_error(404, 'File not found')
+            return None
+
+        try:
+            if self.not_modified(static.etag, static.mtime):
+                self.send_response(304)
+                for name, value in static.validators:
+                    self.send_header(name, value)
+                self.end_headers()
+                f.close()
+                return None
+            ranges = self.requested_ranges(static)
+            if ranges == []:
+                self.send_response(416)
+                self.send_header('Content-Range', f'bytes */{static.size}')
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                f.close()
+                return None
+            if ranges is None:
+                self.send_response(200)
+                for name, value in static.headers:
+                    self.send_header(name, value)
+                self.parts = [(b'', 0, static.size)]
+            else:
+                self.send_response(206)
+                self.send_partial_headers(static, ranges)
+            self.end_headers()
+            return f
+        except:
+            f.close()
+            raise
+
+    def requested_ranges(self, static):
+        """byte_ranges() of the Range header, or None if the whole file is to be sent."""
+        header = self.headers.get('Range')
+        if header is None or self.command != 'GET' or not self.range_current(static):
+            return None
+        return byte_ranges(header, static.size)
+
+    def range_current(self, static):
+        """True unless an If-Range names another version of the file than the one on disk."""
+        if_range = self.headers.get('If-Range')
+        if if_range is None:
+            return True
+        if_range = if_range.strip()
+        if if_range.startswith(('"', 'W/')):
+            # Only a strong entity tag can match.
+            return if_range == static.etag
+        try:
+            date = email.utils.parsedate_to_datetime(if_range)
+        except (TypeError, IndexError, OverflowError, ValueError):
+            return False
+        if date.tzinfo is None:
+            date = date.replace(tzinfo=timezone.utc)
+        return date.timestamp() == int(static.mtime)
+
+    def send_partial_headers(self, static, ranges):
+        if len(ranges) == 1:
+            start, end = ranges[0]
+            self.send_header('Content-type', static.content_type)
+            self.send_header('Content-Range', f'bytes {start}-{end}/{static.size}')
+            self.send_header('Content-Length', str(end - start + 1))
+            self.parts = [(b'', start, end - start + 1)]
+        else:
+            boundary = secrets.token_hex(16)
+            self.parts = [
+                (f'\r\n--{boundary}\r\nContent-Type: {static.content_type}\r\n'
+                 f'Content-Range: bytes {start}-{end}/{static.size}\r\n\r\n'.encode('latin-1'),
+                 start, end - start + 1)
+                for start, end in ranges
+            ]
+            self.parts_end = f'\r\n--{boundary}--\r\n'.encode('latin-1')
+            length = sum(len(prefix) + count for prefix, _, count in self.parts) + len(self.parts_end)
+            self.send_header('Content-type', f'multipart/byteranges; boundary={boundary}')
+            self.send_header('Content-Length', str(length))
+        for name, value in static.validators:
+            self.send_header(name, value)
+
+    def open_file(self, path):
+        """(StaticFile, file object with its body) for path, through the server's file cache if it has one."""
+        files = getattr(self.server, 'files', None)
+        static = files.get(path) if files is not None else None
+        if static is not None:
+            return static, io.BytesIO(static.body) if static.body is not None else open(path, 'rb')
+
+        f = open(path, 'rb')
+        try:
+            fs = os.fstat(f.fileno())
+            body = None
+            if files is not None and files.admits(fs.st_size):
+                body = f.read()
+                if len(body) != fs.st_size:
+                    # Changed while being read; send it, described by what
+                    # was read and the file's new mtime, but do not keep it.
+                    fs = os.fstat(f.fileno())
+                    f.close()
+                    return self.static_file(path, fs, body, self.directory), io.BytesIO(body)
+            static = self.static_file(path, fs, body, self.directory)
+        except:
+            f.close()
+            raise
+        if files is not None:
+            files.put(path, fs.st_size, fs.st_mtime_ns, static, len(body or b''))
+        if body is not None:
+            f.close()
+            return static, io.BytesIO(body)
+        return static, f
+
+    @classmethod
+    def static_file(cls, path, fs, body, directory):
+        """Headers and validators for path, from fs unless a body read from it says otherwise."""
+        size = len(body) if body is not None else fs.st_size
+        etag = entity_tag(size, fs.st_mtime_ns)
+        validators = (
+            ('ETag', etag),
+            ('Last-Modified', email.utils.formatdate(fs.st_mtime, usegmt=True)),
+            ('Cache-Control', cls.cache_control(path, directory)),
+        )
+        # guess_type() only looks at the class's extensions_map, so it can
+        # run before there is a request (see warm_up()).
+        content_type = http.server.SimpleHTTPRequestHandler.guess_type(cls, path)
+        headers = (
+            ('Content-type', content_type),
+            ('Content-Length', str(size)),
+            ('Accept-Ranges', 'bytes'),
+            *validators,
+        )
+        return StaticFile(size, fs.st_mtime, etag, content_type, headers, validators, body)
+
+    @classmethod
+    def cache_control(cls, path, directory):
+        relative = os.path.relpath(path, directory).replace(os.sep, '/').lower()
+        for pattern, value in cls.custom_cache_policy:
+            if fnmatch.fnmatchcase(relative, pattern.lower()):
+                return value
+        if (os.path.dirname(relative) == site_assets.ASSET_DIR.as_posix()
+                and site_assets.is_fingerprinted(os.path.basename(path))):
+            return IMMUTABLE
+        for pattern, value in cls.cache_policy:
+            if fnmatch.fnmatchcase(relative, pattern.lower()):
+                return value
+        return 'no-cache'
+
+    def not_modified(self, etag, mtime):
+        """True if the client's copy, named by If-None-Match or dated by If-Modified-Since, is current."""
+        if_none_match = self.headers.get('If-None-Match')
+        if if_none_match is not None:
+            # Weak comparison, as RFC 9110 prescribes for GET and HEAD
+            tags = [tag.strip().removeprefix('W/') for tag in if_none_match.split(',')]
+            return '*' in tags or etag in tags
+        if_modified_since = self.headers.get('If-Modified-Since')
+        if if_modified_since is None:
+            return False
+        try:
+            since = email.utils.parsedate_to_datetime(if_modified_since)
+        except (TypeError, IndexError, OverflowError, ValueError):
+            return False
+        if since.tzinfo is None:
+            # Obsolete date formats without a zone are in UTC
+            since = since.replace(tzinfo=timezone.utc)
+        return int(mtime) <= since.timestamp()
+
+    def send_search(self, params):
+        query = params.get('q', [''])[0].strip()
+        try:
+            limit = int(params.get('limit', ['20'])[0])
+        except ValueError:
+            limit = 0
+        if search is None:
+            self.send_json(503, {'error': 'search is disabled'})
+        elif not query or limit < 1:
+            self.send_json(400, {'error': 'expected ?q=<words> and an optional positive &limit='})
+        else:
+            self.send_json(200, search.search(query, limit))
+
+    def send_json(self, status, data):
+        body = json.dumps(data, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Cache-Control', 'no-store')
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class SequentialHTTPRequestHandler(UTF8HTTPRequestHandler):
+    """The handler as it was before the worker pool: HTTP/1.0, one request per connection."""
+
+    protocol_version = 'HTTP/1.0'
+    timeout = None
+    disable_nagle_algorithm = False
+    sendfile_threshold = None
+
+    def handle(self):
+        http.server.SimpleHTTPRequestHandler.handle(self)
+
+
+class PooledHTTPServer(http.server.HTTPServer):
+    """HTTPServer handing each connection to a bounded pool of worker threads."""
+
+    allow_reuse_address = True
+    request_queue_size = 128
+
+    def __init__(self, server_address, handler_class, workers=WORKERS, files=None):
+        super().__init__(server_address, handler_class)
+        self.pool = ThreadPoolExecutor(workers, thread_name_prefix='serve')
+        # FileCache of hot files, or None to read every file from disk
+        self.files = files
+        # Connections accepted but not yet picked up by a worker
+        self.waiting = 0
+        self.waiting_lock = threading.Lock()
+
+    def process_request(self, request, client_address):
+        with self.waiting_lock:
+            self.waiting += 1
+        self.pool.submit(self.process_request_thread, request, client_address)
+
+    def process_request_thread(self, request, client_address):
+        with self.waiting_lock:
+            self.waiting -= 1
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self):
+        super().server_close()
+        self.pool.shutdown(wait=False, cancel_futures=True)
+
+
+def warm_up(files, handler_class=UTF8HTTPRequestHandler, directory=None, patterns=WARM_UP):
+    """Load the files matching patterns into files, as their first request would; returns how many."""
+    directory = directory or os.getcwd()
+    loaded = 0
+    for pattern in patterns:
+        for path in glob.glob(os.path.join(directory, pattern), recursive=True):
+            try:
+                with open(path, 'rb') as f:
+                    fs = os.fstat(f.fileno())
+                    body = f.read() if files.admits(fs.st_size) else None
+            except OSError:
+                continue
+            if body is not None and len(body) != fs.st_size:
+                continue  # changing right now; its first request reads it
+            files.put(path, fs.st_size, fs.st_mtime_ns, handler_class.static_file(path, fs, body, directory),
+                      len(body or b''))
+            loaded += 1
+    return loaded
+
+
+def make_server(port=PORT, workers=WORKERS, sequential=False, cache_bytes=file_cache.MAX_BYTES):
+    if sequential:
+        socketserver.TCPServer.allow_reuse_address = True
+        return socketserver.TCPServer(("", port), SequentialHTTPRequestHandler)
+    files = file_cache.FileCache(cache_bytes) if cache_bytes else None
+    return PooledHTTPServer(("", port), UTF8HTTPRequestHandler, workers, files)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Serve the site on localhost.')
+    parser.add_argument('--port', type=int, default=PORT)
+    parser.add_argument('--workers', type=int, default=WORKERS, help='connections served at once')
+    parser.add_argument('--sequential', action='store_true', help='serve one request at a time over HTTP/1.0')
+    parser.add_argument('--no-search', action='store_true', help='do not build or serve the /search index')
+    parser.add_argument('--cache-policy', metavar='JSON',
+                        help='file with [pattern, Cache-Control] rules checked before the built-in ones')
+    parser.add_argument('--cache-mb', type=float, default=file_cache.MAX_BYTES / 2**20,
+                        help='memory for hot files, 0 to read every file from disk')
+    parser.add_argument('--no-warm-up', action='store_true', help='do not preload the WARM_UP files')
+    parser.add_argument('--sendfile-kb', type=float, default=SENDFILE_THRESHOLD / 1024,
+                        help='send files from this size up with sendfile()')
+    parser.add_argument('--no-sendfile', action='store_true', help='copy every file through Python')
+    args = parser.parse_args()
+
+    UTF8HTTPRequestHandler.sendfile_threshold = None if args.no_sendfile else int(args.sendfile_kb * 1024)
+
+    if args.cache_policy:
+        UTF8HTTPRequestHandler.custom_cache_policy = load_cache_policy(args.cache_policy)
+
+    if not args.no_search:
+        # search_db pulls in the generators and bs4; serving files needs neither.
+        from search_db import SearchDB
+        search = SearchDB()
+        changed, removed = search.refresh()
+        print(f"✓ Search index: {changed} updated, {removed} removed")
+        search.keep_fresh(REFRESH_SECONDS)
 
-socketserver.TCPServer.allow_reuse_address = True
-with socketserver.TCPServer(("", PORT), UTF8HTTPRequestHandler) as httpd:
-    print(f"✓ Server running at http://localhost:{PORT}/")
-    print("  Press Ctrl+C to stop")
-    try:
-        httpd.serve_forever()
-    except KeyboardInterrupt:
-        print("\n✓ Server stopped")
+    with make_server(args.port, args.workers, args.sequential, int(args.cache_mb * 2**20)) as httpd:
+        files = getattr(httpd, 'files', None)
+        if files is not None and not args.no_warm_up:
+            print(f"✓ File cache: {warm_up(files)} file(s) preloaded")
+        mode = 'sequential' if args.sequential else f'{args.workers} workers'
+        print(f"✓ Server running at http://localhost:{args.port}/ ({mode})")
+        print("  Press Ctrl+C to stop")
+        try:
+            httpd.serve_forever()
+        except KeyboardInterrupt:
+            print("\n✓ Server stopped")
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Shared, content-hashed CSS and JS files for the generated index pages.
+
+The generators used to inline their styles and scripts into every page they
+wrote. They now publish them with stylesheet()/script(): the text is written
+once to assets/<name>.<hash>.<ext>, where the hash is taken from the content,
+and the page only gets a <link> or <script src> to it. A file name therefore
+never changes meaning, so browsers (and serve.py) can cache assets as
+immutable, and regenerating an index with new cards leaves them untouched.
+Older versions of the same asset are removed when a new one is written.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import html
+import os
+from pathlib import Path
+
+import build_profile
+
+ASSET_DIR = Path("assets")
+HASH_LENGTH = 10
+
+# Every asset written or reused since the last reset(), so build_site can
+# record them in its manifest and rebuild a page whose assets went missing.
+published: list[Path] = []
+
+
+def reset() -> None:
+    published.clear()
+
+
+def content_hash(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()[:HASH_LENGTH]
+
+
+def is_fingerprinted(name: str) -> bool:
+    """True for names like blog.0123456789.css, as written by publish()."""
+    parts = name.split(".")
+    return (
+        len(parts) >= 3
+        and len(parts[-2]) == HASH_LENGTH
+        and all(c in "0123456789abcdef" for c in parts[-2])
+    )
+
+
+def publish(name: str, suffix: str, content: str, root: Path = Path(".")) -> Path:
+    data = content.encode("utf-8")
+    folder = root / ASSET_DIR
+    path = folder / f"{name}.{content_hash(data)}{suffix}"
+    if not path.exists():
+        folder.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+        build_profile.current().wrote(path)
+        for old in folder.glob(f"{name}.*{suffix}"):
+            if old != path and is_fingerprinted(old.name) and old.name.count(".") == path.name.count("."):
+                old.unlink()
+    published.append(path)
+    return path
+
+
+def prune(prefix: str, suffix: str, keep: list[Path], root: Path = Path(".")) -> None:
+    """Remove published files starting with prefix that are not in keep, e.g. shards no longer written."""
+    for path in (root / ASSET_DIR).glob(f"{prefix}*{suffix}"):
+        if path not in keep and is_fingerprinted(path.name):
+            path.unlink()
+
+
+def href(page: Path, asset: Path) -> str:
+    return Path(os.path.relpath(asset, page.parent)).as_posix()
+
+
+def stylesheet(page: Path, name: str, css: str, root: Path = Path(".")) -> str:
+    asset = publish(name, ".css", css, root)
+    return f'<link rel="stylesheet" href="{html.escape(href(page, asset))}">'
+
+
+def script(page: Path, name: str, js: str, root: Path = Path(".")) -> str:
+    asset = publish(name, ".js", js, root)
+    return f'<script src="{html.escape(href(page, asset))}"></script>'
@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+sitemap.xml for every public HTML page of the site, for search engines.
+
+public_pages() walks the tree with os.scandir, so files and folders are told
+apart from the directory read alone. Hidden folders and the media and asset
+folders project_tree ignores are skipped, and the pages come out one at a time
+in a stable order. Test harness pages some projects ship (folders in
+TEST_DIRS, files matching TEST_PAGES) are not public pages and are left out.
+
+A page's lastmod is the date of the last commit that touched it, as long as
+the file matches that commit; a page with uncommitted changes, or one git does
+not know, gets its mtime instead (a checkout gives every file the same fresh
+mtime, so mtimes alone say little). The commit dates come from one git log
+over all HTML files. They are cached per HEAD in LASTMOD_CACHE, and a cache
+from an ancestor of HEAD is brought up to date with a log of only the commits
+since.
+
+write_sitemap() streams the URLs to disk as they are found. Up to MAX_URLS
+URLs (and MAX_BYTES) they go into sitemap.xml itself; beyond that into
+sitemap-1.xml, sitemap-2.xml, ... with a sitemap index in sitemap.xml, the
+limits search engines put on a single file.
+
+Run this file to write sitemap.xml for the current tree.
+"""
+
+from __future__ import annotations
+
+import argparse
+import fnmatch
+import json
+import os
+import subprocess
+import time
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, Iterator
+from urllib.parse import quote
+from xml.sax.saxutils import escape
+
+import build_profile
+from project_tree import IGNORE_DIRS, ignored
+
+SITE_URL = "https://www.velt.org/"
+SITEMAP_FILE = "sitemap.xml"
+LASTMOD_CACHE = Path(".sitemap-lastmod.json")
+LASTMOD_CACHE_VERSION = 1
+
+# Test harnesses shipped with projects, such as CyberQuest/tests/test-runner.html
+TEST_DIRS = frozenset({"test", "tests"})
+TEST_PAGES = ("test-*.html", "test_*.html")
+
+MAX_URLS = 50_000
+MAX_BYTES = 50 * 1024 * 1024
+
+XMLNS = "http://www.sitemaps.org/schemas/sitemap/0.9"
+URLSET_START = f'<?xml version="1.0" encoding="UTF-8"?>\n<urlset xmlns="{XMLNS}">\n'.encode()
+URLSET_END = b"</urlset>\n"
+INDEX_START = f'<?xml version="1.0" encoding="UTF-8"?>\n<sitemapindex xmlns="{XMLNS}">\n'.encode()
+INDEX_END = b"</sitemapindex>\n"
+
+
+def public_pages(
+    root: Path = Path("."),
+    ignore: frozenset[str] = IGNORE_DIRS | TEST_DIRS,
+    exclude: tuple[str, ...] = TEST_PAGES,
+) -> Iterator[os.DirEntry]:
+    """Every .html file below root not matching exclude, folder by folder: files first, then subfolders."""
+    stack = [os.fspath(root)]
+    while stack:
+        folder = stack.pop()
+        try:
+            with os.scandir(folder) as scan:
+                entries = sorted(scan, key=lambda entry: entry.name)
+        except OSError:
+            continue
+        subfolders = []
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if not ignored(entry.name, ignore):
+                    subfolders.append(entry.path)
+            elif (
+                entry.name.endswith(".html")
+                and not any(fnmatch.fnmatchcase(entry.name, pattern) for pattern in exclude)
+                and entry.is_file()
+            ):
+                yield entry
+        stack.extend(reversed(subfolders))
+
+
+def page_url(path: str, site_url: str = SITE_URL) -> str:
+    """Absolute URL of a page given its path relative to the site root; index.html maps to its folder."""
+    if path == "index.html":
+        path = ""
+    elif path.endswith("/index.html"):
+        path = path[: -len("index.html")]
+    return site_url + quote(path)
+
+
+def git(root: Path, *args: str) -> str | None:
+    try:
+        result = subprocess.run(
+            ["git", *args], cwd=root, capture_output=True, text=True, encoding="utf-8", errors="surrogateescape"
+        )
+    except OSError:
+        return None
+    return result.stdout if result.returncode == 0 else None
+
+
+def commit_dates(root: Path, since: str | None = None) -> dict[str, int] | None:
+    """path -> commit time of the last commit touching each HTML file (after since, if given)."""
+    revisions = f"{since}..HEAD" if since else "HEAD"
+    output = git(root, "log", "--format=%x01%ct", "--name-only", "-z", "--relative", revisions, "--", "*.html")
+    if output is None:
+        return None
+    dates: dict[str, int] = {}
+    committed = 0
+    for token in output.split("\0"):
+        token = token.strip("\n")
+        if token.startswith("\x01"):
+            committed = int(token[1:])
+        elif token:
+            # Newest commits come first.
+            dates.setdefault(token, committed)
+    return dates
+
+
+@lru_cache(maxsize=None)
+def day(days: int) -> str:
+    """W3C date of the UTC day days after the epoch; most pages share a handful of days."""
+    return datetime.fromtimestamp(days * 86400, timezone.utc).date().isoformat()
+
+
+class Lastmod:
+    """lastmod dates for the pages under root, see the module docstring."""
+
+    def __init__(self, root: Path = Path("."), cache_path: Path | None = None):
+        self.root = root
+        self.cache_path = cache_path if cache_path is not None else root / LASTMOD_CACHE
+        self.dates: dict[str, int] = {}
+        self.modified: set[str] = set()
+        head = git(root, "rev-parse", "HEAD")
+        if head is None:
+            return
+        head = head.strip()
+        cached = self.load()
+        if cached.get("head") == head:
+            self.dates = cached["dates"]
+        else:
+            since = cached.get("head")
+            if since and git(root, "merge-base", "--is-ancestor", since, head) is not None:
+                newer = commit_dates(root, since)
+                if newer is not None:
+                    self.dates = {**cached["dates"], **newer}
+            else:
+                self.dates = commit_dates(root) or {}
+            self.save(head)
+        diff = git(root, "diff", "--name-only", "-z", "--relative", "HEAD", "--", "*.html")
+        self.modified = set(filter(None, (diff or "").split("\0")))
+
+    def load(self) -> dict:
+        try:
+            data = json.loads(self.cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        return data if data.get("version") == LASTMOD_CACHE_VERSION else {}
+
+    def save(self, head: str) -> None:
+        tmp_path = self.cache_path.with_name(self.cache_path.name + ".tmp")
+        try:
+            tmp_path.write_text(json.dumps({
+                "version": LASTMOD_CACHE_VERSION,
+                "head": head,
+                "dates": self.dates,
+            }), encoding="utf-8")
+            os.replace(tmp_path, self.cache_path)
+        except OSError:
+            pass
+
+    def date(self, path: str, entry: os.DirEntry) -> str:
+        timestamp = self.dates.get(path)
+        if timestamp is None or path in self.modified:
+            timestamp = entry.stat().st_mtime
+        return day(int(timestamp // 86400))
+
+
+def sitemap_entries(root: Path = Path("."), site_url: str = SITE_URL) -> Iterator[tuple[str, str]]:
+    """(loc, lastmod) for every public page under root."""
+    lastmod = Lastmod(root)
+    prefix = len(os.fspath(root)) + 1 if os.fspath(root) != "." else 2
+    for entry in public_pages(root):
+        path = entry.path[prefix:].replace(os.sep, "/")
+        yield page_url(path, site_url), lastmod.date(path, entry)
+
+
+def write_sitemap(
+    root: Path,
+    entries: Iterable[tuple[str, str]],
+    site_url: str = SITE_URL,
+    max_urls: int = MAX_URLS,
+    max_bytes: int = MAX_BYTES,
+) -> list[Path]:
+    """Stream (loc, lastmod) pairs into root/sitemap.xml, split under a sitemap index if needed.
+
+    Returns the files written. Each file is written under a temporary name and
+    moved into place when complete; leftover parts of an earlier, larger
+    sitemap are removed.
+    """
+    profile = build_profile.current()
+    parts: list[Path] = []
+    out = None
+    count = size = 0
+    try:
+        for loc, lastmod in entries:
+            line = f"<url><loc>{escape(loc)}</loc><lastmod>{lastmod}</lastmod></url>\n".encode()
+            if out is None or count == max_urls or size + len(line) + len(URLSET_END) > max_bytes:
+                if out is not None:
+                    out.write(URLSET_END)
+                    out.close()
+                parts.append(root / f"sitemap-{len(parts) + 1}.xml.tmp")
+                out = open(parts[-1], "wb")
+                out.write(URLSET_START)
+                count, size = 0, len(URLSET_START)
+            out.write(line)
+            count += 1
+            size += len(line)
+        if out is None:
+            parts.append(root / "sitemap-1.xml.tmp")
+            out = open(parts[-1], "wb")
+            out.write(URLSET_START)
+        out.write(URLSET_END)
+    finally:
+        if out is not None:
+            out.close()
+
+    sitemap = root / SITEMAP_FILE
+    if len(parts) == 1:
+        os.replace(parts[0], sitemap)
+        written = [sitemap]
+    else:
+        written = []
+        index_tmp = sitemap.with_name(sitemap.name + ".tmp")
+        with open(index_tmp, "wb") as index:
+            index.write(INDEX_START)
+            for part in parts:
+                path = part.with_suffix("")
+                os.replace(part, path)
+                written.append(path)
+                index.write(f"<sitemap><loc>{escape(site_url + path.name)}</loc></sitemap>\n".encode())
+            index.write(INDEX_END)
+        os.replace(index_tmp, sitemap)
+        written.append(sitemap)
+
+    number = len(parts) + 1 if len(parts) > 1 else 1
+    while (stale := root / f"sitemap-{number}.xml").exists():
+        stale.unlink()
+        number += 1
+    for path in written:
+        profile.wrote(path)
+    return written
+
+
+def generate(root: Path = Path("."), site_url: str = SITE_URL, max_urls: int = MAX_URLS) -> list[Path]:
+    """Walk root and write its sitemap.xml; returns the files written."""
+    with build_profile.current().phase("xml"):
+        return write_sitemap(root, sitemap_entries(root, site_url), site_url, max_urls)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Write sitemap.xml for every public HTML page.")
+    parser.add_argument("root", nargs="?", type=Path, default=Path("."))
+    parser.add_argument("--site-url", default=SITE_URL, help="URL the root is served at")
+    parser.add_argument("--max-urls", type=int, default=MAX_URLS, help="URLs per sitemap file")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    written = generate(args.root, args.site_url, args.max_urls)
+    print(f"Wrote {', '.join(path.name for path in written)} in {time.perf_counter() - started:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Streaming metadata extraction on top of html.parser.HTMLParser.
+
+A file is fed to the parser in chunks and no tree is built. Subclasses watch
+elements open and close, capture the text of the few elements they care about,
+and report when every field they need is known, at which point reading stops.
+Fields that depend on the whole document (such as media counts) are gathered in
+the same pass, and StreamGroup runs several extractors over one read of a file.
+
+Text is collected the way BeautifulSoup's html.parser builder does it: one
+string per run of character data between markup events, strings inside
+script/style/template/rt/rp left out, unmatched end tags ignored, and every
+element still open at the end of the file closed there. This keeps
+Element.text() equal to get_text(separator, strip=True) on a full tree.
+"""
+
+from __future__ import annotations
+
+from html.parser import HTMLParser
+from pathlib import Path
+
+# Elements that never have children, as in BeautifulSoup's HTML builders.
+VOID_ELEMENTS = frozenset({
+    "area", "base", "br", "col", "embed", "hr", "img", "input", "keygen", "link", "menuitem",
+    "meta", "param", "source", "track", "wbr", "basefont", "bgsound", "command", "frame",
+    "image", "isindex", "nextid", "spacer",
+})
+
+# Their strings are not NavigableStrings in BeautifulSoup, so get_text() skips them.
+NON_TEXT_ELEMENTS = frozenset({"script", "style", "template", "rt", "rp"})
+
+
+class Element:
+    __slots__ = ("name", "attrs", "classes", "strings", "closed")
+
+    def __init__(self, name: str, attrs: list[tuple[str, str | None]]):
+        self.name = name
+        # Duplicate attributes: the last one wins, missing values become "".
+        self.attrs = {key: value or "" for key, value in attrs}
+        self.classes = self.attrs.get("class", "").split()
+        self.strings: list[str] | None = None
+        self.closed = False
+
+    def capture(self) -> Element:
+        if self.strings is None:
+            self.strings = []
+        return self
+
+    def text(self, separator: str = "") -> str:
+        return separator.join(s for s in (string.strip() for string in self.strings or ()) if s)
+
+
+class StreamExtractor(HTMLParser):
+    CHUNK_SIZE = 16 * 1024
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.stack: list[Element] = []
+        self.capturing: list[Element] = []
+        self.pending: list[str] = []
+        self.non_text_depth = 0
+        self.chars_read = 0
+
+    # Hooks for subclasses. open_element() runs before the element is pushed,
+    # so self.stack holds exactly its ancestors.
+
+    def open_element(self, element: Element) -> None:
+        pass
+
+    def close_element(self, element: Element) -> None:
+        pass
+
+    def resolved(self) -> bool:
+        return False
+
+    def finish(self) -> None:
+        """Called once the whole file has been read and every element closed."""
+
+    def run(self, path: Path | str) -> StreamExtractor:
+        with open(path, "r", encoding="utf-8") as f:
+            while not self.resolved():
+                chunk = f.read(self.CHUNK_SIZE)
+                if not chunk:
+                    self.close()
+                    break
+                self.chars_read += len(chunk)
+                self.feed(chunk)
+        return self
+
+    def inside(self, name: str) -> bool:
+        return any(element.name == name for element in self.stack)
+
+    def inside_class(self, class_name: str) -> bool:
+        return any(class_name in element.classes for element in self.stack)
+
+    def close(self) -> None:
+        super().close()
+        self.flush_text()
+        while self.stack:
+            self.pop_element()
+        self.finish()
+
+    def flush_text(self) -> None:
+        if not self.pending:
+            return
+        text = "".join(self.pending)
+        self.pending.clear()
+        if self.non_text_depth:
+            return
+        for element in self.capturing:
+            element.strings.append(text)
+
+    def push_element(self, tag: str, attrs: list[tuple[str, str | None]]) -> Element:
+        element = Element(tag, attrs)
+        self.open_element(element)
+        self.stack.append(element)
+        if element.strings is not None:
+            self.capturing.append(element)
+        if tag in NON_TEXT_ELEMENTS:
+            self.non_text_depth += 1
+        return element
+
+    def pop_element(self) -> None:
+        element = self.stack.pop()
+        if element.name in NON_TEXT_ELEMENTS:
+            self.non_text_depth -= 1
+        if element.strings is not None:
+            self.capturing.remove(element)
+        element.closed = True
+        self.close_element(element)
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        self.flush_text()
+        self.push_element(tag, attrs)
+        if tag in VOID_ELEMENTS:
+            self.pop_element()
+
+    def handle_startendtag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        self.flush_text()
+        self.push_element(tag, attrs)
+        self.pop_element()
+
+    def handle_endtag(self, tag: str) -> None:
+        self.flush_text()
+        if not any(element.name == tag for element in self.stack):
+            return
+        while self.stack[-1].name != tag:
+            self.pop_element()
+        self.pop_element()
+
+    def handle_data(self, data: str) -> None:
+        self.pending.append(data)
+
+    def handle_comment(self, data: str) -> None:
+        self.flush_text()
+
+    def handle_decl(self, decl: str) -> None:
+        self.flush_text()
+
+    def handle_pi(self, data: str) -> None:
+        self.flush_text()
+
+    def unknown_decl(self, data: str) -> None:
+        self.flush_text()
+
+
+class StreamGroup(StreamExtractor):
+    """Run several extractors over a single pass of a file.
+
+    The parts share this parser's element stack, so their inside() checks and
+    captures work as if each had read the file itself. Reading stops once
+    every part is resolved.
+    """
+
+    def __init__(self, parts: list[StreamExtractor]):
+        super().__init__()
+        self.parts = parts
+        for part in parts:
+            part.stack = self.stack
+
+    def open_element(self, element: Element) -> None:
+        for part in self.parts:
+            part.open_element(element)
+
+    def close_element(self, element: Element) -> None:
+        for part in self.parts:
+            part.close_element(element)
+
+    def resolved(self) -> bool:
+        return all(part.resolved() for part in self.parts)
+
+    def finish(self) -> None:
+        for part in self.parts:
+            part.finish()
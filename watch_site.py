@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Watch the content folders and rebuild only the index a change belongs to.
+
+Uses inotify (through libc, no extra packages) where available and falls back
+to polling, which is cheap because build_site only stats unchanged inputs.
+Bursts of events, such as an editor's save-via-rename, are debounced into one
+rebuild. Parsed metadata is kept in one MetadataCache for the whole session,
+so a rebuild only parses the files that changed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import time
+import traceback
+from pathlib import Path
+
+import project_tree
+from build_site import MANIFEST_FILE, PROJECTS_DIR, TARGETS, build
+from metadata_cache import CACHE_FILE, MetadataCache
+
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF
+EVENT_HEADER = struct.Struct("iIII")
+
+DEBOUNCE_SECONDS = 0.08
+POLL_SECONDS = 0.5
+
+
+class Inotify:
+    def __init__(self):
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self.libc = libc
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.paths: dict[int, Path] = {}
+
+    def add_watch(self, folder: Path) -> None:
+        if folder in self.paths.values():
+            return
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(folder), WATCH_MASK)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {folder}")
+        self.paths[wd] = folder
+
+    def read(self, timeout: float | None) -> list[tuple[Path, int]] | None:
+        """Changed paths with their event masks; None means the queue overflowed."""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return []
+        buffer = os.read(self.fd, 64 * 1024)
+        events = []
+        offset = 0
+        while offset < len(buffer):
+            wd, mask, _cookie, length = EVENT_HEADER.unpack_from(buffer, offset)
+            offset += EVENT_HEADER.size
+            name = buffer[offset:offset + length].rstrip(b"\0")
+            offset += length
+            if mask & IN_Q_OVERFLOW:
+                return None
+            if mask & IN_IGNORED:
+                self.paths.pop(wd, None)
+                continue
+            folder = self.paths.get(wd)
+            if folder is not None:
+                events.append((folder / os.fsdecode(name) if name else folder, mask))
+        return events
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+def project_dirs(folder: Path = PROJECTS_DIR) -> list[Path]:
+    # Same traversal as the projects generator: stop below entry points.
+    return project_tree.walk(folder).folders
+
+
+def watched_dirs() -> list[Path]:
+    folders = {Path(".")}
+    for target in TARGETS:
+        for root in target.watch:
+            if root == PROJECTS_DIR:
+                folders.update(project_dirs())
+            elif root.is_dir():
+                folders.add(root)
+        folders.update(path.parent for path in target.presence if path.parent.is_dir())
+    return sorted(folders)
+
+
+def affected_targets(paths: set[Path]) -> list[str]:
+    outputs = {target.output for target in TARGETS} | {MANIFEST_FILE, CACHE_FILE}
+    changed = [path for path in paths if path not in outputs]
+    if not changed:
+        return []
+    names = []
+    for target in TARGETS:
+        inputs = set(target.inputs())
+        if any(target.affected_by(path, inputs) for path in changed):
+            names.append(target.name)
+    return names
+
+
+def rebuild(names: list[str] | None, cache: MetadataCache) -> None:
+    started = time.perf_counter()
+    try:
+        rebuilt = build(names, cache=cache, quiet=True)
+    except Exception:
+        # A half-saved file or a broken generator must not end the session;
+        # the target is retried on the next change.
+        traceback.print_exc()
+        print("  rebuild failed, still watching")
+        return
+    if rebuilt:
+        print(f"  rebuilt {', '.join(rebuilt)} in {time.perf_counter() - started:.3f}s")
+
+
+def watch_inotify(cache: MetadataCache) -> None:
+    inotify = Inotify()
+    try:
+        for folder in watched_dirs():
+            inotify.add_watch(folder)
+        print(f"Watching {len(inotify.paths)} folders with inotify (Ctrl+C to stop)")
+        while True:
+            events = inotify.read(None)
+            # Debounce: keep collecting until the folders have been quiet for a moment.
+            while events is not None:
+                more = inotify.read(DEBOUNCE_SECONDS)
+                if more is None:
+                    events = None
+                elif not more:
+                    break
+                else:
+                    events.extend(more)
+
+            if events is None:
+                rebuild(None, cache)
+            else:
+                names = affected_targets({path for path, _mask in events})
+                if names:
+                    rebuild(names, cache)
+            if events is None or any(mask & IN_ISDIR for _path, mask in events):
+                for folder in watched_dirs():
+                    inotify.add_watch(folder)
+    finally:
+        inotify.close()
+
+
+def watch_polling(cache: MetadataCache, interval: float) -> None:
+    print(f"Polling every {interval:.2f}s (Ctrl+C to stop)")
+    while True:
+        time.sleep(interval)
+        rebuild(None, cache)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Rebuild the affected site index whenever content changes.")
+    parser.add_argument("--poll", action="store_true", help="poll instead of using inotify")
+    parser.add_argument("--interval", type=float, default=POLL_SECONDS, help="polling interval in seconds")
+    args = parser.parse_args()
+
+    with MetadataCache() as cache:
+        build(cache=cache)
+        try:
+            if args.poll:
+                watch_polling(cache, args.interval)
+            else:
+                try:
+                    watch_inotify(cache)
+                except (OSError, AttributeError) as e:
+                    # AttributeError: libc without inotify_init1 (not Linux).
+                    print(f"inotify unavailable ({e}), falling back to polling")
+                    watch_polling(cache, args.interval)
+        except KeyboardInterrupt:
+            print("\n✓ Watch stopped")
+
+
+if __name__ == "__main__":
+    main()